@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+"""
+Benchmark Script untuk YouTube Comments Crawler
+===============================================
+
+Mengukur throughput crawler terhadap fake YouTube Data API lokal
+(fake_youtube_api.py), sehingga tidak ada quota sungguhan yang terpakai.
+Setiap mode dijalankan di subprocess terpisah agar peak RSS terukur
+per mode.
+
+Metrik per mode:
+- comments/sec (wall clock)
+- jumlah API calls dan retries
+- peak RSS (MB)
+- waktu kumulatif per tahap dari crawler.metrics (execute, json_parse,
+  process_comment_item, process_reply_item, sentiment, sink_write)
+- bytes diterima dan quota units
+
+Mode --transform mengukur rows/sec crawl lengkap (fetch, prefetch, transformasi
+pipelined) untuk beberapa jumlah transform worker (process pool).
+Mode --schema membandingkan DataFrame object (inferensi pandas) dengan skema
+bertipe (OUTPUT_SCHEMA): memori, waktu konversi, waktu tulis, dan ukuran file.
+
+Contoh:
+  python benchmark_crawler.py
+  python benchmark_crawler.py --videos 50 --latency 80 --error-rate 0.02 --json bench.json
+  python benchmark_crawler.py --baseline bench.json --tolerance 0.2
+  python benchmark_crawler.py --startup --startup-budget 0.3
+  python benchmark_crawler.py --transform --transform-workers 0,1,2,4 --videos 40 --latency 5
+  python benchmark_crawler.py --schema --transform-pages 500
+
+Author: Ferdian Bangkit Wijaya
+Institution: Universitas Sultan Ageng Tirtayasa (UNTIRTA)
+"""
+
+import os
+import io
+import sys
+import json
+import time
+import random
+import argparse
+import importlib.util
+import tempfile
+import subprocess
+from contextlib import redirect_stdout
+
+try:
+    import resource
+    HAS_RESOURCE = True
+except ImportError:
+    HAS_RESOURCE = False
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+MODES = {
+    'sequential': {'workers': 1, 'prefetch': False},
+    'prefetch': {'workers': 1, 'prefetch': True},
+    'concurrent': {'workers': 4, 'prefetch': True},
+}
+ALPHABET = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-'
+
+
+def benchmark_video_ids(count: int, seed: int = 42) -> list:
+    """Daftar video ID sintetis; termasuk video kosong dan komentar nonaktif"""
+    rng = random.Random(seed)
+    ids = [''.join(rng.choice(ALPHABET) for _ in range(11)) for _ in range(count)]
+    if count >= 4:
+        ids[1] = 'emptyVideo1'
+        ids[2] = 'nocomVideo1'
+    return ids
+
+
+def peak_rss_mb():
+    """Peak RSS proses saat ini dalam MB (None jika tidak tersedia)"""
+    if not HAS_RESOURCE:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux melaporkan KB, macOS melaporkan bytes
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def run_mode(mode: str, endpoint: str, video_ids: list, workers: int, max_comments: int) -> dict:
+    """Jalankan satu mode crawling (dipanggil di subprocess)"""
+    sys.path.insert(0, SCRIPT_DIR)
+    from youtube_comments_crawler import YouTubeCommentsCrawler
+
+    settings = dict(MODES[mode])
+    if mode == 'concurrent':
+        settings['workers'] = workers
+
+    crawler = YouTubeCommentsCrawler()
+    crawler.config['api']['endpoint'] = endpoint
+    crawler.config['api']['backoff'] = 0.05
+    crawler.config['delays'] = {'between_videos': 0, 'between_requests': 0}
+    crawler.config['max_comments_per_video'] = max_comments
+    crawler.config['scheduling']['workers'] = settings['workers']
+    crawler.config['pipeline']['prefetch'] = settings['prefetch']
+    crawler.config['output']['format'] = 'csv'
+    crawler.config['output']['save_config'] = False
+    crawler.config['metrics']['export'] = False
+    crawler.api_key = 'benchmark-key'
+    crawler.youtube_service = crawler.build_service(crawler.api_key)
+
+    urls = [f'https://www.youtube.com/watch?v={video_id}' for video_id in video_ids]
+    work_dir = tempfile.mkdtemp(prefix='yt_bench_')
+    os.chdir(work_dir)
+    started = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        crawler.start_crawling(urls)
+    wall = time.perf_counter() - started
+
+    rows = crawler.stats['total_comments']
+    stages = crawler.metrics.to_dict()['stages']
+    return {
+        'mode': mode,
+        'workers': settings['workers'],
+        'prefetch': settings['prefetch'],
+        'rows': rows,
+        'wall_seconds': round(wall, 3),
+        'comments_per_sec': round(rows / wall, 1) if wall else 0.0,
+        'api_calls': crawler.stats['api_calls'],
+        'retries': crawler.stats['retries'],
+        'errors': len(crawler.stats['errors']),
+        'bytes_received': crawler.metrics.counter('bytes_received'),
+        'quota_units': crawler.metrics.counter('quota_units'),
+        'peak_rss_mb': peak_rss_mb(),
+        'stage_seconds': {stage: round(data['total_seconds'], 3) for stage, data in sorted(stages.items())},
+    }
+
+
+def start_fake_server(args) -> tuple:
+    """Start fake_youtube_api.py sebagai subprocess, return (process, url)"""
+    command = [sys.executable, os.path.join(SCRIPT_DIR, 'fake_youtube_api.py'),
+               '--port', '0', '--latency', str(args.latency), '--jitter', str(args.jitter),
+               '--error-rate', str(args.error_rate), '--mean-comments', str(args.mean_comments)]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True, encoding='utf-8')
+    first_line = process.stdout.readline()
+    url = first_line.strip().rsplit(' ', 1)[-1]
+    if not url.startswith('http'):
+        process.kill()
+        raise RuntimeError(f"Fake server gagal start: {first_line}")
+    return process, url
+
+
+def measure_startup(runs: int) -> dict:
+    """Median waktu cold start CLI crawler (--version dan --help) dalam detik"""
+    script = os.path.join(SCRIPT_DIR, 'youtube_comments_crawler.py')
+    results = {}
+    for flag in ['--version', '--help']:
+        timings = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            subprocess.run([sys.executable, script, flag], capture_output=True)
+            timings.append(time.perf_counter() - started)
+        results[flag] = round(sorted(timings)[len(timings) // 2], 3)
+    return results
+
+
+def synthetic_pages(page_count: int, mean_comments: int) -> tuple:
+    """Halaman commentThreads sintetis (100 thread) dari FakeYouTubeData: (video_infos, [(video_id, items)])"""
+    sys.path.insert(0, SCRIPT_DIR)
+    from fake_youtube_api import FakeYouTubeData
+
+    data = FakeYouTubeData(mean_comments=mean_comments)
+    video_ids = benchmark_video_ids(max(1, page_count // 20))
+    video_infos = {video_id: data.video(video_id) for video_id in video_ids}
+    pages = [(video_ids[index % len(video_ids)],
+              [data.thread(video_ids[index % len(video_ids)], index * 100 + n, True) for n in range(100)])
+             for index in range(page_count)]
+    return video_infos, pages
+
+
+def measure_schema(page_count: int, mean_comments: int) -> list:
+    """Memori dan waktu DataFrame object vs bertipe, plus waktu tulis/baca ulang per format"""
+    sys.path.insert(0, SCRIPT_DIR)
+    from youtube_comments_crawler import YouTubeCommentsCrawler, MergeWriter
+    import pandas as pd
+
+    crawler = YouTubeCommentsCrawler()
+    crawler.config['attributes'].update(comment_id=True, sentiment_score=False)
+    video_infos, pages = synthetic_pages(page_count, mean_comments)
+    rows = []
+    for video_id, items in pages:
+        rows.extend(crawler.transform_items(items, video_infos[video_id], float('inf')))
+
+    work_dir = tempfile.mkdtemp(prefix='yt_schema_')
+    formats = ['csv', 'parquet'] if importlib.util.find_spec('pyarrow') else ['csv']
+    results = []
+    for label, typed in [('object', False), ('typed', True)]:
+        started = time.perf_counter()
+        df = crawler.build_dataframe(rows, typed=typed)
+        build = time.perf_counter() - started
+        result = {'schema': label, 'rows': len(df), 'build_seconds': round(build, 3),
+                  'memory_mb': round(df.memory_usage(deep=True).sum() / 2 ** 20, 1)}
+        for output_format in formats:
+            path = os.path.join(work_dir, f"{label}.{output_format}")
+            started = time.perf_counter()
+            writer = MergeWriter(path, list(df.columns))
+            writer.write(df.copy())
+            writer.close()
+            result[f'{output_format}_write_seconds'] = round(time.perf_counter() - started, 3)
+            result[f'{output_format}_mb'] = round(os.path.getsize(path) / 2 ** 20, 1)
+            started = time.perf_counter()
+            loaded = crawler.load_output(path) if typed else (pd.read_csv(path) if output_format == 'csv'
+                                                             else pd.read_parquet(path))
+            result[f'{output_format}_load_seconds'] = round(time.perf_counter() - started, 3)
+            result[f'{output_format}_load_mb'] = round(loaded.memory_usage(deep=True).sum() / 2 ** 20, 1)
+        results.append(result)
+    return results
+
+
+def measure_transform(worker_counts: list, endpoint: str, video_ids: list, max_comments: int) -> list:
+    """rows/sec crawl lengkap (start_crawling + prefetch) terhadap fake API untuk setiap jumlah transform worker
+
+    Halaman mengalir lewat jalur crawler sungguhan: fetch thread, antrean
+    prefetch, lalu beberapa halaman sekaligus di process pool. 0 worker =
+    transformasi di thread crawling. Waktu start process pool tidak ikut
+    diukur; metrik tahap worker (process_comment_item, sentiment, ...) sudah
+    digabung ke crawler.metrics.
+    """
+    from youtube_comments_crawler import YouTubeCommentsCrawler
+
+    urls = [f'https://www.youtube.com/watch?v={video_id}' for video_id in video_ids]
+    results = []
+    for workers in worker_counts:
+        crawler = YouTubeCommentsCrawler()
+        crawler.config['api']['endpoint'] = endpoint
+        crawler.config['api']['backoff'] = 0.05
+        crawler.config['delays'] = {'between_videos': 0, 'between_requests': 0}
+        crawler.config['max_comments_per_video'] = max_comments
+        crawler.config['pipeline'].update(prefetch=True, transform_workers=workers)
+        crawler.config['attributes']['comment_id'] = True
+        crawler.config['output'].update(format='csv', save_config=False)
+        crawler.config['metrics']['export'] = False
+        crawler.api_key = 'benchmark-key'
+        crawler.youtube_service = crawler.build_service(crawler.api_key)
+        warmup = [crawler.submit_transform([], None, 1) for _ in range(workers)]
+        for future in warmup:
+            future.result()
+
+        work_dir = tempfile.mkdtemp(prefix='yt_transform_')
+        os.chdir(work_dir)
+        started = time.perf_counter()
+        with redirect_stdout(io.StringIO()):
+            crawler.start_crawling(urls)
+        wall = time.perf_counter() - started
+        rows = crawler.stats['total_comments']
+        stages = crawler.metrics.to_dict()['stages']
+        results.append({'transform_workers': workers, 'rows': rows, 'wall_seconds': round(wall, 3),
+                        'rows_per_sec': round(rows / wall, 1) if wall else 0.0,
+                        'stage_seconds': {stage: round(data['total_seconds'], 3)
+                                          for stage, data in sorted(stages.items())}})
+    return results
+
+
+def compare_with_baseline(results: list, baseline_file: str, tolerance: float) -> list:
+    """Bandingkan comments/sec dengan hasil sebelumnya; return daftar regresi"""
+    with open(baseline_file, 'r', encoding='utf-8') as f:
+        baseline = {item['mode']: item for item in json.load(f)['results']}
+    regressions = []
+    for result in results:
+        previous = baseline.get(result['mode'])
+        if not previous or not previous['comments_per_sec']:
+            continue
+        ratio = result['comments_per_sec'] / previous['comments_per_sec']
+        if ratio < 1 - tolerance:
+            regressions.append(f"{result['mode']}: {previous['comments_per_sec']} -> "
+                               f"{result['comments_per_sec']} comments/sec ({ratio:.0%})")
+    return regressions
+
+
+def print_table(results: list):
+    """Tampilkan hasil benchmark dalam bentuk tabel"""
+    print(f"\n{'Mode':<12}{'Rows':>8}{'Wall(s)':>10}{'Rows/s':>10}{'Calls':>8}"
+          f"{'Retry':>7}{'RSS MB':>9}  Stages (s)")
+    print("-" * 96)
+    for r in results:
+        stages = ', '.join(f"{k}={v}" for k, v in r['stage_seconds'].items())
+        print(f"{r['mode']:<12}{r['rows']:>8}{r['wall_seconds']:>10}{r['comments_per_sec']:>10}"
+              f"{r['api_calls']:>8}{r['retries']:>7}{str(r['peak_rss_mb']):>9}  {stages}")
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Benchmark throughput YouTube Comments Crawler")
+    parser.add_argument('--videos', type=int, default=20, help='Jumlah video sintetis')
+    parser.add_argument('--max-comments', type=int, default=1000, help='Max komentar per video')
+    parser.add_argument('--workers', type=int, default=4, help='Jumlah worker untuk mode concurrent')
+    parser.add_argument('--modes', default=','.join(MODES), help='Mode yang dijalankan (pisahkan koma)')
+    parser.add_argument('--latency', type=float, default=50.0, help='Latency fake server (ms)')
+    parser.add_argument('--jitter', type=float, default=10.0, help='Variasi latency (ms)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Peluang error 503 per request')
+    parser.add_argument('--mean-comments', type=int, default=300, help='Skala jumlah komentar per video')
+    parser.add_argument('--json', help='Simpan hasil benchmark ke file JSON')
+    parser.add_argument('--baseline', help='File JSON hasil sebelumnya untuk deteksi regresi')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Toleransi penurunan comments/sec')
+    parser.add_argument('--startup', action='store_true', help='Ukur waktu cold start CLI saja')
+    parser.add_argument('--startup-budget', type=float, default=0.3, help='Batas waktu cold start (detik)')
+    parser.add_argument('--startup-runs', type=int, default=5, help='Jumlah pengulangan cold start')
+    parser.add_argument('--transform', action='store_true', help='Ukur rows/sec transformasi halaman saja')
+    parser.add_argument('--transform-workers', default='0,1,2,4', help='Jumlah transform worker (pisahkan koma)')
+    parser.add_argument('--transform-pages', type=int, default=200, help='Jumlah halaman (100 thread) sintetis untuk --schema')
+    parser.add_argument('--schema', action='store_true', help='Bandingkan memori/waktu tulis DataFrame object vs bertipe')
+    parser.add_argument('--run-mode', help=argparse.SUPPRESS)
+    parser.add_argument('--endpoint', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    video_ids = benchmark_video_ids(args.videos)
+
+    # Subprocess: jalankan satu mode dan cetak hasil JSON
+    if args.run_mode:
+        result = run_mode(args.run_mode, args.endpoint, video_ids, args.workers, args.max_comments)
+        print(json.dumps(result))
+        return 0
+
+    print("⏱️ YOUTUBE COMMENTS CRAWLER - BENCHMARK")
+    print("=" * 50)
+
+    if args.startup:
+        startup = measure_startup(args.startup_runs)
+        over_budget = False
+        for flag, seconds in startup.items():
+            status = "✅" if seconds <= args.startup_budget else "❌"
+            over_budget = over_budget or seconds > args.startup_budget
+            print(f"{status} Cold start {flag}: {seconds:.3f} s (budget {args.startup_budget:.3f} s)")
+        return 1 if over_budget else 0
+
+    if args.schema:
+        print(f"🧮 Skema output: {args.transform_pages} halaman sintetis")
+        results = measure_schema(args.transform_pages, args.mean_comments)
+        for r in results:
+            print(f"\n{r['schema']}: {r['rows']} baris, {r['memory_mb']} MB di memori, konversi {r['build_seconds']} s")
+            for output_format in ['csv', 'parquet']:
+                if f'{output_format}_mb' in r:
+                    print(f"   {output_format:<8} tulis {r[f'{output_format}_write_seconds']} s, "
+                          f"{r[f'{output_format}_mb']} MB file, baca ulang {r[f'{output_format}_load_seconds']} s / "
+                          f"{r[f'{output_format}_load_mb']} MB")
+        if args.json:
+            with open(args.json, 'w', encoding='utf-8') as f:
+                json.dump({'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'), 'schema': results}, f, indent=2)
+            print(f"\n💾 Hasil disimpan: {args.json}")
+        return 0
+
+    if args.transform:
+        worker_counts = [int(w) for w in args.transform_workers.split(',') if w.strip()]
+        process, url = start_fake_server(args)
+        print(f"🧮 Crawl {args.videos} video lewat fake API {url}, CPU: {os.cpu_count()}")
+        try:
+            results = measure_transform(worker_counts, url, video_ids, args.max_comments)
+        finally:
+            process.terminate()
+            process.wait()
+        print(f"\n{'Workers':>8}{'Rows':>10}{'Wall(s)':>10}{'Rows/s':>12}  Transform (s)")
+        print("-" * 72)
+        for r in results:
+            stages = ', '.join(f"{k}={r['stage_seconds'].get(k, 0)}"
+                               for k in ['transform_page', 'process_comment_item', 'process_reply_item'])
+            print(f"{r['transform_workers']:>8}{r['rows']:>10}{r['wall_seconds']:>10}{r['rows_per_sec']:>12}  {stages}")
+        if args.json:
+            with open(args.json, 'w', encoding='utf-8') as f:
+                json.dump({'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'), 'cpu_count': os.cpu_count(),
+                           'transform': results}, f, indent=2)
+            print(f"\n💾 Hasil disimpan: {args.json}")
+        return 0
+
+    process, url = start_fake_server(args)
+    print(f"🧪 Fake API: {url} (latency {args.latency}ms, error rate {args.error_rate})")
+    results = []
+    try:
+        for mode in [m.strip() for m in args.modes.split(',') if m.strip()]:
+            if mode not in MODES:
+                print(f"⚠️ Mode tidak dikenal: {mode}")
+                continue
+            print(f"▶️ Menjalankan mode {mode}...")
+            command = [sys.executable, os.path.abspath(__file__), '--run-mode', mode, '--endpoint', url,
+                       '--videos', str(args.videos), '--workers', str(args.workers),
+                       '--max-comments', str(args.max_comments)]
+            output = subprocess.run(command, capture_output=True, text=True, encoding='utf-8')
+            if output.returncode != 0:
+                print(f"❌ Mode {mode} gagal:\n{output.stderr}")
+                continue
+            results.append(json.loads(output.stdout.strip().splitlines()[-1]))
+    finally:
+        process.terminate()
+        process.wait()
+
+    print_table(results)
+
+    report = {'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'), 'videos': args.videos,
+              'latency_ms': args.latency, 'error_rate': args.error_rate, 'results': results}
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Hasil disimpan: {args.json}")
+
+    if args.baseline:
+        regressions = compare_with_baseline(results, args.baseline, args.tolerance)
+        if regressions:
+            print("\n❌ REGRESI PERFORMA TERDETEKSI:")
+            for regression in regressions:
+                print(f"   • {regression}")
+            return 1
+        print("\n✅ Tidak ada regresi dibanding baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
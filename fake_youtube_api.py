@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""
+Fake YouTube Data API v3 Server
+===============================
+
+Server HTTP lokal yang meniru endpoint `videos`, `commentThreads`, `comments`
+dan `channels` dari YouTube Data API v3 dengan data sintetis. Dipakai untuk
+mengukur performa crawler (lihat benchmark_crawler.py) tanpa menghabiskan
+quota API sungguhan.
+
+Parameter `fields` (partial response) didukung seperti API aslinya.
+
+Data bersifat deterministik: setiap video ID (11 karakter) selalu
+menghasilkan jumlah komentar, teks, dan pagination yang sama. Video ID yang
+diawali `empty` tidak punya komentar, dan yang diawali `nocom` komentarnya
+dinonaktifkan (commentCount tidak ada, commentThreads mengembalikan 403).
+
+Contoh:
+  python fake_youtube_api.py --port 8765 --latency 80 --error-rate 0.02
+  set YOUTUBE_API_ENDPOINT=http://127.0.0.1:8765
+  python youtube_comments_crawler.py --input youtube_urls_template.txt
+
+Author: Ferdian Bangkit Wijaya
+Institution: Universitas Sultan Ageng Tirtayasa (UNTIRTA)
+"""
+
+import sys
+import json
+import time
+import random
+import hashlib
+import argparse
+import threading
+from typing import Optional
+from datetime import datetime, timedelta
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+WORDS = [
+    'video', 'bagus', 'sekali', 'terima', 'kasih', 'penjelasan', 'sangat', 'membantu',
+    'saya', 'suka', 'mantap', 'keren', 'tutorial', 'ini', 'yang', 'dan', 'untuk',
+    'great', 'video', 'thanks', 'for', 'sharing', 'this', 'is', 'awesome', 'love',
+    'the', 'music', 'please', 'make', 'more', 'content', 'like', 'subscribe', 'wkwk',
+    'gak', 'nyangka', 'akhirnya', 'nonton', 'lagi', 'tahun', 'siapa', 'yang', 'masih',
+    'dengerin', 'lagu', 'keren', 'banget', 'bro', 'kak', 'semangat', 'terus', 'berkarya',
+    'https://example.com', '@kreator', 'first', 'nice', 'lucu', 'sedih', 'setuju',
+]
+
+BASE_TIME = datetime(2025, 1, 1)
+CHANNEL_VIDEOS = 40
+MAX_INLINE_REPLIES = 5
+
+
+def _seed(*parts) -> int:
+    """Seed deterministik dari beberapa nilai"""
+    digest = hashlib.md5('|'.join(str(p) for p in parts).encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big')
+
+
+def parse_fields(spec: str) -> dict:
+    """Parse parameter fields= (partial response), mis. 'items(id,snippet(title))'
+
+    Hasil berupa tree {nama: subtree}; subtree None berarti field diambil utuh.
+    Mendukung sub-seleksi dengan kurung dan path dengan '/'.
+    """
+    tree, stack, name = {}, [], ''
+
+    def add(path: str, node: dict) -> dict:
+        parts = path.strip().split('/')
+        for part in parts[:-1]:
+            if node.get(part) is None:
+                node[part] = {}
+            node = node[part]
+        return node, parts[-1]
+
+    node = tree
+    for char in spec + ',':
+        if char == '(':
+            parent, key = add(name, node)
+            child = parent.get(key) or {}
+            parent[key] = child
+            stack.append(node)
+            node, name = child, ''
+        elif char in ',)':
+            if name.strip():
+                parent, key = add(name, node)
+                parent.setdefault(key, None)
+            name = ''
+            if char == ')':
+                node = stack.pop()
+        else:
+            name += char
+    return tree
+
+
+def apply_fields(value, tree: Optional[dict]):
+    """Pangkas response sesuai tree hasil parse_fields"""
+    if tree is None:
+        return value
+    if isinstance(value, list):
+        return [apply_fields(item, tree) for item in value]
+    if isinstance(value, dict):
+        return {key: apply_fields(value[key], sub) for key, sub in tree.items() if key in value}
+    return value
+
+
+def _timestamp(rng: random.Random) -> str:
+    moment = BASE_TIME + timedelta(seconds=rng.randint(0, 180 * 24 * 3600))
+    return moment.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+class FakeYouTubeData:
+    """Generator data sintetis yang konsisten untuk setiap ID"""
+
+    def __init__(self, mean_comments: int = 300):
+        self.mean_comments = mean_comments
+
+    def comment_count(self, video_id: str) -> Optional[int]:
+        """Jumlah thread komentar per video (distribusi long-tail)"""
+        if video_id.startswith('empty'):
+            return 0
+        if video_id.startswith('nocom'):
+            return None
+        rng = random.Random(_seed('count', video_id))
+        return int(rng.paretovariate(1.5) * self.mean_comments / 3)
+
+    def reply_count(self, thread_id: str) -> int:
+        rng = random.Random(_seed('replies', thread_id))
+        return 0 if rng.random() < 0.7 else rng.randint(1, 12)
+
+    def text(self, key: str) -> str:
+        rng = random.Random(_seed('text', key))
+        return ' '.join(rng.choice(WORDS) for _ in range(rng.randint(3, 60)))
+
+    def comment_snippet(self, comment_id: str, video_id: str, parent_id: str = None) -> dict:
+        rng = random.Random(_seed('snippet', comment_id))
+        author = f"UC{hashlib.md5(str(rng.randint(0, 5000)).encode()).hexdigest()[:22]}"
+        published = _timestamp(rng)
+        text = self.text(comment_id)
+        snippet = {
+            'channelId': self.channel_id(video_id),
+            'videoId': video_id,
+            'textDisplay': text,
+            'textOriginal': text,
+            'authorDisplayName': f'@user{author[2:10]}',
+            'authorProfileImageUrl': f'https://yt3.ggpht.example/{author}=s48-c-k-c0x00ffffff-no-rj',
+            'authorChannelUrl': f'http://www.youtube.com/{author}',
+            'authorChannelId': {'value': author},
+            'canRate': True,
+            'viewerRating': 'none',
+            'likeCount': int(rng.paretovariate(1.2)) - 1,
+            'publishedAt': published,
+            'updatedAt': published if rng.random() < 0.9 else _timestamp(rng),
+        }
+        if parent_id:
+            snippet['parentId'] = parent_id
+        return snippet
+
+    def channel_id(self, video_id: str) -> str:
+        return f"UC{hashlib.md5(('ch' + video_id[:2]).encode()).hexdigest()[:22]}"
+
+    def video(self, video_id: str) -> dict:
+        rng = random.Random(_seed('video', video_id))
+        statistics = {
+            'viewCount': str(rng.randint(1000, 10 ** 7)),
+            'likeCount': str(rng.randint(10, 10 ** 5)),
+            'favoriteCount': '0',
+        }
+        count = self.comment_count(video_id)
+        if count is not None:
+            statistics['commentCount'] = str(count)
+        return {
+            'kind': 'youtube#video',
+            'etag': hashlib.md5(video_id.encode()).hexdigest(),
+            'id': video_id,
+            'snippet': {
+                'publishedAt': _timestamp(rng),
+                'channelId': self.channel_id(video_id),
+                'title': f'Video Sintetis {video_id}',
+                'description': self.text('desc' + video_id),
+                'channelTitle': f'Channel {video_id[:2]}',
+                'tags': ['benchmark', 'sintetis'],
+                'categoryId': '22',
+            },
+            'statistics': statistics,
+        }
+
+    def reply(self, thread_id: str, index: int, video_id: str) -> dict:
+        reply_id = f'{thread_id}.r{index:04d}'
+        return {
+            'kind': 'youtube#comment',
+            'etag': hashlib.md5(reply_id.encode()).hexdigest(),
+            'id': reply_id,
+            'snippet': self.comment_snippet(reply_id, video_id, parent_id=thread_id),
+        }
+
+    def thread(self, video_id: str, index: int, include_replies: bool) -> dict:
+        thread_id = f'Ug{video_id}{index:06d}'
+        total_replies = self.reply_count(thread_id)
+        thread = {
+            'kind': 'youtube#commentThread',
+            'etag': hashlib.md5(thread_id.encode()).hexdigest(),
+            'id': thread_id,
+            'snippet': {
+                'channelId': self.channel_id(video_id),
+                'videoId': video_id,
+                'topLevelComment': {
+                    'kind': 'youtube#comment',
+                    'etag': hashlib.md5((thread_id + 'c').encode()).hexdigest(),
+                    'id': thread_id,
+                    'snippet': self.comment_snippet(thread_id, video_id),
+                },
+                'canReply': True,
+                'totalReplyCount': total_replies,
+                'isPublic': True,
+            },
+        }
+        if include_replies and total_replies:
+            thread['replies'] = {'comments': [self.reply(thread_id, i, video_id)
+                                              for i in range(min(total_replies, MAX_INLINE_REPLIES))]}
+        return thread
+
+    def channel_video_ids(self, channel_id: str) -> list:
+        rng = random.Random(_seed('channel', channel_id))
+        alphabet = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-'
+        return [''.join(rng.choice(alphabet) for _ in range(11)) for _ in range(CHANNEL_VIDEOS)]
+
+
+class ApiError(Exception):
+    """Error yang dikirim sebagai response error format YouTube API"""
+
+    def __init__(self, status: int, reason: str, message: str):
+        super().__init__(message)
+        self.status = status
+        self.reason = reason
+        self.message = message
+
+
+class FakeYouTubeAPIServer:
+    """Server fake YouTube Data API yang berjalan di background thread"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, latency_ms: float = 0.0,
+                 jitter_ms: float = 0.0, error_rate: float = 0.0, mean_comments: int = 300,
+                 seed: int = 0):
+        self.data = FakeYouTubeData(mean_comments=mean_comments)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats = {'requests': {}, 'errors_injected': 0, 'bytes_sent': 0}
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> 'FakeYouTubeAPIServer':
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    # ------------------------------------------------------------------ routing
+
+    def handle(self, path: str, params: dict) -> dict:
+        endpoint = path.rstrip('/').rsplit('/', 1)[-1]
+        with self.lock:
+            self.stats['requests'][endpoint] = self.stats['requests'].get(endpoint, 0) + 1
+            inject_error = self.rng.random() < self.error_rate
+            delay = max(0.0, self.latency_ms + self.rng.uniform(-self.jitter_ms, self.jitter_ms))
+        if delay:
+            time.sleep(delay / 1000.0)
+        if inject_error:
+            with self.lock:
+                self.stats['errors_injected'] += 1
+            raise ApiError(503, 'backendError', 'Injected transient error')
+        if endpoint == 'videos':
+            return self.videos(params)
+        if endpoint == 'commentThreads':
+            return self.comment_threads(params)
+        if endpoint == 'comments':
+            return self.comments(params)
+        if endpoint == 'channels':
+            return self.channels(params)
+        raise ApiError(404, 'notFound', f'Unknown endpoint: {endpoint}')
+
+    @staticmethod
+    def _page(params: dict, total: int, default_size: int = 20, max_size: int = 100):
+        size = min(int(params.get('maxResults', default_size)), max_size)
+        offset = int(params.get('pageToken') or 0)
+        return offset, min(offset + size, total)
+
+    def videos(self, params: dict) -> dict:
+        ids = [vid for vid in params.get('id', '').split(',') if vid][:50]
+        items = [self.data.video(vid) for vid in ids]
+        return {'kind': 'youtube#videoListResponse', 'items': items,
+                'pageInfo': {'totalResults': len(items), 'resultsPerPage': len(items)}}
+
+    def comment_threads(self, params: dict) -> dict:
+        include_replies = 'replies' in params.get('part', '')
+        if 'id' in params:
+            items = []
+            for thread_id in params['id'].split(','):
+                video_id = thread_id[2:13]
+                items.append(self.data.thread(video_id, int(thread_id[13:19] or 0), include_replies))
+            return {'kind': 'youtube#commentThreadListResponse', 'items': items}
+        if 'allThreadsRelatedToChannelId' in params:
+            # Stream channel: gabungan thread dari semua video channel
+            video_ids = self.data.channel_video_ids(params['allThreadsRelatedToChannelId'])
+            threads = [(vid, i) for vid in video_ids for i in range(min(self.data.comment_count(vid) or 0, 50))]
+            offset, end = self._page(params, len(threads))
+            items = [self.data.thread(vid, i, include_replies) for vid, i in threads[offset:end]]
+            total = len(threads)
+        else:
+            video_id = params.get('videoId', '')
+            count = self.data.comment_count(video_id)
+            if count is None:
+                raise ApiError(403, 'commentsDisabled', 'The video has disabled comments.')
+            offset, end = self._page(params, count)
+            items = [self.data.thread(video_id, i, include_replies) for i in range(offset, end)]
+            total = count
+        response = {'kind': 'youtube#commentThreadListResponse', 'items': items,
+                    'pageInfo': {'totalResults': len(items), 'resultsPerPage': len(items)}}
+        if end < total:
+            response['nextPageToken'] = str(end)
+        return response
+
+    def comments(self, params: dict) -> dict:
+        if 'id' in params:
+            items = []
+            for comment_id in params['id'].split(',')[:50]:
+                video_id = comment_id[2:13]
+                items.append({'kind': 'youtube#comment', 'id': comment_id,
+                              'snippet': self.data.comment_snippet(comment_id, video_id,
+                                                                   parent_id=comment_id.split('.')[0]
+                                                                   if '.' in comment_id else None)})
+            return {'kind': 'youtube#commentListResponse', 'items': items}
+        parent_id = params.get('parentId', '')
+        video_id = parent_id[2:13]
+        total = self.data.reply_count(parent_id)
+        offset, end = self._page(params, total)
+        response = {'kind': 'youtube#commentListResponse',
+                    'items': [self.data.reply(parent_id, i, video_id) for i in range(offset, end)]}
+        if end < total:
+            response['nextPageToken'] = str(end)
+        return response
+
+    def channels(self, params: dict) -> dict:
+        key = params.get('id') or params.get('forHandle') or params.get('forUsername') or 'default'
+        channel_id = key if str(key).startswith('UC') else f"UC{hashlib.md5(str(key).encode()).hexdigest()[:22]}"
+        return {'kind': 'youtube#channelListResponse',
+                'items': [{'kind': 'youtube#channel', 'id': channel_id,
+                           'snippet': {'title': f'Channel {key}'}}]}
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                if parsed.path == '/_stats':
+                    with server.lock:
+                        self._send(200, server.stats)
+                    return
+                params = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+                try:
+                    response = server.handle(parsed.path, params)
+                    if params.get('fields'):
+                        response = apply_fields(response, parse_fields(params['fields']))
+                    self._send(200, response)
+                except ApiError as e:
+                    self._send(e.status, {'error': {
+                        'code': e.status, 'message': e.message,
+                        'errors': [{'message': e.message, 'domain': 'youtube', 'reason': e.reason}]}})
+
+            def _send(self, status: int, payload: dict):
+                body = json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json; charset=UTF-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                with server.lock:
+                    server.stats['bytes_sent'] += len(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Fake YouTube Data API v3 server untuk benchmark")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=50.0, help='Latency rata-rata per request (ms)')
+    parser.add_argument('--jitter', type=float, default=10.0, help='Variasi latency (ms)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Peluang error 503 per request (0-1)')
+    parser.add_argument('--mean-comments', type=int, default=300, help='Skala jumlah komentar per video')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    server = FakeYouTubeAPIServer(args.host, args.port, args.latency, args.jitter,
+                                  args.error_rate, args.mean_comments, args.seed)
+    print(f"🧪 Fake YouTube API berjalan di {server.url}", flush=True)
+    print(f"💡 Set YOUTUBE_API_ENDPOINT={server.url} untuk memakai server ini", flush=True)
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        print("\n⏹️ Server dihentikan")
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
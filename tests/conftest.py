@@ -0,0 +1,67 @@
+"""
+Fixture bersama test crawler
+============================
+
+Semua test memakai fake YouTube Data API (fake_youtube_api.py) sehingga
+tidak butuh API key maupun quota sungguhan.
+"""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from fake_youtube_api import FakeYouTubeAPIServer  # noqa: E402
+from youtube_comments_crawler import YouTubeCommentsCrawler  # noqa: E402
+
+MEAN_COMMENTS = 60
+
+
+@pytest.fixture(scope='session')
+def fake_api():
+    """Fake API bersama untuk satu sesi test (data deterministik per video ID)"""
+    server = FakeYouTubeAPIServer(mean_comments=MEAN_COMMENTS).start()
+    yield server
+    server.stop()
+
+
+def configure_crawler(crawler: YouTubeCommentsCrawler, endpoint: str, prefix: str = 'test_comments',
+                      **overrides) -> YouTubeCommentsCrawler:
+    """Crawler tanpa jeda, output CSV tanpa timestamp, dan service ke endpoint fake API"""
+    crawler.update_config({
+        'delays': {'between_videos': 0, 'between_requests': 0},
+        'output': {'format': 'csv', 'filename_prefix': prefix, 'include_timestamp': False,
+                   'save_config': False},
+        'metrics': {'export': False},
+        'api': {'endpoint': endpoint, 'backoff': 0.01, 'measure_savings': False},
+    })
+    crawler.update_config(overrides)
+    crawler.api_key = 'test-key'
+    crawler.youtube_service = crawler.build_service(crawler.api_key)
+    return crawler
+
+
+@pytest.fixture
+def make_crawler(fake_api, tmp_path, monkeypatch):
+    """Factory crawler yang menulis output di tmp_path; keyword = override config"""
+    monkeypatch.chdir(tmp_path)
+    crawlers = []
+
+    def make(server=None, prefix='test_comments', **overrides):
+        crawler = configure_crawler(YouTubeCommentsCrawler(), (server or fake_api).url, prefix, **overrides)
+        crawlers.append(crawler)
+        return crawler
+
+    yield make
+    for crawler in crawlers:
+        crawler.shutdown_transform_pool()
+        crawler.shutdown_fetch_pool()
+
+
+def comment_key(row: dict) -> tuple:
+    """Identitas baris yang stabil antar crawl (tanpa crawl_timestamp)"""
+    return tuple(sorted((key, str(value)) for key, value in row.items() if key != 'crawl_timestamp'))
@@ -0,0 +1,32 @@
+"""Test ringkasan streaming per author dan per video (RowAggregator)"""
+
+import pandas as pd
+
+from benchmark_crawler import benchmark_video_ids
+
+
+def test_summaries_are_opt_in(make_crawler, tmp_path):
+    make_crawler(prefix='plain').start_crawling(benchmark_video_ids(3))
+    assert (tmp_path / 'plain.csv').exists()
+    assert not list(tmp_path.glob('plain_*summary*'))
+
+
+def test_summaries_match_output(make_crawler, tmp_path):
+    crawler = make_crawler(prefix='agg', aggregates={'enabled': True})
+    crawler.start_crawling(benchmark_video_ids(5))
+    output = pd.DataFrame(crawler.results)
+
+    videos = pd.read_csv(tmp_path / 'agg_video_summary.csv').set_index('video_id')
+    grouped = output.groupby('video_id')
+    assert videos['comments'].to_dict() == grouped.size().to_dict()
+    assert videos['total_likes'].to_dict() == grouped['like_count'].sum().to_dict()
+    assert videos['replies'].to_dict() == grouped['comment_type'].apply(lambda s: int((s == 'reply').sum())).to_dict()
+    assert videos['first_seen'].to_dict() == grouped['publish_date'].min().to_dict()
+    assert videos['last_seen'].to_dict() == grouped['publish_date'].max().to_dict()
+
+    authors = pd.read_csv(tmp_path / 'agg_author_summary.csv')
+    assert authors['comments'].sum() == len(output)
+    assert authors['comments'].is_monotonic_decreasing
+    top = authors.iloc[0]
+    assert top['comments'] == (output['author_channel_id'] == top['author_channel_id']).sum()
+    assert round(top['reply_ratio'], 4) == round(top['replies'] / top['comments'], 4)
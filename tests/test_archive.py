@@ -0,0 +1,50 @@
+"""Test arsip raw dan replay tanpa request API"""
+
+import sqlite3
+
+from benchmark_crawler import benchmark_video_ids
+from conftest import comment_key
+from test_channel import CHANNEL_ID
+
+
+def replay(make_crawler, fake_api, archive_dir, **overrides):
+    crawler = make_crawler(prefix='replayed', **overrides)
+    before = sum(fake_api.stats['requests'].values())
+    crawler.replay_archive(str(archive_dir))
+    assert sum(fake_api.stats['requests'].values()) == before
+    return crawler
+
+
+def test_video_archive_replay_matches_live_crawl(make_crawler, fake_api, tmp_path):
+    live = make_crawler(prefix='live', archive={'enabled': True})
+    live.start_crawling(benchmark_video_ids(5))
+    replayed = replay(make_crawler, fake_api, tmp_path / 'live_raw')
+    assert sorted(map(comment_key, replayed.results)) == sorted(map(comment_key, live.results))
+
+    # Replay dengan atribut lain tanpa crawl ulang
+    trimmed = replay(make_crawler, fake_api, tmp_path / 'live_raw', include_replies=False,
+                     attributes={'author_name': False})
+    assert len(trimmed.results) == sum(1 for row in live.results if row['comment_type'] == 'main_comment')
+    assert all('author_name' not in row for row in trimmed.results)
+
+
+def test_channel_archive_replay_keeps_video_metadata(make_crawler, fake_api, tmp_path):
+    live = make_crawler(prefix='live', archive={'enabled': True}, pipeline={'queue_size': 4})
+    live.start_channel_crawling(CHANNEL_ID)
+    replayed = replay(make_crawler, fake_api, tmp_path / 'live_raw')
+
+    assert len(replayed.results) == len(live.results) > 0
+    assert all(row['video_title'] for row in replayed.results)
+    assert sorted(map(comment_key, replayed.results)) == sorted(map(comment_key, live.results))
+
+
+def test_replay_streams_files_to_sink(make_crawler, fake_api, tmp_path):
+    live = make_crawler(prefix='live', archive={'enabled': True}, attributes={'comment_id': True})
+    live.start_crawling(benchmark_video_ids(4))
+    replayed = replay(make_crawler, fake_api, tmp_path / 'live_raw', attributes={'comment_id': True},
+                      output={'sink': 'sqlite'})
+    assert not replayed.results
+    assert replayed.stats['total_comments'] == len(live.results)
+    with sqlite3.connect(tmp_path / 'replayed.db') as conn:
+        stored = {row[0] for row in conn.execute('SELECT comment_id FROM comments')}
+    assert stored == {row['comment_id'] for row in live.results}
@@ -0,0 +1,41 @@
+"""Test mode budget (round-robin halaman) dan resume lintas run"""
+
+import os
+
+from benchmark_crawler import benchmark_video_ids
+from conftest import comment_key
+
+VIDEO_IDS = benchmark_video_ids(8)
+
+
+def test_resumed_budget_runs_equal_full_crawl(make_crawler, tmp_path):
+    full = make_crawler(prefix='full', max_comments_per_video=10 ** 6)
+    full.start_crawling(VIDEO_IDS)
+    expected = {comment_key(row) for row in full.results}
+
+    resume_file = str(tmp_path / 'resume.json')
+    collected = []
+    for run in range(30):
+        crawler = make_crawler(prefix=f'run{run}', max_comments_per_video=10 ** 6,
+                               budget={'quota_units': 3, 'resume_file': resume_file})
+        crawler.start_crawling(VIDEO_IDS)
+        assert crawler.metrics.counter('quota_units') <= 3
+        collected.extend(crawler.results)
+        if not os.path.exists(resume_file):
+            break
+    assert run > 1, 'budget harus memecah crawl menjadi beberapa run'
+    assert not os.path.exists(resume_file)
+    assert len(collected) == len(expected)
+    assert {comment_key(row) for row in collected} == expected
+
+
+def test_round_robin_spreads_pages(make_crawler, fake_api):
+    video_ids = [vid for vid in benchmark_video_ids(300)
+                 if (fake_api.data.comment_count(vid) or 0) > 250][:3]
+    assert len(video_ids) == 3
+    crawler = make_crawler(include_replies=False, max_comments_per_video=10 ** 6,
+                           budget={'quota_units': 4, 'resume_file': 'rr.json'})
+    crawler.start_crawling(video_ids)
+    # 1 unit info video, lalu 1 halaman untuk setiap video sebelum ada video yang mendapat halaman kedua
+    pages = {vid: sum(1 for row in crawler.results if row['video_id'] == vid) for vid in video_ids}
+    assert all(count == 100 for count in pages.values())
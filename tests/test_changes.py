@@ -0,0 +1,47 @@
+"""Test change-data-capture antar crawl (--track-changes)"""
+
+import json
+
+from benchmark_crawler import benchmark_video_ids
+from conftest import MEAN_COMMENTS
+from fake_youtube_api import FakeYouTubeAPIServer
+
+
+def read_events(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def test_change_log_reports_edited_and_deleted(make_crawler, tmp_path, monkeypatch):
+    server = FakeYouTubeAPIServer(mean_comments=MEAN_COMMENTS).start()
+    video_ids = [vid for vid in benchmark_video_ids(4) if server.data.comment_count(vid)]
+    try:
+        first = make_crawler(server=server, prefix='crawl1', changes={'enabled': True})
+        first.start_crawling(video_ids)
+        inserted = read_events(tmp_path / 'crawl1_changes.ndjson')
+        assert len(inserted) == len(first.results)
+        assert {event['event'] for event in inserted} == {'inserted'}
+
+        # Satu komentar diedit dan thread terakhir satu video dihapus
+        target = video_ids[0]
+        edited_id = f'Ug{target}000003'
+        deleted_id = f'Ug{target}{server.data.comment_count(target) - 1:06d}'
+        comment_snippet, comment_count = server.data.comment_snippet, server.data.comment_count
+
+        def edited_snippet(comment_id, video_id, parent_id=None):
+            snippet = comment_snippet(comment_id, video_id, parent_id)
+            if comment_id == edited_id:
+                snippet.update(textDisplay='komentar sudah diedit', updatedAt='2025-12-01T00:00:00Z')
+            return snippet
+
+        monkeypatch.setattr(server.data, 'comment_snippet', edited_snippet)
+        monkeypatch.setattr(server.data, 'comment_count',
+                            lambda vid: comment_count(vid) - 1 if vid == target else comment_count(vid))
+        second = make_crawler(server=server, prefix='crawl2', changes={'enabled': True})
+        second.start_crawling(video_ids)
+    finally:
+        server.stop()
+
+    events = read_events(tmp_path / 'crawl2_changes.ndjson')
+    assert [(e['event'], e['comment_id']) for e in events] == [('edited', edited_id), ('deleted', deleted_id)]
+    assert events[0]['updated_at'] == '2025-12-01T00:00:00Z'
@@ -0,0 +1,26 @@
+"""Test mode channel: satu stream allThreadsRelatedToChannelId untuk seluruh video channel"""
+
+from collections import Counter
+
+CHANNEL_ID = 'UC' + 'x' * 22
+
+
+def test_channel_stream_covers_all_channel_videos(make_crawler, fake_api):
+    crawler = make_crawler(include_replies=False)
+    crawler.start_channel_crawling(CHANNEL_ID)
+
+    expected = {vid: min(fake_api.data.comment_count(vid), 50)
+                for vid in fake_api.data.channel_video_ids(CHANNEL_ID)}
+    expected = {vid: count for vid, count in expected.items() if count}
+    assert Counter(row['video_id'] for row in crawler.results) == expected
+    assert all(row['video_title'] == f"Video Sintetis {row['video_id']}" for row in crawler.results)
+
+
+def test_channel_video_info_batched(make_crawler, fake_api):
+    crawler = make_crawler(include_replies=False)
+    before = dict(fake_api.stats['requests'])
+    crawler.start_channel_crawling(CHANNEL_ID)
+    requests = {key: count - before.get(key, 0) for key, count in fake_api.stats['requests'].items()}
+    # Metadata diambil per halaman (hanya ID baru), bukan satu request per video
+    assert 0 < requests['videos'] <= requests['commentThreads']
+    assert requests['videos'] < len(fake_api.data.channel_video_ids(CHANNEL_ID))
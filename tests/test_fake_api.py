@@ -0,0 +1,62 @@
+"""Test fake YouTube API: pagination, fields mask, injeksi error, dan retry crawler"""
+
+import json
+from urllib.request import urlopen
+
+import pytest
+
+from benchmark_crawler import benchmark_video_ids
+from conftest import comment_key
+from fake_youtube_api import FakeYouTubeAPIServer, apply_fields, parse_fields
+
+
+def get(server, path):
+    with urlopen(f'{server.url}/youtube/v3/{path}') as response:
+        return json.loads(response.read())
+
+
+def test_pagination_returns_every_thread_once(fake_api):
+    video_id = max(benchmark_video_ids(50), key=lambda vid: fake_api.data.comment_count(vid) or 0)
+    ids, token, pages = [], '', 0
+    while True:
+        page = get(fake_api, f'commentThreads?part=snippet&videoId={video_id}&maxResults=100&pageToken={token}')
+        ids.extend(item['id'] for item in page['items'])
+        pages += 1
+        token = page.get('nextPageToken')
+        if not token:
+            break
+    count = fake_api.data.comment_count(video_id)
+    assert len(ids) == len(set(ids)) == count
+    assert pages == -(-count // 100)
+
+
+def test_disabled_comments_return_403(fake_api):
+    with pytest.raises(Exception) as error:
+        get(fake_api, 'commentThreads?part=snippet&videoId=nocomVideo1')
+    assert getattr(error.value, 'code', None) == 403
+
+
+def test_fields_mask():
+    tree = parse_fields('nextPageToken,items(id,snippet(videoId,topLevelComment/snippet(likeCount)))')
+    response = {'nextPageToken': '20', 'kind': 'x', 'items': [
+        {'id': 'a', 'etag': 'e', 'snippet': {'videoId': 'v', 'canReply': True,
+                                             'topLevelComment': {'id': 'a', 'snippet': {'likeCount': 3, 'textDisplay': 't'}}}}]}
+    assert apply_fields(response, tree) == {'nextPageToken': '20', 'items': [
+        {'id': 'a', 'snippet': {'videoId': 'v', 'topLevelComment': {'snippet': {'likeCount': 3}}}}]}
+
+
+def test_injected_errors_are_retried(make_crawler, fake_api):
+    video_ids = benchmark_video_ids(5)
+    flaky = FakeYouTubeAPIServer(mean_comments=fake_api.data.mean_comments, error_rate=0.2, seed=7).start()
+    try:
+        crawler = make_crawler(server=flaky, prefix='flaky', api={'retries': 8})
+        crawler.start_crawling(video_ids)
+    finally:
+        flaky.stop()
+    reference = make_crawler(prefix='reference')
+    reference.start_crawling(video_ids)
+
+    assert flaky.stats['errors_injected'] > 0
+    assert crawler.stats['retries'] == flaky.stats['errors_injected']
+    assert crawler.metrics.counter('retries') == flaky.stats['errors_injected']
+    assert list(map(comment_key, crawler.results)) == list(map(comment_key, reference.results))
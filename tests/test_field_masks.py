@@ -0,0 +1,47 @@
+"""Test partial response (fields=) dan request pengukuran measure_savings"""
+
+from benchmark_crawler import benchmark_video_ids
+from conftest import comment_key
+
+ATTRIBUTES = {'comment_id': True, 'author_profile_image_url': False, 'updated_at': False}
+
+
+def crawl(make_crawler, fake_api, prefix, **overrides):
+    before = sum(fake_api.stats['requests'].values())
+    crawler = make_crawler(prefix=prefix, attributes=ATTRIBUTES, **overrides)
+    crawler.start_crawling(benchmark_video_ids(4))
+    return crawler, sum(fake_api.stats['requests'].values()) - before
+
+
+def test_masked_output_matches_unmasked(make_crawler, fake_api):
+    masked, _ = crawl(make_crawler, fake_api, 'masked')
+    full, _ = crawl(make_crawler, fake_api, 'full', api={'partial_response': False})
+    assert masked.field_masks and not full.field_masks
+    assert sorted(map(comment_key, masked.results)) == sorted(map(comment_key, full.results))
+    assert masked.metrics.counter('bytes_received') < full.metrics.counter('bytes_received')
+
+
+def test_measure_savings_is_opt_in_and_counted(make_crawler, fake_api, capsys):
+    plain, plain_sent = crawl(make_crawler, fake_api, 'plain')
+    assert not plain.field_mask_ratios
+    assert plain.stats['api_calls'] == plain_sent
+    # Ukuran response ter-mask tetap dicatat dan dilaporkan tanpa request pengukuran
+    masked = plain.metrics.counter('bytes_received_masked')
+    assert 0 < masked == plain.metrics.counter('bytes_received')
+    assert f"{masked/1024:.1f} KB diterima ter-mask" in capsys.readouterr().out
+
+    measured, sent = crawl(make_crawler, fake_api, 'measured', api={'measure_savings': True})
+    # Satu request tanpa mask per endpoint (videos dan commentThreads)
+    assert sent == plain_sent + 2
+    assert measured.stats['api_calls'] == sent
+    assert measured.metrics.counter('quota_units') == plain.metrics.counter('quota_units') + 2
+    assert all(ratio > 1 for ratio in measured.field_mask_ratios.values())
+    saved, full = measured.estimated_bytes_saved()
+    assert 0 < saved < full
+
+
+def test_quota_budget_includes_measurement(make_crawler, fake_api):
+    crawler, sent = crawl(make_crawler, fake_api, 'budget', api={'measure_savings': True},
+                          budget={'quota_units': 4})
+    assert crawler.metrics.counter('quota_units') <= 4
+    assert crawler.stats['api_calls'] == sent
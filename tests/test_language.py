@@ -0,0 +1,44 @@
+"""Test identifikasi bahasa offline (LanguageIdentifier)"""
+
+from benchmark_crawler import benchmark_video_ids
+from youtube_comments_crawler import LanguageIdentifier
+
+SAMPLES = {
+    'terima kasih videonya sangat membantu saya belajar': 'id',
+    'thanks for sharing this awesome video, I love the music': 'en',
+    'aku ora ngerti opo sing diomongke': 'jv',
+    'kumaha damang, abdi resep pisan kana lagu ieu': 'su',
+    '': 'und',
+    '😂😂': 'und',
+    'ok': 'und',
+}
+
+
+def test_predict_sample_texts():
+    identifier = LanguageIdentifier()
+    assert identifier.predict(list(SAMPLES)) == list(SAMPLES.values())
+    # Hasil sama saat skor token sudah di-cache, dan tidak bergantung pada isi batch
+    assert identifier.predict(list(SAMPLES)[::-1]) == list(SAMPLES.values())[::-1]
+    assert [identifier.predict([text])[0] for text in SAMPLES] == list(SAMPLES.values())
+
+
+def test_language_column_filled_per_page(make_crawler):
+    crawler = make_crawler(attributes={'language': True})
+    crawler.start_crawling(benchmark_video_ids(3))
+    assert crawler.results
+    texts = [row['comment_text'] for row in crawler.results]
+    assert [row['language'] for row in crawler.results] == LanguageIdentifier().predict(texts)
+    assert crawler.metrics.to_dict()['stages']['language']['count'] > 0
+
+
+def test_cache_reset_keeps_batch_tokens(monkeypatch):
+    monkeypatch.setattr(LanguageIdentifier, 'CACHE_SIZE', 40)
+    identifier = LanguageIdentifier()
+    texts = list(SAMPLES)
+    expected = list(SAMPLES.values())
+    # Batch kedua berisi token yang sudah dikenal dan token baru yang melewati CACHE_SIZE
+    for round_ in range(5):
+        extra = [' '.join(f'kata{round_}x{i}' for i in range(15))]
+        assert identifier.predict(texts + extra)[:len(texts)] == expected
+    # Cache sudah di-reset: token ronde pertama tidak lagi tersimpan
+    assert 'kata0x0' not in identifier.vocab
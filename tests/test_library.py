@@ -0,0 +1,92 @@
+"""Test API library iter_comments / aiter_comments"""
+
+import asyncio
+import logging
+import threading
+
+import pandas as pd
+import pytest
+
+from benchmark_crawler import benchmark_video_ids
+from conftest import comment_key
+from youtube_comments_crawler import aiter_comments, iter_comments
+
+VIDEO_IDS = benchmark_video_ids(6)
+
+
+@pytest.fixture
+def options(fake_api, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return {'api_key': 'test-key', 'delays': {'between_videos': 0, 'between_requests': 0},
+            'api': {'endpoint': fake_api.url, 'backoff': 0.01}, 'attributes': {'comment_id': True}}
+
+
+def crawler_threads():
+    return [t.name for t in threading.enumerate() if t.name == 'iter-comments' or t.name.startswith('fetch')]
+
+
+def test_batches_match_crawl_and_stay_quiet(make_crawler, options, capsys, caplog, tmp_path):
+    crawler = make_crawler(attributes={'comment_id': True})
+    crawler.start_crawling(VIDEO_IDS)
+    capsys.readouterr()
+
+    with caplog.at_level(logging.INFO, logger='youtube_comments_crawler'):
+        batches = list(iter_comments(VIDEO_IDS, **options))
+    assert capsys.readouterr().out == ''
+    assert any('MEMULAI CRAWLING' in record.message for record in caplog.records)
+
+    assert len(batches) > 1 and all(isinstance(batch, list) and batch for batch in batches)
+    rows = [row for batch in batches for row in batch]
+    assert sorted(map(comment_key, rows)) == sorted(map(comment_key, crawler.results))
+    # Mode library tidak menulis file samping (hanya output crawl pembanding)
+    assert [path.name for path in tmp_path.iterdir()] == ['test_comments.csv']
+
+
+def test_verbose_prints_progress(options, capsys):
+    list(iter_comments(VIDEO_IDS[:1], verbose=True, **options))
+    assert 'MEMULAI CRAWLING' in capsys.readouterr().out
+
+
+def test_early_break_stops_crawl(fake_api, options):
+    video_ids = [vid for vid in benchmark_video_ids(300) if (fake_api.data.comment_count(vid) or 0) > 250][:3]
+    before = fake_api.stats['requests'].get('commentThreads', 0)
+    batches = iter_comments(video_ids, max_comments_per_video=10 ** 6, **options)
+    first = next(batches)
+    batches.close()
+
+    assert first
+    assert crawler_threads() == []
+    sent = fake_api.stats['requests'].get('commentThreads', 0) - before
+    # Halaman yang sempat diambil: halaman pertama + antrean prefetch, bukan seluruh video
+    assert sent <= 5 < sum(fake_api.data.comment_count(vid) // 100 + 1 for vid in video_ids)
+
+
+def test_as_frame_is_typed(options):
+    frames = list(iter_comments(VIDEO_IDS, as_frame=True, **options))
+    frame = pd.concat(frames, ignore_index=True)
+    assert str(frame['like_count'].dtype) == 'Int64'
+    assert str(frame['publish_date'].dtype).startswith('datetime64') and frame['publish_date'].dt.tz is not None
+    assert all(isinstance(batch['video_id'].dtype, pd.CategoricalDtype) for batch in frames)
+    assert frame['comment_id'].is_unique
+
+
+def test_async_variant(options, capsys):
+    expected = sorted(comment_key(row) for batch in iter_comments(VIDEO_IDS, **options) for row in batch)
+
+    async def collect(limit=None):
+        rows = []
+        async for batch in aiter_comments(VIDEO_IDS, **options):
+            rows.extend(batch)
+            if limit:
+                break
+        return rows
+
+    assert sorted(map(comment_key, asyncio.run(collect()))) == expected
+    assert asyncio.run(collect(limit=1))
+    assert crawler_threads() == []
+    assert capsys.readouterr().out == ''
+
+
+def test_unknown_option_rejected(options):
+    with pytest.raises(TypeError):
+        next(iter_comments(VIDEO_IDS, max_comment=5, **options))
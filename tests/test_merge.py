@@ -0,0 +1,64 @@
+"""Test --merge: gabungkan banyak output tanpa duplikat comment_id"""
+
+import pandas as pd
+import pytest
+
+from benchmark_crawler import benchmark_video_ids
+from youtube_comments_crawler import YouTubeCommentsCrawler
+
+
+@pytest.mark.parametrize('merged_name', ['merged.csv', 'merged.ndjson', 'merged.parquet', 'merged.db'])
+def test_merge_dedupes_across_files(make_crawler, tmp_path, merged_name):
+    if merged_name.endswith('.parquet'):
+        pytest.importorskip('pyarrow')
+    video_ids = benchmark_video_ids(8)
+    rows = {}
+    for prefix, output_format, videos in [('part1', 'csv', video_ids[:5]), ('part2', 'ndjson', video_ids[3:])]:
+        crawler = make_crawler(prefix=prefix, output={'format': output_format},
+                               attributes={'comment_id': True}, merge={'chunksize': 100})
+        crawler.start_crawling(videos)
+        rows.update((row['comment_id'], row) for row in crawler.results)
+
+    merger = YouTubeCommentsCrawler()
+    merger.config['merge']['chunksize'] = 100
+    merger.merge_outputs([str(tmp_path / 'part1.csv'), str(tmp_path / 'part2.ndjson')], str(tmp_path / merged_name))
+
+    merged = merger.load_output(str(tmp_path / merged_name))
+    assert merged['comment_id'].is_unique
+    assert set(merged['comment_id']) == set(rows)
+    likes = dict(zip(merged['comment_id'], merged['like_count']))
+    assert likes == {comment_id: row['like_count'] for comment_id, row in rows.items()}
+    assert not list(tmp_path.glob('*.seen.db'))
+
+
+def test_merge_without_comment_id_dedupes_by_content(tmp_path):
+    frame = pd.DataFrame({'comment_text': ['a', 'b', 'c'], 'author_name': ['x', 'y', 'z'],
+                          'publish_date': ['2025-01-01T00:00:00Z'] * 3, 'video_id': ['v'] * 3})
+    frame.to_csv(tmp_path / 'old1.csv', index=False)
+    frame.iloc[1:].to_csv(tmp_path / 'old2.csv', index=False)
+    merger = YouTubeCommentsCrawler()
+    merger.merge_outputs([str(tmp_path / 'old*.csv')], str(tmp_path / 'merged.csv'))
+    assert sorted(pd.read_csv(tmp_path / 'merged.csv')['comment_text']) == ['a', 'b', 'c']
+
+
+def test_merge_mixed_inputs_with_null_columns_to_parquet(tmp_path):
+    pytest.importorskip('pyarrow')
+    base = {'publish_date': '2025-01-01T00:00:00Z', 'video_id': 'v', 'like_count': 1}
+    # File lama: tanpa comment_id dan parent_id kosong semua
+    pd.DataFrame([dict(base, comment_text='lama', parent_id=None)]).to_csv(tmp_path / 'a.csv', index=False)
+    pd.DataFrame([dict(base, comment_id='c1', comment_text='utama', parent_id=None, language='id'),
+                  dict(base, comment_id='c1.r1', comment_text='balasan', parent_id='c1', language='en')]
+                 ).to_json(tmp_path / 'b.ndjson', orient='records', lines=True)
+    pd.DataFrame([dict(base, comment_id='c2', comment_text='parquet', parent_id='c1', like_count=None)]
+                 ).to_parquet(tmp_path / 'c.parquet', index=False)
+
+    merger = YouTubeCommentsCrawler()
+    merger.config['merge']['chunksize'] = 1
+    merger.merge_outputs([str(tmp_path / 'a.csv'), str(tmp_path / 'b.ndjson'), str(tmp_path / 'c.parquet')],
+                         str(tmp_path / 'merged.parquet'))
+
+    merged = pd.read_parquet(tmp_path / 'merged.parquet')
+    assert sorted(merged['comment_text']) == ['balasan', 'lama', 'parquet', 'utama']
+    assert merged['parent_id'].dropna().tolist() == ['c1', 'c1']
+    assert str(merged['like_count'].dtype).lower() == 'int64'
+    assert str(merged['publish_date'].dt.tz) == 'UTC'
@@ -0,0 +1,41 @@
+"""Test instrumentasi CrawlMetrics dan ekspor metrik run"""
+
+import json
+
+from benchmark_crawler import benchmark_video_ids
+from youtube_comments_crawler import CrawlMetrics
+
+
+def test_histogram_and_counters():
+    metrics = CrawlMetrics()
+    for seconds in (0.0002, 0.003, 0.003, 0.2, 3.0):
+        metrics.observe('execute', seconds)
+    metrics.incr('api_requests', endpoint='videos')
+    metrics.incr('api_requests', 2, endpoint='commentThreads')
+
+    assert metrics.counter('api_requests') == 3
+    assert metrics.counter('api_requests', endpoint='videos') == 1
+    assert metrics.quantile('execute', 0.5) == 0.005
+    assert metrics.quantile('execute', 1.0) == 5.0
+    stage = metrics.to_dict()['stages']['execute']
+    assert stage['count'] == 5 and sum(stage['histogram'].values()) == 5
+    prom = metrics.to_prometheus()
+    assert 'youtube_crawler_stage_duration_seconds_bucket{stage="execute",le="+Inf"} 5' in prom
+    assert 'youtube_crawler_api_requests_total{endpoint="commentThreads"} 2' in prom
+
+
+def test_crawl_metrics_export(make_crawler, fake_api, tmp_path):
+    before = sum(fake_api.stats['requests'].values())
+    crawler = make_crawler(prefix='metrics_run', metrics={'export': True})
+    crawler.start_crawling(benchmark_video_ids(5))
+    sent = sum(fake_api.stats['requests'].values()) - before
+
+    report = json.loads((tmp_path / 'metrics_run_metrics.json').read_text(encoding='utf-8'))
+    counters = report['metrics']['counters']
+    stages = report['metrics']['stages']
+    assert sum(value for name, value in counters.items() if name.startswith('api_requests')) == sent
+    assert report['stats']['api_calls'] == sent
+    main_comments = sum(1 for row in crawler.results if row['comment_type'] == 'main_comment')
+    assert stages['process_comment_item']['count'] == main_comments
+    assert stages['execute']['count'] == sent
+    assert (tmp_path / 'metrics_run_metrics.prom').read_text(encoding='utf-8').startswith('# HELP')
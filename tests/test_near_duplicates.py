@@ -0,0 +1,52 @@
+"""Test deteksi komentar hampir sama (MinHash LSH)"""
+
+from benchmark_crawler import benchmark_video_ids
+from youtube_comments_crawler import NearDuplicateDetector
+
+SPAM = 'Cek channel saya untuk giveaway gratis pulsa 100 ribu, klik link di bio sekarang juga ya!'
+TEXTS = [
+    SPAM,
+    'Penjelasan tentang integral parsial di menit 12 sangat membantu tugas kuliah saya minggu ini',
+    'cek CHANNEL saya untuk giveaway gratis pulsa 100 ribu,   klik link di bio sekarang juga ya!!',
+    'The bridge at 2:30 gives me chills every single time, what an incredible arrangement',
+    'Cek channel saya untuk giveaway gratis pulsa 100 ribu, klik link di bio sekarang juga ya!',
+    'ok',
+    None,
+]
+
+
+def clusters(detector, texts):
+    rows = [{'comment_text': text} for text in texts]
+    detector.consume(rows, [])
+    return [row['near_dup_cluster'] for row in rows]
+
+
+def test_near_duplicates_share_cluster(tmp_path):
+    detector = NearDuplicateDetector(str(tmp_path / 'lsh.db'), temporary=True)
+    result = clusters(detector, TEXTS)
+    assert result[0] == result[2] == result[4]
+    assert len({result[0], result[1], result[3]}) == 3
+    assert result[5] is None and result[6] is None
+    assert detector.duplicates == 2
+
+    # Batch berikutnya (mis. video lain) memakai index band yang sama
+    assert clusters(detector, [SPAM.upper(), TEXTS[1]]) == [result[0], result[1]]
+    detector.close()
+    assert not (tmp_path / 'lsh.db').exists()
+
+
+def test_signatures_are_deterministic(tmp_path):
+    first = NearDuplicateDetector(str(tmp_path / 'a.db'), temporary=True)
+    second = NearDuplicateDetector(str(tmp_path / 'b.db'), temporary=True)
+    signatures, valid = first.signatures(TEXTS)
+    assert signatures.shape == (int(valid.sum()), 64)
+    assert (signatures == second.signatures(TEXTS)[0]).all()
+    first.close()
+    second.close()
+
+
+def test_cluster_column_in_crawl(make_crawler, tmp_path):
+    crawler = make_crawler(attributes={'near_dup_cluster': True})
+    crawler.start_crawling(benchmark_video_ids(3))
+    assert crawler.results and all('near_dup_cluster' in row for row in crawler.results)
+    assert not list(tmp_path.glob('*_lsh.db'))
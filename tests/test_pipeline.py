@@ -0,0 +1,48 @@
+"""Test pipeline prefetch: halaman berikutnya di-fetch sambil halaman saat ini diproses"""
+
+import threading
+
+from benchmark_crawler import benchmark_video_ids
+from conftest import comment_key
+
+
+def fetch_threads():
+    return [thread for thread in threading.enumerate() if thread.name.startswith('fetch')]
+
+
+def test_prefetch_output_matches_sequential(make_crawler):
+    video_ids = benchmark_video_ids(6)
+    results = {}
+    for prefetch in (False, True):
+        crawler = make_crawler(prefix=f'prefetch_{prefetch}', pipeline={'prefetch': prefetch, 'queue_size': 1})
+        crawler.start_crawling(video_ids)
+        results[prefetch] = [comment_key(row) for row in crawler.results]
+    assert results[True] == results[False]
+    assert len(results[True]) > 0
+
+
+def test_concurrent_workers_match_sequential(make_crawler):
+    video_ids = benchmark_video_ids(8)
+    sequential = make_crawler(prefix='sequential')
+    sequential.start_crawling(video_ids)
+    concurrent = make_crawler(prefix='concurrent', scheduling={'workers': 3})
+    concurrent.start_crawling(video_ids)
+    assert sorted(map(comment_key, concurrent.results)) == sorted(map(comment_key, sequential.results))
+
+
+def test_fetch_pool_shut_down_after_crawl(make_crawler):
+    crawler = make_crawler(scheduling={'workers': 2})
+    crawler.start_crawling(benchmark_video_ids(4))
+    assert crawler._fetch_executor is None
+    assert fetch_threads() == []
+
+
+def test_prefetch_stops_early_at_max_comments(make_crawler, fake_api):
+    video_id = max(benchmark_video_ids(300), key=lambda vid: fake_api.data.comment_count(vid) or 0)
+    crawler = make_crawler(include_replies=False, max_comments_per_video=150)
+    comments, api_calls = crawler.get_video_comments(video_id, crawler.get_video_info(video_id))
+    assert len(comments) == 150
+    # 2 halaman terpakai, paling banyak queue_size + 1 halaman ekstra yang sudah di-prefetch
+    assert api_calls <= 2 + crawler.config['pipeline']['queue_size'] + 1
+    crawler.shutdown_fetch_pool()
+    assert fetch_threads() == []
@@ -0,0 +1,23 @@
+"""Test mode --profile (cProfile + tracemalloc)"""
+
+import pstats
+import re
+
+from benchmark_crawler import benchmark_video_ids
+
+
+def test_profiled_crawl_writes_reports(make_crawler, tmp_path):
+    crawler = make_crawler(prefix='profiled', scheduling={'workers': 3})
+    crawler.run_profiled(crawler.start_crawling, benchmark_video_ids(4))
+
+    # Profiling memaksa crawling serial agar semua tahap transformasi terukur
+    assert crawler.config['scheduling']['workers'] == 1
+    assert crawler.config['pipeline']['prefetch'] is False
+    stats = pstats.Stats(str(tmp_path / 'profiled_profile.pstats'))
+    assert any(name == 'process_comment_item' for _, _, name in stats.stats)
+
+    report = (tmp_path / 'profiled_profile.txt').read_text(encoding='utf-8')
+    main_comments = sum(1 for row in crawler.results if row['comment_type'] == 'main_comment')
+    calls = int(re.search(r'^process_comment_item\s+(\d+) calls', report, re.M).group(1))
+    assert calls == main_comments
+    assert 'Peak traced memory' in report
@@ -0,0 +1,51 @@
+"""Test --refresh: like_count/updated_at/reply_count diperbarui in-place"""
+
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from benchmark_crawler import benchmark_video_ids
+
+
+def crawl(make_crawler, output_format):
+    crawler = make_crawler(prefix='store', output={'format': output_format}, attributes={'comment_id': True})
+    crawler.start_crawling(benchmark_video_ids(4))
+    return {row['comment_id']: row for row in crawler.results}
+
+
+def test_refresh_sqlite(make_crawler, fake_api, tmp_path):
+    expected = crawl(make_crawler, 'sqlite')
+    store = str(tmp_path / 'store.db')
+    with sqlite3.connect(store) as conn:
+        conn.execute('UPDATE comments SET like_count = -1, reply_count = -1')
+
+    before = dict(fake_api.stats['requests'])
+    make_crawler(prefix='refresh').refresh_engagement(store)
+    requests = {key: count - before.get(key, 0) for key, count in fake_api.stats['requests'].items()}
+
+    with sqlite3.connect(store) as conn:
+        refreshed = dict(conn.execute('SELECT comment_id, like_count FROM comments'))
+        reply_counts = dict(conn.execute("SELECT comment_id, reply_count FROM comments WHERE comment_type = 'main_comment'"))
+    assert refreshed == {comment_id: row['like_count'] for comment_id, row in expected.items()}
+    assert reply_counts == {comment_id: row['reply_count'] for comment_id, row in expected.items()
+                            if row['comment_type'] == 'main_comment'}
+    main = sum(1 for row in expected.values() if row['comment_type'] == 'main_comment')
+    assert requests['commentThreads'] == -(-main // 50)
+    assert requests['comments'] == -(-(len(expected) - main) // 50)
+
+
+def test_refresh_parquet(make_crawler, tmp_path):
+    pytest.importorskip('pyarrow')
+    expected = crawl(make_crawler, 'parquet')
+    store = str(tmp_path / 'store.parquet')
+    df = pd.read_parquet(store)
+    dtypes = df.dtypes.to_dict()
+    df['like_count'] = -1
+    df.astype(dtypes).to_parquet(store, index=False)
+
+    make_crawler(prefix='refresh').refresh_engagement(store)
+    df = pd.read_parquet(store)
+    assert df.dtypes.to_dict() == dtypes
+    assert dict(zip(df['comment_id'], df['like_count'])) == {
+        comment_id: row['like_count'] for comment_id, row in expected.items()}
@@ -0,0 +1,57 @@
+"""Test mode sampling berstrata dan kolom sampling_weight"""
+
+import pandas as pd
+import pytest
+
+from benchmark_crawler import benchmark_video_ids
+
+VIDEO_IDS = benchmark_video_ids(40)
+
+
+def weights_per_video(crawler):
+    frame = pd.DataFrame(crawler.results)
+    return frame.groupby('video_id')['sampling_weight'].sum()
+
+
+def test_full_fraction_weights_sum_to_comment_count(make_crawler, fake_api):
+    crawler = make_crawler(sampling={'enabled': True, 'video_fraction': 1.0}, max_comments_per_video=10 ** 6)
+    crawler.start_crawling(VIDEO_IDS)
+    counts = {vid: fake_api.data.comment_count(vid) for vid in VIDEO_IDS if fake_api.data.comment_count(vid)}
+    weights = weights_per_video(crawler)
+    assert set(weights.index) == set(counts)
+    assert weights.sum() == pytest.approx(sum(counts.values()), rel=1e-4)
+
+
+def test_fractional_sample_crawls_selected_videos_fully(make_crawler, fake_api):
+    # Cluster sample: max_comments_per_video tidak memotong video terpilih
+    crawler = make_crawler(sampling={'enabled': True, 'video_fraction': 0.3, 'strata': [20, 60]},
+                           max_comments_per_video=5)
+    crawler.start_crawling(VIDEO_IDS)
+    counts = {vid: fake_api.data.comment_count(vid) for vid in VIDEO_IDS if fake_api.data.comment_count(vid)}
+    weights = weights_per_video(crawler)
+    assert 0 < len(weights) < len(counts)
+
+    frame = pd.DataFrame(crawler.results)
+    assert not frame['sample_truncated'].any()
+    assert frame.groupby('video_id').size().max() > 5
+    # Bobot video = N_h / n_h per strata; jumlah bobot video menaksir jumlah video populasi
+    video_weight = {vid: weights[vid] / counts[vid] for vid in weights.index}
+    assert sum(video_weight.values()) == pytest.approx(len(counts), rel=1e-4)
+    assert frame.groupby('video_id')['sampling_weight'].nunique().eq(1).all()
+
+
+def test_comment_quota_marks_truncated_videos(make_crawler, fake_api):
+    comments = 200
+    crawler = make_crawler(sampling={'enabled': True, 'video_fraction': 0.3, 'comments': comments,
+                                     'strata': [20, 60]})
+    crawler.start_crawling(VIDEO_IDS)
+    frame = pd.DataFrame(crawler.results)
+    videos = frame['video_id'].nunique()
+    # Kuota komentar dibagi sebanding commentCount (dibulatkan ke atas per video)
+    assert frame['comment_type'].eq('main_comment').sum() <= comments + videos
+
+    # Video yang terpotong kuota ditandai; baris satu video punya penanda yang sama
+    truncated = frame.groupby('video_id')['sample_truncated'].agg(['min', 'max'])
+    assert (truncated['min'] == truncated['max']).all()
+    assert truncated['max'].any()
+    assert set(truncated.index[truncated['max']]).isdisjoint(crawler.completed_videos)
@@ -0,0 +1,49 @@
+"""Test penjadwalan video berdasarkan commentCount"""
+
+import math
+
+from benchmark_crawler import benchmark_video_ids
+
+
+def record_thread_requests(monkeypatch, server):
+    """Catat videoId setiap request commentThreads ke fake API"""
+    requested = []
+    original = server.comment_threads
+
+    def comment_threads(params):
+        requested.append(params.get('videoId'))
+        return original(params)
+
+    monkeypatch.setattr(server, 'comment_threads', comment_threads)
+    return requested
+
+
+def test_empty_and_disabled_videos_skipped_without_thread_request(make_crawler, fake_api, monkeypatch):
+    video_ids = benchmark_video_ids(6)
+    requested = record_thread_requests(monkeypatch, fake_api)
+    crawler = make_crawler(include_replies=False)
+    crawler.start_crawling(video_ids)
+
+    assert 'emptyVideo1' not in requested and 'nocomVideo1' not in requested
+    crawled = {row['video_id'] for row in crawler.results}
+    assert crawled == set(video_ids) - {'emptyVideo1', 'nocomVideo1'}
+
+
+def test_largest_first_order(make_crawler, fake_api, monkeypatch):
+    video_ids = benchmark_video_ids(8)
+    requested = record_thread_requests(monkeypatch, fake_api)
+    crawler = make_crawler(include_replies=False, max_comments_per_video=10 ** 6)
+    crawler.start_crawling(video_ids)
+
+    counts = {vid: fake_api.data.comment_count(vid) for vid in video_ids if fake_api.data.comment_count(vid)}
+    expected = sorted(counts, key=lambda vid: (-max(1, math.ceil(counts[vid] / 100)), -counts[vid],
+                                               video_ids.index(vid)))
+    assert list(dict.fromkeys(requested)) == expected
+
+
+def test_schedule_input_order_keeps_empty_when_not_skipping(make_crawler, fake_api):
+    video_ids = benchmark_video_ids(6)
+    crawler = make_crawler(scheduling={'priority': 'input', 'skip_empty': False})
+    infos, _ = crawler.get_videos_info(video_ids)
+    jobs = crawler.schedule_videos(video_ids, infos)
+    assert [job['video_id'] for job in jobs] == video_ids
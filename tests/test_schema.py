@@ -0,0 +1,70 @@
+"""Test skema output bertipe (OUTPUT_SCHEMA) dan round-trip parquet"""
+
+import pandas as pd
+import pytest
+
+from benchmark_crawler import benchmark_video_ids
+from youtube_comments_crawler import OUTPUT_SCHEMA, apply_output_schema
+
+
+def expected_dtype(kind):
+    return {'datetime_utc': 'datetime64[ns, UTC]', 'datetime': 'datetime64[ns]'}.get(kind, kind)
+
+
+def test_apply_output_schema_dtypes():
+    frame = pd.DataFrame({
+        'publish_date': ['2025-03-01T10:00:00Z', ''],
+        'crawl_timestamp': ['2025-03-01T17:00:00.123456', '2025-03-01T17:00:01'],
+        'like_count': [3, None],
+        'has_links': [True, None],
+        'video_id': ['a', 'a'],
+        'comment_text': ['x', 'y'],
+    })
+    text_dtype = frame['comment_text'].dtype
+    typed = apply_output_schema(frame)
+    assert str(typed['publish_date'].dtype).startswith('datetime64') and typed['publish_date'].dt.tz is not None
+    assert typed['publish_date'].isna().tolist() == [False, True]
+    assert typed['crawl_timestamp'].dt.tz is None
+    assert str(typed['like_count'].dtype) == 'Int64' and typed['like_count'].isna().tolist() == [False, True]
+    assert str(typed['has_links'].dtype) == 'boolean'
+    assert isinstance(typed['video_id'].dtype, pd.CategoricalDtype)
+    # Kolom di luar skema tidak diubah
+    assert typed['comment_text'].dtype == text_dtype
+
+
+def test_crawl_output_is_typed(make_crawler):
+    crawler = make_crawler(attributes={'comment_id': True})
+    crawler.start_crawling(benchmark_video_ids(5))
+    df = crawler.build_dataframe(crawler.results)
+    for column, kind in OUTPUT_SCHEMA.items():
+        if column not in df.columns:
+            continue
+        if kind.startswith('datetime'):
+            assert str(df[column].dtype).startswith('datetime64'), column
+            assert (df[column].dt.tz is not None) == (kind == 'datetime_utc'), column
+        elif kind == 'category':
+            assert isinstance(df[column].dtype, pd.CategoricalDtype), column
+        else:
+            assert str(df[column].dtype) == kind, column
+    assert len(df) == len(crawler.results)
+
+
+def test_parquet_round_trip(make_crawler, tmp_path):
+    pytest.importorskip('pyarrow')
+    crawler = make_crawler(prefix='typed', attributes={'comment_id': True}, output={'format': 'parquet'})
+    crawler.start_crawling(benchmark_video_ids(5))
+    expected = crawler.build_dataframe(crawler.results)
+
+    loaded = crawler.load_output(str(tmp_path / 'typed.parquet'))
+    assert list(loaded.columns) == list(expected.columns)
+    for column in expected.columns:
+        assert str(loaded[column].dtype) == str(expected[column].dtype), column
+    pd.testing.assert_frame_equal(loaded.reset_index(drop=True), expected.reset_index(drop=True),
+                                  check_categorical=False)
+
+    csv_crawler = make_crawler(prefix='text', attributes={'comment_id': True})
+    csv_crawler.start_crawling(benchmark_video_ids(5))
+    from_csv = csv_crawler.load_output(str(tmp_path / 'text.csv'))
+    assert from_csv['comment_id'].tolist() == loaded['comment_id'].tolist()
+    assert from_csv['like_count'].tolist() == loaded['like_count'].tolist()
+    assert (from_csv['publish_date'] == loaded['publish_date']).all()
@@ -0,0 +1,44 @@
+"""Test index full-text FTS5 dan search_comments"""
+
+from benchmark_crawler import benchmark_video_ids
+
+
+def matching(rows, word, **filters):
+    return {row['comment_id'] for row in rows
+            if word in row['comment_text'].lower().split()
+            and all(predicate(row) for predicate in filters.values())}
+
+
+def search_ids(crawler, index_path, query, **filters):
+    return {result['comment_id'] for result in crawler.search_comments(index_path, query, limit=10 ** 6, **filters)}
+
+
+def test_search_with_filters(make_crawler, tmp_path):
+    index_path = str(tmp_path / 'search.db')
+    crawler = make_crawler(search={'enabled': True, 'index': index_path})
+    crawler.start_crawling(benchmark_video_ids(5))
+    rows = crawler.results
+    video_id = rows[0]['video_id']
+    author = rows[0]['author_channel_id']
+
+    assert matching(rows, 'mantap')
+    assert search_ids(crawler, index_path, 'mantap') == matching(rows, 'mantap')
+    assert search_ids(crawler, index_path, 'mantap AND keren') == (matching(rows, 'mantap') & matching(rows, 'keren'))
+    assert search_ids(crawler, index_path, 'mantap', video_id=video_id) == matching(
+        rows, 'mantap', video=lambda row: row['video_id'] == video_id)
+    assert search_ids(crawler, index_path, rows[0]['comment_text'].split()[0], author=author) <= {
+        row['comment_id'] for row in rows if row['author_channel_id'] == author}
+    assert search_ids(crawler, index_path, 'mantap', since='2025-03-01', until='2025-03-31') == matching(
+        rows, 'mantap', date=lambda row: '2025-03-01' <= row['publish_date'][:10] <= '2025-03-31')
+
+    results = crawler.search_comments(index_path, 'mantap', limit=5)
+    assert len(results) == 5
+    assert [r['score'] for r in results] == sorted(r['score'] for r in results)
+
+
+def test_recrawl_updates_index_without_duplicates(make_crawler, tmp_path):
+    index_path = str(tmp_path / 'search.db')
+    for prefix in ('first', 'second'):
+        crawler = make_crawler(prefix=prefix, search={'enabled': True, 'index': index_path})
+        crawler.start_crawling(benchmark_video_ids(3))
+    assert search_ids(crawler, index_path, 'mantap') == matching(crawler.results, 'mantap')
@@ -0,0 +1,105 @@
+"""Test sink output streaming (file/sqlite/spool) dan backpressure BufferedSink"""
+
+import glob
+import json
+import sqlite3
+import threading
+
+import pandas as pd
+import pytest
+
+from benchmark_crawler import benchmark_video_ids
+from youtube_comments_crawler import BufferedSink, FileSink, OutputSink
+
+VIDEO_IDS = benchmark_video_ids(5)
+
+
+class SlowSink(OutputSink):
+    """Sink yang menahan setiap write sampai release di-set"""
+
+    def __init__(self):
+        super().__init__('<slow>')
+        self.release = threading.Event()
+        self.batches = []
+
+    def write_batch(self, rows):
+        self.release.wait()
+        self.batches.append(rows)
+        self.rows += len(rows)
+
+
+def test_output_sink_is_abstract():
+    with pytest.raises(TypeError):
+        OutputSink('x')
+
+    class Incomplete(OutputSink):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete('x')
+
+
+def read_sqlite(path):
+    with sqlite3.connect(path) as conn:
+        return pd.read_sql_query('SELECT * FROM comments', conn)
+
+
+def read_spool(path):
+    lines = [line for name in sorted(glob.glob(f'{path}/*.ndjson')) for line in open(name, encoding='utf-8')]
+    assert not glob.glob(f'{path}/*.part')
+    return pd.DataFrame([json.loads(line) for line in lines])
+
+
+@pytest.mark.parametrize('kind,path,reader', [
+    ('file', 'stream.csv', pd.read_csv),
+    ('sqlite', 'stream.db', read_sqlite),
+    ('spool', 'stream_spool', read_spool),
+])
+def test_sink_round_trip_matches_in_memory(make_crawler, tmp_path, kind, path, reader):
+    memory = make_crawler(prefix='memory', attributes={'comment_id': True})
+    memory.start_crawling(VIDEO_IDS)
+    expected = pd.DataFrame(memory.results).set_index('comment_id')
+
+    streamed = make_crawler(prefix='stream', attributes={'comment_id': True}, output={'sink': kind})
+    streamed.start_crawling(VIDEO_IDS)
+    assert streamed.results == []
+    output = reader(str(tmp_path / path)).set_index('comment_id')
+    assert output.index.is_unique
+    assert sorted(output.index) == sorted(expected.index)
+    assert output['like_count'].astype(int).to_dict() == expected['like_count'].to_dict()
+    assert output['comment_text'].fillna('').to_dict() == expected['comment_text'].to_dict()
+
+
+def test_buffered_sink_backpressure():
+    sink = SlowSink()
+    buffered = BufferedSink(sink, max_rows=10, flush_interval=0.05)
+    buffered.write_batch([{'n': i} for i in range(8)])
+
+    writer = threading.Thread(target=buffered.write_batch, args=([{'n': i} for i in range(8, 13)],))
+    writer.start()
+    writer.join(0.3)
+    # 8 + 5 baris melebihi max_rows selama batch pertama belum ditulis
+    assert writer.is_alive()
+
+    sink.release.set()
+    writer.join(5)
+    assert not writer.is_alive()
+    buffered.close()
+    assert buffered.rows == 13
+    assert [row['n'] for batch in sink.batches for row in batch] == list(range(13))
+
+
+def test_file_sink_parquet_first_batch_null_parent_id(tmp_path):
+    pytest.importorskip('pyarrow')
+    sink = FileSink(str(tmp_path / 'out.parquet'), ['sentiment_score'])
+    main = {'comment_id': 'c1', 'comment_text': 'utama', 'parent_id': None, 'like_count': 3,
+            'publish_date': '2025-01-01T00:00:00Z', 'video_id': 'v', 'is_pinned': False}
+    sink.write_batch([main, dict(main, comment_id='c2')])
+    sink.write_batch([dict(main, comment_id='c1.r1', parent_id='c1', like_count=None, sentiment_score=0.5)])
+    sink.close()
+
+    frame = pd.read_parquet(tmp_path / 'out.parquet')
+    assert frame['comment_id'].tolist() == ['c1', 'c2', 'c1.r1']
+    assert frame['parent_id'].tolist()[2] == 'c1'
+    assert frame['sentiment_score'].tolist()[2] == 0.5
+    assert frame['like_count'].isna().tolist() == [False, False, True]
@@ -0,0 +1,35 @@
+"""Test startup cepat: import lazy dan cache validasi API key"""
+
+import subprocess
+import sys
+
+from conftest import ROOT
+
+API_KEY = 'AIza' + 'x' * 35
+
+
+def test_heavy_dependencies_not_imported_at_startup():
+    code = ('import sys, youtube_comments_crawler; '
+            'print(",".join(m for m in ("pandas", "googleapiclient", "textblob") if m in sys.modules))')
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ''
+
+
+def test_api_key_validation_is_cached(make_crawler, fake_api):
+    def channels():
+        return fake_api.stats['requests'].get('channels', 0)
+
+    crawler = make_crawler()
+    before = channels()
+    assert crawler.validate_api_key(API_KEY)
+    assert channels() == before + 1
+    assert crawler.is_api_key_validation_cached(API_KEY)
+    assert not crawler.is_api_key_validation_cached(API_KEY[::-1])
+
+    # Validasi berikutnya dari cache, tanpa request
+    assert make_crawler().validate_api_key(API_KEY)
+    assert channels() == before + 1
+
+    # TTL 0 = selalu validasi ulang
+    assert make_crawler(api={'validation_ttl': 0}).validate_api_key(API_KEY)
+    assert channels() == before + 2
@@ -0,0 +1,65 @@
+"""Test index thread CSR (ThreadIndex) dan urutan kolom default"""
+
+import pandas as pd
+
+from benchmark_crawler import benchmark_video_ids
+
+BASELINE_COLUMNS = [
+    'comment_text', 'author_name', 'author_channel_id', 'author_channel_url', 'author_profile_image_url',
+    'author_is_verified', 'author_is_channel_owner', 'author_is_sponsor', 'is_liked_by_creator',
+    'is_hearted_by_creator', 'is_pinned', 'publish_date', 'updated_at', 'like_count', 'reply_count',
+    'parent_id', 'video_id', 'video_title', 'video_url', 'channel_id', 'channel_title',
+]
+
+
+def test_thread_index_is_opt_in(make_crawler, tmp_path):
+    crawler = make_crawler(prefix='plain')
+    crawler.start_crawling(benchmark_video_ids(3))
+    assert not list(tmp_path.glob('plain_thread_index*'))
+    assert not crawler.config['attributes']['comment_id']
+
+    columns = list(pd.read_csv(tmp_path / 'plain.csv', nrows=0).columns)
+    assert 'comment_id' not in columns and 'thread_id' not in columns
+    columns = list(next(row for row in crawler.results if row['comment_type'] == 'main_comment'))
+    assert columns[:len(BASELINE_COLUMNS)] == BASELINE_COLUMNS
+    assert columns[-2:] == ['crawl_timestamp', 'comment_type']
+    assert columns.index('word_count') < columns.index('crawl_timestamp')
+
+
+def test_thread_index_csr_matches_replies(make_crawler, tmp_path):
+    crawler = make_crawler(prefix='thr', threads={'enabled': True})
+    crawler.start_crawling(benchmark_video_ids(5))
+    assert crawler.config['attributes']['comment_id'] and crawler.config['attributes']['parent_id']
+    rows = crawler.results
+
+    # Reply menunjuk ke comment_id komentar utama thread-nya, dan datang tepat sesudahnya
+    replies = {}
+    current = None
+    for row in rows:
+        if row['comment_type'] == 'main_comment':
+            current = row['comment_id']
+            replies[current] = []
+        else:
+            assert row['parent_id'] == current
+            replies[current].append(row['comment_id'])
+    assert any(replies.values())
+    # Urutan kronologis API (nomor reply naik) tetap terjaga
+    for thread_replies in replies.values():
+        assert thread_replies == sorted(thread_replies)
+
+    index = pd.read_csv(tmp_path / 'thr_thread_index.csv')
+    assert len(index) == len(rows)
+    node_ids = index['comment_id'].tolist()
+    roots = index[index['parent_node'] < 0]
+    assert set(roots['comment_id']) == set(replies)
+    for node in roots.itertuples():
+        children = node_ids[node.child_offset:node.child_offset + node.child_count]
+        assert children == replies[node.comment_id]
+        assert node.thread_size == len(children) + 1
+        assert node.depth == 0
+
+    reply_nodes = index[index['parent_node'] >= 0]
+    assert (reply_nodes['depth'] == 1).all()
+    assert (reply_nodes['child_count'] == 0).all()
+    assert (index.loc[reply_nodes['parent_node'], 'comment_id'].to_numpy()
+            == reply_nodes['comment_id'].str.split('.').str[0].to_numpy()).all()
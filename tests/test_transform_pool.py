@@ -0,0 +1,70 @@
+"""Test transformasi halaman di process pool (pipelined) vs di thread crawling"""
+
+from benchmark_crawler import benchmark_video_ids
+from conftest import comment_key
+from test_channel import CHANNEL_ID
+
+
+def big_videos(fake_api, count, minimum=250):
+    return [vid for vid in benchmark_video_ids(300) if (fake_api.data.comment_count(vid) or 0) > minimum][:count]
+
+
+def track_in_flight(crawler):
+    """Catat jumlah maksimal Future transformasi yang belum selesai sekaligus"""
+    pending = []
+    peak = [0]
+    submit = crawler.submit_transform
+
+    def submit_transform(*args, **kwargs):
+        pending[:] = [future for future in pending if not future.done()]
+        future = submit(*args, **kwargs)
+        pending.append(future)
+        peak[0] = max(peak[0], len(pending))
+        return future
+
+    crawler.submit_transform = submit_transform
+    return peak
+
+
+def crawl(make_crawler, prefix, workers, video_ids, **overrides):
+    crawler = make_crawler(prefix=prefix, attributes={'comment_id': True},
+                           pipeline={'transform_workers': workers}, **overrides)
+    peak = track_in_flight(crawler)
+    crawler.start_crawling(video_ids)
+    return crawler, peak[0]
+
+
+def test_pool_matches_in_thread(make_crawler, fake_api):
+    video_ids = big_videos(fake_api, 2) + benchmark_video_ids(4)
+    local, _ = crawl(make_crawler, 'local', 0, video_ids, max_comments_per_video=10 ** 6)
+    pooled, peak = crawl(make_crawler, 'pooled', 2, video_ids, max_comments_per_video=10 ** 6)
+
+    assert [comment_key(row) for row in pooled.results] == [comment_key(row) for row in local.results]
+    # Beberapa halaman satu video ditransformasi bersamaan
+    assert peak > 1
+    assert pooled.stats['total_replies'] == local.stats['total_replies']
+
+    # Metrik worker digabung ke metrics proses induk
+    stages = pooled.metrics.to_dict()['stages']
+    main_comments = sum(1 for row in pooled.results if row['comment_type'] == 'main_comment')
+    assert stages['process_comment_item']['count'] == main_comments
+    assert stages['process_reply_item']['count'] == pooled.stats['total_replies']
+    assert stages['batch_features']['count'] == stages['transform_page']['count']
+
+
+def test_pool_honors_max_comments(make_crawler, fake_api):
+    video_ids = big_videos(fake_api, 2)
+    local, _ = crawl(make_crawler, 'local', 0, video_ids, max_comments_per_video=230)
+    pooled, _ = crawl(make_crawler, 'pooled', 2, video_ids, max_comments_per_video=230)
+    assert [comment_key(row) for row in pooled.results] == [comment_key(row) for row in local.results]
+    assert all(sum(1 for row in pooled.results if row['video_id'] == vid) == 230 for vid in video_ids)
+    assert pooled.stats['total_replies'] == local.stats['total_replies']
+
+
+def test_pool_channel_mode(make_crawler):
+    local = make_crawler(prefix='local', max_comments_per_channel=700)
+    local.start_channel_crawling(CHANNEL_ID)
+    pooled = make_crawler(prefix='pooled', max_comments_per_channel=700, pipeline={'transform_workers': 2})
+    pooled.start_channel_crawling(CHANNEL_ID)
+    assert len(pooled.results) == 700
+    assert [comment_key(row) for row in pooled.results] == [comment_key(row) for row in local.results]
@@ -0,0 +1,134 @@
+"""Test ingestion URL video dari file .xlsx dan .txt"""
+
+import zipfile
+from xml.sax.saxutils import escape
+
+import pandas as pd
+import pytest
+
+from youtube_comments_crawler import YouTubeCommentsCrawler
+
+URLS = [
+    'https://www.youtube.com/watch?v=dQw4w9WgXcQ',
+    'https://youtu.be/9bZkp7q19f0',
+    'https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=42s',
+    'bukan url',
+    'https://www.youtube.com/embed/abcdefghijk',
+]
+EXPECTED = [URLS[0], URLS[1], URLS[4]]
+
+CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>
+<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>
+</Types>"""
+ROOT_RELS = """<?xml version="1.0" encoding="UTF-8"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>
+</Relationships>"""
+WORKBOOK = """<?xml version="1.0" encoding="UTF-8"?>
+<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+ xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">
+<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets>
+</workbook>"""
+WORKBOOK_RELS = """<?xml version="1.0" encoding="UTF-8"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>
+</Relationships>"""
+
+SHARED_STRINGS_TYPE = ('<Override PartName="/xl/sharedStrings.xml" ContentType="application/'
+                       'vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>')
+SHARED_STRINGS_REL = ('<Relationship Id="rId2" Target="sharedStrings.xml" Type="http://schemas.'
+                      'openxmlformats.org/officeDocument/2006/relationships/sharedStrings"/>')
+
+
+def inline_cell(value):
+    return f'<c t="inlineStr"><is><t>{escape(value)}</t></is></c>'
+
+
+def write_xlsx_without_refs(path, rows, shared_strings=None):
+    """Tulis .xlsx minimal tanpa atribut r di <row> maupun <c>; sel string menjadi inline string"""
+    cells = ''.join(
+        '<row>' + ''.join(inline_cell(value) if isinstance(value, str) else value.xml for value in row) + '</row>'
+        for row in rows)
+    sheet = ('<?xml version="1.0" encoding="UTF-8"?>'
+             '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+             f'<sheetData>{cells}</sheetData></worksheet>')
+    content_types, workbook_rels = CONTENT_TYPES, WORKBOOK_RELS
+    with zipfile.ZipFile(path, 'w') as archive:
+        if shared_strings:
+            archive.writestr('xl/sharedStrings.xml', shared_strings)
+            content_types = content_types.replace('</Types>', SHARED_STRINGS_TYPE + '</Types>')
+            workbook_rels = workbook_rels.replace('</Relationships>', SHARED_STRINGS_REL + '</Relationships>')
+        archive.writestr('[Content_Types].xml', content_types)
+        archive.writestr('_rels/.rels', ROOT_RELS)
+        archive.writestr('xl/workbook.xml', WORKBOOK)
+        archive.writestr('xl/_rels/workbook.xml.rels', workbook_rels)
+        archive.writestr('xl/worksheets/sheet1.xml', sheet)
+
+
+def test_xlsx_cells_without_reference_attribute(tmp_path):
+    path = tmp_path / 'urls.xlsx'
+    write_xlsx_without_refs(path, [['No', 'Video URL']] + [[str(i), url] for i, url in enumerate(URLS, 1)])
+    crawler = YouTubeCommentsCrawler()
+
+    rows = list(crawler.iter_xlsx_rows(path))
+    assert rows[:2] == [('No', 'Video URL'), ('1', URLS[0])]
+    assert crawler.read_excel_header(path) == ['No', 'Video URL']
+    assert crawler.load_urls_from_file(str(path)) == EXPECTED
+
+
+class RawCell:
+    def __init__(self, xml):
+        self.xml = xml
+
+
+SHARED_STRINGS = """<?xml version="1.0" encoding="UTF-8"?>
+<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" count="1" uniqueCount="1">
+<si><t>Video URL</t><rPh sb="0" eb="5"><t>ビデオ</t></rPh></si>
+</sst>"""
+
+
+def test_xlsx_shared_string_phonetics_and_typed_cells(tmp_path):
+    path = tmp_path / 'typed.xlsx'
+    write_xlsx_without_refs(path, [
+        ['Aktif', RawCell('<c t="s"><v>0</v></c>')],
+        [RawCell('<c t="b"><v>1</v></c>'), RawCell(f'<c t="str"><f>A1</f><v>{URLS[0]}</v></c>')],
+        [RawCell('<c t="b"><v>0</v></c>'), URLS[1]],
+    ], shared_strings=SHARED_STRINGS)
+    crawler = YouTubeCommentsCrawler()
+
+    # Teks fonetik (rPh) bukan bagian dari nilai sel
+    assert crawler.read_excel_header(path) == ['Aktif', 'Video URL']
+    assert list(crawler.iter_xlsx_rows(path, min_row=2)) == [(True, URLS[0]), (False, URLS[1])]
+    assert crawler.load_urls_from_file(str(path)) == URLS[:2]
+
+
+def test_xlsx_streaming_matches_pandas(tmp_path):
+    pytest.importorskip('openpyxl')
+    path = tmp_path / 'urls.xlsx'
+    pd.DataFrame({'Judul': [f'Video {i}' for i in range(len(URLS))], 'URL Video': URLS}).to_excel(path, index=False)
+    crawler = YouTubeCommentsCrawler()
+
+    assert crawler.read_excel_header(path) == ['Judul', 'URL Video']
+    assert crawler.read_excel_column(path, 1) == pd.read_excel(path)['URL Video'].tolist()
+    assert crawler.load_urls_from_file(str(path)) == EXPECTED
+
+
+def test_txt_extracts_video_ids_once(tmp_path, monkeypatch):
+    path = tmp_path / 'urls.txt'
+    path.write_text('# daftar video\n' + '\n'.join(URLS) + '\n', encoding='utf-8')
+    crawler = YouTubeCommentsCrawler()
+    monkeypatch.setattr('builtins.input', lambda prompt='': str(path))
+    calls = []
+    filter_video_urls = crawler.filter_video_urls
+
+    def spy(values, video_ids=None):
+        calls.append(video_ids)
+        return filter_video_urls(values, video_ids)
+
+    monkeypatch.setattr(crawler, 'filter_video_urls', spy)
+    assert crawler.load_urls_from_txt() == EXPECTED
+    assert len(calls) == 1 and calls[0] is not None
@@ -0,0 +1,45 @@
+"""Test mode watch: poll order=time hanya mengambil thread baru"""
+
+import pandas as pd
+
+from benchmark_crawler import benchmark_video_ids
+
+
+def growing_threads(monkeypatch, server, video_id, start=5, step=3):
+    """commentThreads order=time untuk video_id dengan thread baru setiap poll (terbaru lebih dulu)"""
+    polls = []
+    original = server.comment_threads
+
+    def comment_threads(params):
+        if params.get('videoId') != video_id:
+            return original(params)
+        if not params.get('pageToken'):
+            polls.append(start + step * len(polls))
+        count = polls[-1]
+        offset, end = server._page(params, count)
+        items = [server.data.thread(video_id, count - 1 - i, 'replies' in params.get('part', ''))
+                 for i in range(offset, end)]
+        response = {'kind': 'youtube#commentThreadListResponse', 'items': items}
+        if end < count:
+            response['nextPageToken'] = str(end)
+        return response
+
+    monkeypatch.setattr(server, 'comment_threads', comment_threads)
+    return polls
+
+
+def test_watch_picks_up_new_threads(make_crawler, fake_api, monkeypatch, tmp_path):
+    video_id = benchmark_video_ids(4)[3]
+    polls = growing_threads(monkeypatch, fake_api, video_id)
+    crawler = make_crawler(prefix='watch', watch={'min_interval': 0.05, 'max_interval': 0.1, 'duration': 1.0,
+                                                  'quota_per_hour': 10 ** 6, 'burst': 100})
+    crawler.watch_videos([f'https://www.youtube.com/watch?v={video_id}'])
+
+    assert len(polls) >= 3
+    output = pd.read_csv(tmp_path / 'watch.csv')
+    main = output[output['comment_type'] == 'main_comment']
+    # Setiap thread yang pernah terlihat ditulis tepat sekali, termasuk yang muncul setelah poll pertama
+    assert len(main) == polls[-1]
+    assert not main.duplicated(subset=['comment_text', 'author_channel_id', 'publish_date']).any()
+    assert crawler.stats['total_comments'] == len(output)
+    assert crawler.stats['api_calls'] == 1 + len(polls)
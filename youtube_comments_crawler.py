@@ -22,34 +22,1310 @@ import sys
 import re
 import json
 import time
-import pandas as pd
+import math
+import queue
+import random
+import bisect
+import gzip
+import sqlite3
+import glob
+import hashlib
+import heapq
+import importlib
+import importlib.util
+import logging
+import threading
+import multiprocessing
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future, as_completed
 from datetime import datetime
 from pathlib import Path
 import configparser
-from typing import List, Dict, Optional, Tuple
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, List, Dict, Optional, Tuple
 import argparse
+from abc import ABC, abstractmethod
+
+if TYPE_CHECKING:
+    # numpy/pyarrow di-import lokal oleh class yang memakainya; di sini hanya untuk anotasi
+    import numpy as np
+    import pyarrow as pa
+
+# Tujuan pesan progres saat config['verbose'] False (mis. dipakai sebagai library)
+logger = logging.getLogger('youtube_comments_crawler')
+
+
+class _LazyModule:
+    """Proxy modul yang baru di-import saat atributnya pertama kali diakses
+    
+    Dependency berat (pandas, googleapiclient, textblob) tidak di-import saat
+    startup, sehingga --help/--version dan run pendek tetap cepat.
+    """
+    
+    def __init__(self, name: str, install_hint: Optional[str] = None):
+        self._name = name
+        self._install_hint = install_hint
+        self._module = None
+    
+    def _load(self):
+        if self._module is None:
+            try:
+                self._module = importlib.import_module(self._name)
+            except ImportError:
+                if not self._install_hint:
+                    raise
+                print(f"❌ Error: {self._install_hint.split()[-1]} tidak terinstall!")
+                print(f"💡 Jalankan: {self._install_hint}")
+                sys.exit(1)
+        return self._module
+    
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+
+pd = _LazyModule('pandas', 'pip install pandas')
 
 # YouTube API imports
-try:
-    from googleapiclient.discovery import build
-    from googleapiclient.errors import HttpError
-except ImportError:
-    print("❌ Error: google-api-python-client tidak terinstall!")
-    print("💡 Jalankan: pip install google-api-python-client")
-    sys.exit(1)
-
-# Optional imports for enhanced features
-try:
-    from textblob import TextBlob
-    HAS_TEXTBLOB = True
-except ImportError:
-    HAS_TEXTBLOB = False
-
-try:
-    import requests
-    HAS_REQUESTS = True
-except ImportError:
-    HAS_REQUESTS = False
+_discovery = _LazyModule('googleapiclient.discovery', 'pip install google-api-python-client')
+_errors = _LazyModule('googleapiclient.errors', 'pip install google-api-python-client')
+
+# Optional imports for enhanced features (dicek tanpa meng-import modulnya)
+HAS_TEXTBLOB = importlib.util.find_spec('textblob') is not None
+_textblob = _LazyModule('textblob')
+
+HAS_REQUESTS = importlib.util.find_spec('requests') is not None
+
+# Satu pola untuk semua format URL video: watch?v=, youtu.be/, embed/, v/, atau video ID saja
+VIDEO_ID_PATTERN = re.compile(
+    r'(?:youtube\.com\/(?:watch\?(?:.*&)?v=|embed\/|v\/)|youtu\.be\/|^(?=[a-zA-Z0-9_-]{11}$))'
+    r'([a-zA-Z0-9_-]{11})'
+)
+URL_COLUMN_KEYWORDS = ['url', 'youtube', 'link']
+# Status HTTP yang aman untuk di-retry (error sementara dari server)
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+# Biaya quota per method YouTube Data API (unit); method lain dihitung 1 unit
+QUOTA_COST = {'youtube.search.list': 100}
+# Atribut -> field snippet resource Comment yang dibaca (untuk parameter fields= / partial response).
+# Atribut tanpa field API (author_is_verified, is_pinned, dst.) selalu bernilai default.
+COMMENT_SNIPPET_FIELDS = {
+    'comment_text': 'textDisplay',
+    'author_name': 'authorDisplayName',
+    'author_channel_id': 'authorChannelId',
+    'author_channel_url': 'authorChannelId',
+    'author_profile_image_url': 'authorProfileImageUrl',
+    'is_liked_by_creator': 'viewerRating',
+    'is_hearted_by_creator': 'viewerRating',
+    'publish_date': 'publishedAt',
+    'updated_at': 'updatedAt',
+    'like_count': 'likeCount',
+}
+VIDEO_SNIPPET_FIELDS = {'video_title': 'title', 'channel_id': 'channelId', 'channel_title': 'channelTitle'}
+# Atribut yang dibutuhkan consumer baris per fitur config (diaktifkan di setup_row_consumers)
+ROW_CONSUMER_ATTRIBUTES = {'threads': ('comment_id', 'parent_id'), 'search': ('comment_id',),
+                           'changes': ('comment_id',)}
+# Fitur turunan comment_text yang diisi apply_batch_features per halaman
+FEATURE_ATTRIBUTES = ('word_count', 'has_links', 'has_mentions', 'language', 'sentiment_score')
+# Skema output bertipe (apply_output_schema): kolom -> datetime_utc / datetime / Int64 / float64 / boolean / category.
+# Kolom yang tidak tercantum dibiarkan sesuai hasil inferensi pandas (string di Parquet MergeWriter).
+OUTPUT_SCHEMA = {
+    'publish_date': 'datetime_utc',
+    'updated_at': 'datetime_utc',
+    'crawl_timestamp': 'datetime',  # waktu lokal mesin crawler (tanpa zona waktu)
+    'like_count': 'Int64',
+    'reply_count': 'Int64',
+    'word_count': 'Int64',
+    'near_dup_cluster': 'Int64',
+    'sentiment_score': 'float64',
+    'sampling_weight': 'float64',
+    'sample_truncated': 'boolean',
+    'author_is_verified': 'boolean',
+    'author_is_channel_owner': 'boolean',
+    'author_is_sponsor': 'boolean',
+    'is_liked_by_creator': 'boolean',
+    'is_hearted_by_creator': 'boolean',
+    'is_pinned': 'boolean',
+    'has_links': 'boolean',
+    'has_mentions': 'boolean',
+    'video_id': 'category',
+    'video_title': 'category',
+    'video_url': 'category',
+    'channel_id': 'category',
+    'channel_title': 'category',
+    'comment_type': 'category',
+    'language': 'category',
+}
+
+# Pola fitur turunan comment_text
+LINK_PATTERN = re.compile(r'http[s]?://|www\.')
+MENTION_PATTERN = re.compile(r'@\w+')
+WORD_PATTERN = re.compile(r'[^\W\d_]+')
+# Kata dasar per bahasa (kode ISO 639-1) untuk model n-gram karakter LanguageIdentifier
+LANGUAGE_SEED_WORDS = {
+    'id': '''yang dan di ini itu dengan untuk tidak dari dalam akan pada juga saya ke karena tersebut
+        bisa ada mereka lebih sudah atau kita jadi seperti kami apa harus telah sangat semua banyak
+        bagus keren mantap sekali banget aja udah gak nggak enggak kalau kalo gimana kenapa semoga
+        terima kasih sukses terus selalu lagu bikin buat orang sama masih belum pernah dulu sekarang
+        nanti hari tahun baru lama besar kecil baik suka cinta hati hidup dunia indonesia bangsa negara
+        rakyat pemerintah berita tolong mohon maaf semangat tetap lucu sedih senang lagi tahu lihat
+        nonton dengar bagaimana dimana siapa kapan berapa tapi namun tetapi walaupun sehingga agar
+        supaya bahwa oleh bagi antara tentang setelah sebelum ketika sedang saja hanya cuma kok dong
+        deh sih nih tuh wkwk wkwkwk anjir bang kak gan mbak pak bu''',
+    'en': '''the and to of in is it you that for this was on with are be have not but at they so like
+        just what all my your love song great video good one can from very really best people when who
+        will about more time there would their know thank thanks amazing beautiful awesome first new
+        never always every make made still could should been because how much well here need want think
+        see watch watching music voice listen years ago day world life heart feel feeling better please
+        keep guys man lol omg wow nice cool funny hope right now back going way only even than them these
+        those which where why also over after before something nothing anyone someone everyone''',
+    'jv': '''aku kowe sampeyan panjenengan ora ra iki kuwi iku opo piye kepiye ngopo lan karo ning neng
+        ing ono ana wis uwis durung arep meh isih mung wae ae tenan pisan temenan apik becik ayu ganteng
+        seneng susah lara atine ati wong uwong bocah mbok tak dak yo ngene ngono kabeh sopo sapa endi
+        ngendi mengko saiki wingi sesuk omah mangan turu mlaku lungo teko nek yen lek matur nuwun suwun
+        sugeng enggal mugi mugo dadi gawe nggawe ngerti weruh ndelok krungu ngomong dhewe dewe awakmu
+        awakdewe rek cah lur dulur sedulur koyo kaya ojo wes jebule pancen tenanan lho''',
+    'su': '''abdi urang maneh anjeun teu henteu moal ieu eta naon kumaha naha jeung sareng ka ti dina
+        geus atos can acan rek bade keur nuju ngan wungkul pisan teuing alus sae geulis kasep bungah
+        hate jalma budak barudak saha mana iraha ayeuna tadi isukan imah dahar sare leumpang indit datang
+        lamun upami hatur nuhun wilujeng mugia nyieun ngarti nyaho ningali ngadenge nyarita sorangan sok
+        oge mah teh atuh euy heula deui bae kitu kieu lain sanes enya muhun hayu mangga aya nu anu
+        baraya akang teteh''',
+}
+
+
+class CrawlMetrics:
+    """Metrik crawling per tahap: histogram latency dan counter
+    
+    Thread-safe; dapat diekspor sebagai JSON run report atau format teks
+    Prometheus (textfile collector) selama crawling berlangsung.
+    """
+    
+    BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stages = {}
+        self.counters = {}
+    
+    def observe(self, stage: str, seconds: float):
+        """Catat satu durasi untuk tahap tertentu"""
+        with self.lock:
+            data = self.stages.get(stage)
+            if data is None:
+                data = {'count': 0, 'sum': 0.0, 'max': 0.0, 'buckets': [0] * (len(self.BUCKETS) + 1)}
+                self.stages[stage] = data
+            data['count'] += 1
+            data['sum'] += seconds
+            if seconds > data['max']:
+                data['max'] = seconds
+            for i, bound in enumerate(self.BUCKETS):
+                if seconds <= bound:
+                    data['buckets'][i] += 1
+                    break
+            else:
+                data['buckets'][-1] += 1
+    
+    @contextmanager
+    def time(self, stage: str):
+        """Context manager untuk mengukur durasi satu tahap"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - started)
+    
+    def incr(self, name: str, value: float = 1, **labels):
+        """Tambah counter (opsional dengan label, mis. endpoint='videos')"""
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+    
+    def counter(self, name: str, **labels) -> float:
+        """Total counter untuk semua label (atau hanya label yang cocok)"""
+        wanted = set(labels.items())
+        with self.lock:
+            return sum(value for (key, items), value in self.counters.items()
+                       if key == name and wanted.issubset(items))
+    
+    def pop_state(self) -> Dict:
+        """Ambil lalu kosongkan data mentah stage dan counter (bisa di-pickle, mis. dari worker process)"""
+        with self.lock:
+            state = {'stages': self.stages, 'counters': self.counters}
+            self.stages, self.counters = {}, {}
+        return state
+    
+    def merge_state(self, state: Dict):
+        """Gabungkan data mentah hasil pop_state ke metrik ini"""
+        with self.lock:
+            for stage, data in state['stages'].items():
+                current = self.stages.get(stage)
+                if current is None:
+                    self.stages[stage] = dict(data, buckets=list(data['buckets']))
+                    continue
+                current['count'] += data['count']
+                current['sum'] += data['sum']
+                current['max'] = max(current['max'], data['max'])
+                current['buckets'] = [a + b for a, b in zip(current['buckets'], data['buckets'])]
+            for key, value in state['counters'].items():
+                self.counters[key] = self.counters.get(key, 0) + value
+    
+    def quantile(self, stage: str, q: float) -> Optional[float]:
+        """Estimasi quantile dari histogram (batas atas bucket)"""
+        with self.lock:
+            data = self.stages.get(stage)
+            if not data or not data['count']:
+                return None
+            target = q * data['count']
+            cumulative = 0
+            for i, count in enumerate(data['buckets']):
+                cumulative += count
+                if cumulative >= target:
+                    return self.BUCKETS[i] if i < len(self.BUCKETS) else data['max']
+            return data['max']
+    
+    def to_dict(self) -> Dict:
+        """Snapshot metrik dalam bentuk dict (untuk JSON report)"""
+        stages = {}
+        for stage in list(self.stages):
+            with self.lock:
+                data = dict(self.stages[stage])
+            stages[stage] = {
+                'count': data['count'],
+                'total_seconds': round(data['sum'], 6),
+                'mean_seconds': round(data['sum'] / data['count'], 6) if data['count'] else 0.0,
+                'p50_seconds': self.quantile(stage, 0.5),
+                'p95_seconds': self.quantile(stage, 0.95),
+                'max_seconds': round(data['max'], 6),
+                'histogram': dict(zip([str(b) for b in self.BUCKETS] + ['+Inf'], data['buckets']))
+            }
+        with self.lock:
+            counters = {}
+            for (name, labels), value in sorted(self.counters.items()):
+                label = ','.join(f'{k}={v}' for k, v in labels)
+                counters[f'{name}{{{label}}}' if label else name] = value
+        return {'stages': stages, 'counters': counters}
+    
+    def to_prometheus(self, prefix: str = 'youtube_crawler') -> str:
+        """Render metrik dalam format teks Prometheus"""
+        lines = []
+        with self.lock:
+            stages = {stage: dict(data, buckets=list(data['buckets'])) for stage, data in self.stages.items()}
+            counters = dict(self.counters)
+        if stages:
+            name = f'{prefix}_stage_duration_seconds'
+            lines.append(f'# HELP {name} Durasi per tahap crawling.')
+            lines.append(f'# TYPE {name} histogram')
+            for stage, data in sorted(stages.items()):
+                cumulative = 0
+                for bound, count in zip(self.BUCKETS, data['buckets']):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+                lines.append(f'{name}_bucket{{stage="{stage}",le="+Inf"}} {data["count"]}')
+                lines.append(f'{name}_sum{{stage="{stage}"}} {data["sum"]:.6f}')
+                lines.append(f'{name}_count{{stage="{stage}"}} {data["count"]}')
+        for counter_name in sorted({name for name, _ in counters}):
+            name = f'{prefix}_{counter_name}_total'
+            lines.append(f'# TYPE {name} counter')
+            for (key, labels), value in sorted(counters.items()):
+                if key != counter_name:
+                    continue
+                label = ','.join(f'{k}="{v}"' for k, v in labels)
+                lines.append(f'{name}{{{label}}} {value}' if label else f'{name} {value}')
+        return '\n'.join(lines) + '\n'
+
+
+class TokenBucket:
+    """Pembatas laju global (token per detik dengan kapasitas burst), thread-safe"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1) -> float:
+        """Ambil token, tunggu jika belum cukup; return lama menunggu (detik)"""
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return waited
+                delay = (tokens - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class ChangeTracker:
+    """Change-data-capture antar crawl berbasis index fingerprint per komentar
+
+    Index (SQLite) menyimpan comment_id -> hash 64-bit dari teks + updated_at,
+    sehingga perubahan dapat dideteksi tanpa memuat export sebelumnya. Setiap
+    perubahan ditulis sebagai satu baris NDJSON (inserted/edited/deleted).
+    Penghapusan hanya dideteksi untuk komentar utama pada video yang
+    ter-crawl lengkap; reply yang ikut di thread hanya sebagian sehingga
+    hilangnya reply belum tentu berarti dihapus.
+    """
+
+    QUERY_CHUNK = 500  # batas parameter per query IN (...)
+
+    def __init__(self, index_path: str, log_path: str, report: Callable = print):
+        self.report = report
+        self.conn = sqlite3.connect(index_path)
+        self.conn.execute('''CREATE TABLE IF NOT EXISTS fingerprints (
+            comment_id TEXT PRIMARY KEY, video_id TEXT, is_reply INTEGER,
+            fingerprint INTEGER, last_seen TEXT) WITHOUT ROWID''')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS idx_fingerprints_video ON fingerprints (video_id)')
+        self.log_path = log_path
+        self.log = open(log_path, 'a', encoding='utf-8')
+        self.crawl_id = datetime.now().isoformat()
+        self.counts = {'inserted': 0, 'edited': 0, 'deleted': 0, 'unchanged': 0}
+
+    @staticmethod
+    def fingerprint(row: Dict) -> int:
+        """Hash 64-bit (signed, muat di INTEGER SQLite) dari teks + updated_at"""
+        content = f"{row.get('comment_text', '')}\x00{row.get('updated_at', '')}".encode('utf-8')
+        return int.from_bytes(hashlib.blake2b(content, digest_size=8).digest(), 'big', signed=True)
+
+    def emit(self, event: str, **fields):
+        self.counts[event] += 1
+        self.log.write(json.dumps({'event': event, 'detected_at': self.crawl_id, **fields},
+                                  ensure_ascii=False) + '\n')
+
+    def consume(self, rows: List[Dict], complete_videos: List[str]):
+        """Bandingkan baris baru dengan index, tulis perubahan, lalu perbarui index"""
+        rows = [row for row in rows if row.get('comment_id')]
+        known = {}
+        for i in range(0, len(rows), self.QUERY_CHUNK):
+            ids = [row['comment_id'] for row in rows[i:i + self.QUERY_CHUNK]]
+            query = f"SELECT comment_id, fingerprint FROM fingerprints WHERE comment_id IN ({','.join('?' * len(ids))})"
+            known.update(self.conn.execute(query, ids).fetchall())
+
+        updates = []
+        for row in rows:
+            fingerprint = self.fingerprint(row)
+            previous = known.get(row['comment_id'])
+            fields = {'comment_id': row['comment_id'], 'video_id': row.get('video_id', ''),
+                      'comment_type': row.get('comment_type', ''), 'updated_at': row.get('updated_at', '')}
+            if previous is None:
+                publish_date = row.get('publish_date')
+                self.emit('inserted', edited=bool(publish_date) and row.get('updated_at') != publish_date, **fields)
+            elif previous != fingerprint:
+                self.emit('edited', **fields)
+            else:
+                self.counts['unchanged'] += 1
+            updates.append((row['comment_id'], row.get('video_id', ''),
+                            int(row.get('comment_type') == 'reply'), fingerprint, self.crawl_id))
+        self.conn.executemany('''INSERT INTO fingerprints VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(comment_id) DO UPDATE SET fingerprint = excluded.fingerprint,
+            last_seen = excluded.last_seen''', updates)
+
+        for video_id in complete_videos:
+            missing = [comment_id for (comment_id,) in self.conn.execute(
+                'SELECT comment_id FROM fingerprints WHERE video_id = ? AND is_reply = 0 AND last_seen != ?',
+                (video_id, self.crawl_id))]
+            for comment_id in missing:
+                self.emit('deleted', comment_id=comment_id, video_id=video_id, comment_type='main_comment')
+            self.conn.executemany('DELETE FROM fingerprints WHERE comment_id = ?', [(c,) for c in missing])
+        self.conn.commit()
+        self.log.flush()
+
+    def close(self):
+        self.conn.close()
+        self.log.close()
+        self.report(f"🧾 Perubahan: {self.counts['inserted']} baru, {self.counts['edited']} diedit, "
+                    f"{self.counts['deleted']} dihapus -> {self.log_path}")
+
+
+class SearchIndex:
+    """Index full-text (SQLite FTS5) atas comment_text, diperbarui per batch selama crawling
+
+    Tabel comments menyimpan metadata untuk filter (author, video, tanggal);
+    comments_fts adalah tabel FTS5 external-content yang dijaga sinkron oleh
+    trigger, sehingga teks tidak disimpan dua kali. Komentar yang di-crawl ulang
+    (comment_id sama) diperbarui, bukan diduplikasi.
+    """
+
+    COLUMNS = ['comment_id', 'video_id', 'video_title', 'author_channel_id', 'author_name',
+               'publish_date', 'like_count', 'comment_type', 'comment_text']
+
+    def __init__(self, index_path: str, report: Callable = print):
+        self.index_path = index_path
+        self.report = report
+        self.conn = sqlite3.connect(index_path)
+        self.conn.executescript('''
+            CREATE TABLE IF NOT EXISTS comments (
+                rowid INTEGER PRIMARY KEY, comment_id TEXT UNIQUE, video_id TEXT, video_title TEXT,
+                author_channel_id TEXT, author_name TEXT, publish_date TEXT, like_count INTEGER,
+                comment_type TEXT, comment_text TEXT);
+            CREATE INDEX IF NOT EXISTS idx_comments_video ON comments (video_id);
+            CREATE INDEX IF NOT EXISTS idx_comments_author ON comments (author_channel_id);
+            CREATE INDEX IF NOT EXISTS idx_comments_date ON comments (publish_date);
+            CREATE VIRTUAL TABLE IF NOT EXISTS comments_fts USING fts5(
+                comment_text, content='comments', content_rowid='rowid', tokenize='unicode61 remove_diacritics 2');
+            CREATE TRIGGER IF NOT EXISTS comments_ai AFTER INSERT ON comments BEGIN
+                INSERT INTO comments_fts (rowid, comment_text) VALUES (new.rowid, new.comment_text);
+            END;
+            CREATE TRIGGER IF NOT EXISTS comments_ad AFTER DELETE ON comments BEGIN
+                INSERT INTO comments_fts (comments_fts, rowid, comment_text) VALUES ('delete', old.rowid, old.comment_text);
+            END;
+            CREATE TRIGGER IF NOT EXISTS comments_au AFTER UPDATE OF comment_text ON comments BEGIN
+                INSERT INTO comments_fts (comments_fts, rowid, comment_text) VALUES ('delete', old.rowid, old.comment_text);
+                INSERT INTO comments_fts (rowid, comment_text) VALUES (new.rowid, new.comment_text);
+            END;
+        ''')
+        self.indexed = 0
+
+    def consume(self, rows: List[Dict], complete_videos: List[str]):
+        records = [tuple(row.get(column) for column in self.COLUMNS)
+                   for row in rows if row.get('comment_id') and row.get('comment_text')]
+        updates = ', '.join(f'{column} = excluded.{column}' for column in self.COLUMNS[1:])
+        self.conn.executemany(f'''INSERT INTO comments ({', '.join(self.COLUMNS)})
+            VALUES ({', '.join('?' * len(self.COLUMNS))})
+            ON CONFLICT(comment_id) DO UPDATE SET {updates}''', records)
+        self.conn.commit()
+        self.indexed += len(records)
+
+    def close(self):
+        # Gabungkan segmen FTS5 agar query berikutnya lebih cepat
+        self.conn.execute("INSERT INTO comments_fts (comments_fts) VALUES ('optimize')")
+        self.conn.commit()
+        self.conn.close()
+        self.report(f"🔍 Index pencarian: {self.indexed} komentar -> {self.index_path}")
+
+
+class RowAggregator:
+    """Agregat per author dan per video yang diperbarui selama crawling
+
+    Setiap key hanya menyimpan beberapa angka (jumlah, total likes, waktu
+    pertama/terakhir), sehingga memori konstan per key dan laporan umum tidak
+    perlu membaca ulang seluruh dataset. Ditulis sebagai tabel ringkasan di
+    samping output utama saat close().
+    """
+
+    def __init__(self, write_table, report: Callable = print):
+        self.write_table = write_table
+        self.report = report
+        self.authors = {}
+        self.videos = {}
+
+    @staticmethod
+    def update(entry: Dict, row: Dict):
+        entry['comments'] += 1
+        entry['replies'] += row.get('comment_type') == 'reply'
+        entry['total_likes'] += row.get('like_count') or 0
+        published = row.get('publish_date')
+        if published:
+            if not entry['first_seen'] or published < entry['first_seen']:
+                entry['first_seen'] = published
+            if not entry['last_seen'] or published > entry['last_seen']:
+                entry['last_seen'] = published
+
+    @staticmethod
+    def new_entry(**fields) -> Dict:
+        return {**fields, 'comments': 0, 'replies': 0, 'total_likes': 0, 'first_seen': '', 'last_seen': ''}
+
+    def consume(self, rows: List[Dict], complete_videos: List[str]):
+        for row in rows:
+            author_key = row.get('author_channel_id') or row.get('author_name')
+            if author_key:
+                entry = self.authors.get(author_key)
+                if entry is None:
+                    entry = self.authors[author_key] = self.new_entry(
+                        author_channel_id=row.get('author_channel_id', ''), author_name=row.get('author_name', ''))
+                self.update(entry, row)
+            video_id = row.get('video_id')
+            if video_id:
+                entry = self.videos.get(video_id)
+                if entry is None:
+                    entry = self.videos[video_id] = self.new_entry(
+                        video_id=video_id, video_title=row.get('video_title', ''))
+                self.update(entry, row)
+
+    def close(self):
+        for table, entries in [('author_summary', self.authors), ('video_summary', self.videos)]:
+            if not entries:
+                continue
+            df = pd.DataFrame(list(entries.values()))
+            df.insert(df.columns.get_loc('replies') + 1, 'reply_ratio', (df['replies'] / df['comments']).round(4))
+            df = df.sort_values('comments', ascending=False, kind='stable')
+            self.report(f"📑 Ringkasan {len(df)} baris disimpan: {self.write_table(df, table)}")
+
+
+class ThreadIndex:
+    """Index struktur percakapan (parent -> children) dalam bentuk CSR
+
+    Selama crawling hanya disimpan comment_id dan parent_id per baris. Saat
+    close(), node dinomori ulang secara BFS sehingga children setiap node
+    bernomor berurutan: children node i adalah node child_offset[i] ..
+    child_offset[i] + child_count[i] - 1. Dengan depth, thread_node (root) dan
+    thread_size per node, analisis percakapan cukup satu pass linear tanpa join.
+    Parent yang tidak ikut ter-crawl diperlakukan sebagai root.
+    """
+
+    def __init__(self, write_table, report: Callable = print):
+        self.write_table = write_table
+        self.report = report
+        self.nodes = {}
+        self.parents = []
+
+    def consume(self, rows: List[Dict], complete_videos: List[str]):
+        for row in rows:
+            comment_id = row.get('comment_id')
+            if not comment_id or comment_id in self.nodes:
+                continue
+            self.nodes[comment_id] = len(self.parents)
+            parent = row.get('parent_id') or (row.get('thread_id') if row.get('comment_type') == 'reply' else None)
+            self.parents.append(parent if parent != comment_id else None)
+
+    def build(self) -> Dict[str, 'np.ndarray']:
+        """Bangun array CSR (urutan BFS) dari parent pointer; semua langkah O(n)"""
+        import numpy as np
+        count = len(self.parents)
+        parent = np.fromiter((self.nodes.get(p, -1) if p else -1 for p in self.parents),
+                             dtype=np.int64, count=count)
+        # Children per parent (penomoran awal) dengan counting sort
+        child_count = np.bincount(parent[parent >= 0], minlength=count)
+        starts = np.concatenate(([0], np.cumsum(child_count)[:-1]))
+        children = np.flatnonzero(parent >= 0)
+        children = children[np.argsort(parent[children], kind='stable')]
+
+        order, depth = [], []
+        frontier = np.flatnonzero(parent < 0)
+        level = 0
+        while frontier.size:
+            order.append(frontier)
+            depth.append(np.full(frontier.size, level, dtype=np.int32))
+            counts = child_count[frontier]
+            total = int(counts.sum())
+            if not total:
+                break
+            # Gabungkan children semua node di frontier, tetap berkelompok per parent
+            positions = np.repeat(starts[frontier] - np.cumsum(counts) + counts, counts) + np.arange(total)
+            frontier = children[positions]
+            level += 1
+        order = np.concatenate(order)
+
+        renumber = np.full(count, -1, dtype=np.int64)
+        renumber[order] = np.arange(order.size)
+        new_parent = np.where(parent[order] >= 0, renumber[np.maximum(parent[order], 0)], -1)
+        new_count = child_count[order]
+        child_offset = np.concatenate(([0], np.cumsum(new_count)[:-1])) + int((new_parent < 0).sum())
+        thread_node = np.arange(order.size)
+        for _ in range(len(depth) - 1):
+            thread_node = np.where(new_parent >= 0, thread_node[np.maximum(new_parent, 0)], thread_node)
+        return {
+            'order': order, 'parent_node': new_parent, 'depth': np.concatenate(depth),
+            'child_offset': child_offset, 'child_count': new_count, 'thread_node': thread_node,
+            'thread_size': np.bincount(thread_node, minlength=order.size)[thread_node],
+        }
+
+    def close(self):
+        if not self.parents:
+            return
+        index = self.build()
+        comment_ids = pd.Series(list(self.nodes), dtype=object)
+        df = pd.DataFrame({
+            'node': range(len(index['order'])),
+            'comment_id': comment_ids.take(index['order']).to_numpy(),
+            **{column: index[column] for column in
+               ['parent_node', 'thread_node', 'depth', 'child_offset', 'child_count', 'thread_size']},
+        })
+        self.report(f"🧵 Index thread {len(df)} node ({int((df['parent_node'] < 0).sum())} thread) "
+                    f"disimpan: {self.write_table(df, 'thread_index')}")
+
+
+class LanguageIdentifier:
+    """Identifikasi bahasa offline dengan model n-gram karakter (naive Bayes)
+
+    Model trigram dibangun dari LANGUAGE_SEED_WORDS. Skor setiap token (jumlah
+    log-probabilitas trigram dari huruf-hurufnya) di-cache, lalu satu batch teks
+    diproses dengan satu str.split() atas gabungan teks dan penjumlahan per teks
+    lewat numpy, sehingga tidak ada loop Python per trigram maupun regex per
+    token. Teks dengan trigram dikenal kurang dari min_ngrams diberi label 'und'.
+    """
+
+    NGRAM = 3
+    CACHE_SIZE = 200000  # jumlah token unik yang skornya di-cache
+    SEPARATOR = '\x00'  # token pemisah antar teks dalam satu batch
+
+    def __init__(self, seed_words: Dict[str, str] = None, min_ngrams: int = 3, alpha: float = 0.5):
+        import numpy as np
+        self.np = np
+        seed_words = seed_words or LANGUAGE_SEED_WORDS
+        self.languages = list(seed_words)
+        self.min_ngrams = min_ngrams
+        counts = {}
+        for column, language in enumerate(self.languages):
+            for word in seed_words[language].split():
+                for gram in self.word_ngrams(word):
+                    counts.setdefault(gram, [0] * len(self.languages))[column] += 1
+        self.index = {gram: i for i, gram in enumerate(counts)}
+        matrix = np.array(list(counts.values()), dtype=np.float64) + alpha
+        self.weights = np.log(matrix / matrix.sum(axis=0))
+        self.reset_cache()
+
+    @classmethod
+    def word_ngrams(cls, word: str) -> List[str]:
+        padded = f' {word} '
+        return [padded[i:i + cls.NGRAM] for i in range(len(padded) - cls.NGRAM + 1)]
+
+    def reset_cache(self):
+        # ID 0 = pemisah antar teks, skor nol
+        self.vocab = {self.SEPARATOR: 0}
+        self.word_scores = self.np.zeros((1024, len(self.languages)))
+        self.word_lengths = self.np.zeros(1024)
+
+    def add_words(self, words):
+        np = self.np
+        needed = len(self.vocab) + len(words)
+        if needed > len(self.word_scores):
+            capacity = max(needed, 2 * len(self.word_scores))
+            self.word_scores = np.resize(self.word_scores, (capacity, len(self.languages)))
+            self.word_lengths = np.resize(self.word_lengths, capacity)
+        for token in words:
+            row = len(self.vocab)
+            # Token hasil split() bisa mengandung tanda baca/angka; hanya huruf yang dinilai
+            ids = [self.index[gram] for word in WORD_PATTERN.findall(token)
+                   for gram in self.word_ngrams(word) if gram in self.index]
+            self.word_scores[row] = self.weights[ids].sum(axis=0)
+            self.word_lengths[row] = len(ids)
+            self.vocab[token] = row
+
+    def predict(self, texts: List[Optional[str]]) -> List[str]:
+        """Label bahasa untuk setiap teks dalam batch"""
+        np = self.np
+        joined = f' {self.SEPARATOR} '.join(text or '' for text in texts).lower()
+        tokens = joined.split()
+        unique = set(tokens)
+        unknown = unique.difference(self.vocab)
+        if len(self.vocab) + len(unknown) > self.CACHE_SIZE:
+            # Reset juga membuang token batch ini yang sudah dikenal; hitung ulang dari cache kosong
+            self.reset_cache()
+            unknown = unique.difference(self.vocab)
+        if unknown:
+            self.add_words(unknown)
+        ids = np.fromiter(map(self.vocab.__getitem__, tokens), dtype=np.int64, count=len(tokens))
+        segments = np.cumsum(ids == 0)
+        lengths = np.bincount(segments, weights=self.word_lengths[ids], minlength=len(texts))
+        rows = self.word_scores[ids]
+        scores = np.column_stack([np.bincount(segments, weights=rows[:, column], minlength=len(texts))
+                                  for column in range(len(self.languages))])
+        best = scores.argmax(axis=1)
+        return [self.languages[b] if n >= self.min_ngrams else 'und' for b, n in zip(best, lengths)]
+
+
+class NearDuplicateDetector:
+    """Cluster komentar hampir sama (copy-paste spam, bot) dengan MinHash LSH
+
+    Signature MinHash dihitung per batch dengan numpy dari shingle byte teks
+    yang dinormalisasi. Setiap band signature disimpan di SQLite
+    (band_key -> cluster), sehingga memori tetap terbatas dan index dapat
+    tumpah ke disk untuk puluhan juta komentar. Komentar yang berbagi minimal
+    satu band dengan komentar sebelumnya masuk ke cluster yang sama (cluster
+    terkecil jika cocok dengan beberapa); sisanya membuka cluster baru.
+    """
+
+    QUERY_CHUNK = 500
+    SIGNATURE_CHUNK = 128  # teks per sub-batch perhitungan signature
+    COMMIT_EVERY = 100000
+
+    def __init__(self, index_path: str, num_perm: int = 64, bands: int = 8, shingle_size: int = 5,
+                 temporary: bool = False, report: Callable = print):
+        import numpy as np
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) harus habis dibagi bands ({bands})")
+        self.np = np
+        self.bands = bands
+        self.rows_per_band = num_perm // bands
+        self.shingle_size = min(max(shingle_size, 1), 8)  # shingle muat di satu uint64
+        rng = np.random.default_rng(20250730)  # seed tetap: signature konsisten antar run/proses
+        self.a = rng.integers(1, 2 ** 32, size=num_perm, dtype=np.uint32) | np.uint32(1)
+        self.b = rng.integers(0, 2 ** 32, size=num_perm, dtype=np.uint32)
+        self.index_path = index_path
+        self.temporary = temporary
+        self.report = report
+        self.conn = sqlite3.connect(index_path)
+        self.conn.execute('PRAGMA cache_size = -65536')  # maksimal ±64 MB page cache
+        self.conn.execute('PRAGMA synchronous = OFF')
+        self.conn.execute('PRAGMA journal_mode = MEMORY')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS bands (band_key INTEGER PRIMARY KEY, cluster INTEGER) WITHOUT ROWID')
+        self.next_cluster = (self.conn.execute('SELECT MAX(cluster) FROM bands').fetchone()[0] or 0) + 1
+        self.duplicates = 0
+        self.pending = 0  # band yang belum di-commit
+
+    def signatures(self, texts: List[Optional[str]]) -> Tuple['np.ndarray', 'np.ndarray']:
+        """Signature MinHash (n_valid, num_perm) dan mask teks yang cukup panjang"""
+        np = self.np
+        k = self.shingle_size
+        encoded = [' '.join(text.lower().split()).encode('utf-8') if text else b'' for text in texts]
+        lengths = np.fromiter((len(e) for e in encoded), dtype=np.int64, count=len(encoded))
+        counts = np.maximum(lengths - k + 1, 0)
+        valid = counts > 0
+        total = int(counts.sum())
+        if not total:
+            return np.empty((0, len(self.a)), dtype=np.uint32), valid
+        data = np.frombuffer(b''.join(encoded), dtype=np.uint8).astype(np.uint64)
+        starts = np.cumsum(lengths) - lengths
+        first_shingle = np.cumsum(counts) - counts
+        positions = np.arange(total) + np.repeat(starts - first_shingle, counts)
+        shingles = np.zeros(total, dtype=np.uint64)
+        for j in range(k):
+            shingles |= data[positions + j] << np.uint64(8 * j)
+        # Lipat shingle ke 32 bit, lalu hash (a * x + b) mod 2^32 per permutasi
+        shingles = ((shingles * np.uint64(0x9E3779B97F4A7C15)) >> np.uint64(32)).astype(np.uint32)
+        
+        # Diproses per SIGNATURE_CHUNK teks agar matriks (num_perm, shingle) tetap kecil
+        offsets = first_shingle[valid]
+        parts = []
+        for i in range(0, len(offsets), self.SIGNATURE_CHUNK):
+            begin = offsets[i]
+            end = offsets[i + self.SIGNATURE_CHUNK] if i + self.SIGNATURE_CHUNK < len(offsets) else total
+            hashed = np.multiply.outer(self.a, shingles[begin:end])
+            hashed += self.b[:, None]
+            parts.append(np.minimum.reduceat(hashed, offsets[i:i + self.SIGNATURE_CHUNK] - begin, axis=1))
+        return np.hstack(parts).T, valid
+
+    def band_keys(self, signatures: 'np.ndarray') -> List[List[int]]:
+        np = self.np
+        grouped = signatures.astype(np.uint64).reshape(len(signatures), self.bands, self.rows_per_band)
+        keys = np.broadcast_to(np.arange(1, self.bands + 1, dtype=np.uint64), grouped.shape[:2]).copy()
+        for j in range(self.rows_per_band):
+            keys = keys * np.uint64(0x100000001B3) + grouped[:, :, j]
+        return (keys >> np.uint64(1)).astype(np.int64).tolist()
+
+    def consume(self, rows: List[Dict], complete_videos: List[str]):
+        """Isi near_dup_cluster untuk setiap baris (None jika teks terlalu pendek)"""
+        signatures, valid = self.signatures([row.get('comment_text') for row in rows])
+        keys_per_row = self.band_keys(signatures) if len(signatures) else []
+        flat = list({key for keys in keys_per_row for key in keys})
+        known = {}
+        for i in range(0, len(flat), self.QUERY_CHUNK):
+            chunk = flat[i:i + self.QUERY_CHUNK]
+            query = f"SELECT band_key, cluster FROM bands WHERE band_key IN ({','.join('?' * len(chunk))})"
+            known.update(self.conn.execute(query, chunk).fetchall())
+
+        inserts = []
+        keys_iter = iter(keys_per_row)
+        for row, is_valid in zip(rows, valid.tolist()):
+            if not is_valid:
+                row['near_dup_cluster'] = None
+                continue
+            keys = next(keys_iter)
+            matches = [known[key] for key in keys if key in known]
+            if matches:
+                cluster = min(matches)
+                self.duplicates += 1
+            else:
+                cluster = self.next_cluster
+                self.next_cluster += 1
+            row['near_dup_cluster'] = cluster
+            for key in keys:
+                if key not in known:
+                    known[key] = cluster
+                    inserts.append((key, cluster))
+        self.conn.executemany('INSERT OR IGNORE INTO bands VALUES (?, ?)', inserts)
+        # Commit per COMMIT_EVERY band; data yang belum di-commit tetap terbaca oleh koneksi ini
+        self.pending += len(inserts)
+        if self.pending >= self.COMMIT_EVERY:
+            self.conn.commit()
+            self.pending = 0
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+        if self.temporary:
+            os.remove(self.index_path)
+        self.report(f"🧬 Near-duplicate: {self.duplicates} komentar masuk cluster yang sudah ada "
+                    f"({self.next_cluster - 1} cluster)")
+
+
+def apply_output_schema(df: 'pd.DataFrame') -> 'pd.DataFrame':
+    """Konversi satu batch DataFrame ke OUTPUT_SCHEMA secara vectorized per kolom
+
+    Timestamp ISO 8601 menjadi datetime64 (publish_date/updated_at dalam UTC),
+    angka dan flag menjadi tipe nullable (Int64/boolean) sehingga nilai kosong
+    tidak mengubah kolom menjadi object, dan kolom berulang per video menjadi
+    categorical. Kolom yang gagal dikonversi dibiarkan apa adanya.
+    """
+    iso = {'format': 'ISO8601'} if int(pd.__version__.split('.')[0]) >= 2 else {}
+    for column, kind in OUTPUT_SCHEMA.items():
+        if column not in df.columns:
+            continue
+        series = df[column]
+        try:
+            if kind.startswith('datetime'):
+                if pd.api.types.is_datetime64_any_dtype(series):
+                    continue
+                df[column] = pd.to_datetime(series.where(series != ''), errors='coerce',
+                                            utc=kind == 'datetime_utc', **iso)
+            elif kind in ['Int64', 'float64']:
+                df[column] = pd.to_numeric(series, errors='coerce').astype(kind)
+            else:
+                df[column] = series.astype(kind)
+        except (ValueError, TypeError):
+            continue
+    return df
+
+
+def concat_typed(frames: List['pd.DataFrame']) -> 'pd.DataFrame':
+    """Gabungkan batch bertipe; kategori digabung (union) agar kolom tetap categorical"""
+    frames = [frame for frame in frames if not frame.empty] or frames[:1]
+    if not frames:
+        return pd.DataFrame()
+    categorical = [column for column in frames[0].columns
+                   if all(isinstance(frame.get(column, pd.Series(dtype=object)).dtype, pd.CategoricalDtype)
+                          for frame in frames)]
+    if len(frames) > 1:
+        for column in categorical:
+            categories = pd.api.types.union_categoricals(
+                [frame[column] for frame in frames], ignore_order=True).categories
+            for frame in frames:
+                frame[column] = frame[column].cat.set_categories(categories)
+    return pd.concat(frames, ignore_index=True)
+
+
+def format_output_datetimes(df: 'pd.DataFrame') -> 'pd.DataFrame':
+    """Kolom datetime64 kembali menjadi string ISO 8601 untuk format teks (csv/json/ndjson/sqlite/xlsx)"""
+    import numpy as np
+    for column in df.columns:
+        series = df[column]
+        if not pd.api.types.is_datetime64_any_dtype(series):
+            continue
+        # UTC ditulis seperti format YouTube (detik + 'Z'), waktu lokal seperti datetime.isoformat()
+        utc = getattr(series.dt, 'tz', None) is not None
+        if utc:
+            series = series.dt.tz_convert('UTC').dt.tz_localize(None)
+        text = np.datetime_as_string(series.to_numpy(dtype='datetime64[us]'), unit='s' if utc else 'us')
+        if utc:
+            text = np.char.add(text, 'Z')
+        df[column] = pd.Series(text, index=df.index, dtype=object).where(series.notna(), None)
+    return df
+
+
+class MergeWriter:
+    """Penulis output gabungan secara streaming (per chunk DataFrame)
+
+    Format ditentukan dari ekstensi: .csv, .ndjson/.jsonl, .db/.sqlite (tabel
+    comments), .parquet (pyarrow), .xlsx (openpyxl write-only). Setiap chunk
+    disusun ulang ke daftar kolom yang sama sebelum ditulis. Parquet ditulis
+    dengan skema Arrow yang disusun sekali dari daftar kolom lengkap
+    (tipe OUTPUT_SCHEMA, kolom lain string), sehingga kolom yang kosong di
+    chunk pertama tidak mengunci tipe null/double; format lain menerima kolom
+    datetime sebagai string ISO 8601.
+    """
+
+    FORMATS = {'.csv': 'csv', '.ndjson': 'ndjson', '.jsonl': 'ndjson', '.db': 'sqlite', '.sqlite': 'sqlite',
+               '.sqlite3': 'sqlite', '.parquet': 'parquet', '.xlsx': 'excel'}
+
+    def __init__(self, path: str, columns: List[str]):
+        self.path = path
+        self.columns = columns
+        self.kind = self.FORMATS.get(Path(path).suffix.lower())
+        if self.kind is None:
+            raise ValueError(f"Format output tidak didukung: {path} (gunakan {', '.join(self.FORMATS)})")
+        if os.path.exists(path):
+            os.remove(path)
+        self.rows = 0
+        self.parquet_writer = None
+        self.parquet_schema = None
+        if self.kind in ['csv', 'ndjson']:
+            self.file = open(path, 'w', encoding='utf-8', newline='')
+        elif self.kind == 'sqlite':
+            self.conn = sqlite3.connect(path)
+        elif self.kind == 'excel':
+            from openpyxl import Workbook
+            self.workbook = Workbook(write_only=True)
+            self.sheet = self.workbook.create_sheet()
+            self.sheet.append(columns)
+
+    def write(self, df: 'pd.DataFrame'):
+        if df.empty:
+            return
+        df = df.reindex(columns=self.columns)
+        if self.kind != 'parquet':
+            df = format_output_datetimes(df)
+        if self.kind == 'csv':
+            df.to_csv(self.file, index=False, header=self.rows == 0)
+        elif self.kind == 'ndjson':
+            self.file.write(df.to_json(orient='records', lines=True, force_ascii=False).rstrip('\n') + '\n')
+        elif self.kind == 'sqlite':
+            df.to_sql('comments', self.conn, if_exists='append', index=False)
+        elif self.kind == 'parquet':
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            schema = self.arrow_schema()
+            for column in self.columns:
+                df[column] = self.coerce_column(df[column], OUTPUT_SCHEMA.get(column, 'string'))
+            table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+            if self.parquet_writer is None:
+                # Metadata pandas dari chunk pertama ikut disimpan agar Int64/boolean nullable terbaca kembali
+                self.parquet_writer = pq.ParquetWriter(self.path, table.schema)
+            self.parquet_writer.write_table(table.replace_schema_metadata(self.parquet_writer.schema.metadata))
+        elif self.kind == 'excel':
+            for row in df.astype(object).where(df.notna(), None).itertuples(index=False):
+                self.sheet.append(list(row))
+        self.rows += len(df)
+
+    def arrow_schema(self) -> 'pa.Schema':
+        """Skema Parquet dari daftar kolom lengkap (disusun sekali, tidak bergantung isi chunk pertama)"""
+        if self.parquet_schema is None:
+            import pyarrow as pa
+            unit = pd.to_datetime(pd.Series(['2000-01-01T00:00:00'])).dt.unit
+            types = {
+                'datetime_utc': pa.timestamp(unit, tz='UTC'),
+                'datetime': pa.timestamp(unit),
+                'Int64': pa.int64(),
+                'float64': pa.float64(),
+                'boolean': pa.bool_(),
+                # Index int32 agar chunk berikutnya boleh punya lebih banyak kategori
+                'category': pa.dictionary(pa.int32(), pa.string()),
+            }
+            self.parquet_schema = pa.schema([pa.field(column, types.get(OUTPUT_SCHEMA.get(column), pa.string()))
+                                             for column in self.columns])
+        return self.parquet_schema
+
+    @staticmethod
+    def coerce_column(series: 'pd.Series', kind: str) -> 'pd.Series':
+        """Ubah satu kolom chunk ke tipe skema Parquet; nilai yang tidak bisa dikonversi menjadi null"""
+        if kind.startswith('datetime'):
+            if not pd.api.types.is_datetime64_any_dtype(series):
+                iso = {'format': 'ISO8601'} if int(pd.__version__.split('.')[0]) >= 2 else {}
+                series = pd.to_datetime(series.where(series != ''), errors='coerce',
+                                        utc=kind == 'datetime_utc', **iso)
+            return series
+        if kind in ['Int64', 'float64']:
+            return pd.to_numeric(series, errors='coerce').astype(kind)
+        if kind == 'boolean':
+            if pd.api.types.is_bool_dtype(series):
+                return series.astype('boolean')
+            text = series.astype('string').str.lower()
+            return text.map({'true': True, 'false': False, '1': True, '0': False}).astype('boolean')
+        text = series.astype(object).where(series.notna(), None)
+        text = text.map(lambda value: value if value is None or isinstance(value, str) else str(value))
+        return text.astype('category') if kind == 'category' else text
+
+    def flush(self):
+        """Pastikan baris yang sudah ditulis terlihat oleh pembaca lain (csv/ndjson/sqlite)"""
+        if self.kind in ['csv', 'ndjson']:
+            self.file.flush()
+        elif self.kind == 'sqlite':
+            self.conn.commit()
+
+    def close(self):
+        if self.kind in ['csv', 'ndjson']:
+            self.file.close()
+        elif self.kind == 'sqlite':
+            if 'comment_id' in self.columns and self.rows:
+                self.conn.execute('CREATE INDEX IF NOT EXISTS idx_comments_comment_id ON comments (comment_id)')
+            self.conn.commit()
+            self.conn.close()
+        elif self.kind == 'parquet' and self.parquet_writer is not None:
+            self.parquet_writer.close()
+        elif self.kind == 'excel':
+            self.workbook.save(self.path)
+
+
+class OutputSink(ABC):
+    """Interface sink output: open() -> write_batch(rows) ... flush() -> close()
+
+    write_batch menerima list dict (satu halaman / satu batch baris); flush()
+    membuat baris yang sudah ditulis terlihat oleh pembaca downstream.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.rows = 0
+
+    def open(self):
+        pass
+
+    @abstractmethod
+    def write_batch(self, rows: List[Dict]):
+        """Tulis satu batch baris (wajib diimplementasikan subclass)"""
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.flush()
+
+
+class FileSink(OutputSink):
+    """Sink file (csv/ndjson/parquet/xlsx/db sesuai ekstensi) lewat MergeWriter
+
+    Kolom ditetapkan dari batch pertama ditambah columns (atribut aktif yang
+    belum muncul), sehingga semua batch ditulis dengan skema yang sama.
+    """
+
+    def __init__(self, path: str, columns: List[str] = None):
+        super().__init__(path)
+        self.columns = columns or []
+        self.writer = None
+
+    def write_batch(self, rows: List[Dict]):
+        if not rows:
+            return
+        if self.writer is None:
+            columns = list(dict.fromkeys(key for row in rows for key in row))
+            self.writer = MergeWriter(self.path, columns + [c for c in self.columns if c not in columns])
+        self.writer.write(pd.DataFrame(rows))
+        self.rows += len(rows)
+
+    def flush(self):
+        if self.writer is not None:
+            self.writer.flush()
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+class SQLiteSink(OutputSink):
+    """Sink tabel SQLite (mode WAL agar bisa dibaca selama crawling)
+
+    Tabel dibuat dari kolom batch pertama; kolom baru di batch berikutnya
+    ditambahkan dengan ALTER TABLE. Ditulis dengan executemany tanpa pandas.
+    """
+
+    def __init__(self, path: str, table: str = 'comments'):
+        super().__init__(path)
+        self.table = table
+        self.columns = []
+
+    def open(self):
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.columns = [row[1] for row in self.conn.execute(f'PRAGMA table_info("{self.table}")')]
+
+    def write_batch(self, rows: List[Dict]):
+        if not rows:
+            return
+        keys = list(dict.fromkeys(key for row in rows for key in row))
+        quoted = ', '.join(f'"{key}"' for key in keys)
+        if not self.columns:
+            self.conn.execute(f'CREATE TABLE IF NOT EXISTS "{self.table}" ({quoted})')
+            self.columns = list(keys)
+        for key in keys:
+            if key not in self.columns:
+                self.conn.execute(f'ALTER TABLE "{self.table}" ADD COLUMN "{key}"')
+                self.columns.append(key)
+        self.conn.executemany(f'INSERT INTO "{self.table}" ({quoted}) VALUES ({", ".join("?" * len(keys))})',
+                              [tuple(row.get(key) for key in keys) for row in rows])
+        self.rows += len(rows)
+
+    def flush(self):
+        self.conn.commit()
+
+    def close(self):
+        if 'comment_id' in self.columns:
+            self.conn.execute(f'CREATE INDEX IF NOT EXISTS idx_{self.table}_comment_id ON "{self.table}" (comment_id)')
+        self.conn.commit()
+        self.conn.close()
+
+
+class SpoolSink(OutputSink):
+    """Antrean lokal berbentuk folder spool: satu file NDJSON per flush
+
+    Batch ditulis ke <seq>.ndjson.part lalu di-rename atomik menjadi
+    <seq>.ndjson saat flush, sehingga consumer hanya melihat file lengkap
+    (consumer memproses lalu menghapus file). Jika file yang belum diambil
+    consumer mencapai max_files, flush menunggu (backpressure dari downstream).
+    """
+
+    def __init__(self, path: str, max_files: int = 100):
+        super().__init__(path)
+        self.max_files = max_files
+        self.sequence = 0
+        self.file = None
+
+    def open(self):
+        os.makedirs(self.path, exist_ok=True)
+        existing = [int(name.split('.')[0]) for name in os.listdir(self.path) if name.split('.')[0].isdigit()]
+        self.sequence = max(existing, default=0)
+
+    def write_batch(self, rows: List[Dict]):
+        if not rows:
+            return
+        if self.file is None:
+            self.sequence += 1
+            self.part_path = os.path.join(self.path, f"{self.sequence:09d}.ndjson.part")
+            self.file = open(self.part_path, 'w', encoding='utf-8')
+        self.file.write(''.join(json.dumps(row, ensure_ascii=False, default=str) + '\n' for row in rows))
+        self.rows += len(rows)
+
+    def flush(self):
+        if self.file is None:
+            return
+        while len(glob.glob(os.path.join(glob.escape(self.path), '*.ndjson'))) >= self.max_files:
+            time.sleep(0.2)
+        self.file.close()
+        os.replace(self.part_path, self.part_path[:-len('.part')])
+        self.file = None
+
+
+class PipeSink(OutputSink):
+    """Antrean lokal berbentuk named pipe (FIFO): baris NDJSON ditulis langsung ke pembaca
+
+    open() menunggu sampai ada proses yang membuka pipe untuk dibaca; jika
+    pembaca lambat, penulisan tertahan oleh buffer pipe (backpressure alami).
+    """
+
+    def open(self):
+        if not os.path.exists(self.path):
+            if not hasattr(os, 'mkfifo'):
+                raise RuntimeError("Named pipe tidak didukung di sistem ini; gunakan sink spool")
+            os.mkfifo(self.path)
+        print(f"⏳ Menunggu pembaca pipe {self.path} ...")
+        self.file = open(self.path, 'w', encoding='utf-8')
+
+    def write_batch(self, rows: List[Dict]):
+        self.file.write(''.join(json.dumps(row, ensure_ascii=False, default=str) + '\n' for row in rows))
+        self.rows += len(rows)
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class QueueSink(OutputSink):
+    """Sink ke queue.Queue di memori (dipakai iter_comments): satu item antrean = satu batch baris
+
+    Dipanggil langsung dari fetch thread; put tertahan selama antrean penuh
+    (backpressure ke fetcher). Setelah stop_event di-set, batch dibuang agar
+    crawl yang dihentikan tidak menunggu pembaca yang sudah pergi.
+    """
+
+    def __init__(self, batches: queue.Queue, stop_event: threading.Event):
+        super().__init__('<iter_comments>')
+        self.batches = batches
+        self.stop_event = stop_event
+        self.lock = threading.Lock()
+
+    def write_batch(self, rows: List[Dict]):
+        while not self.stop_event.is_set():
+            try:
+                self.batches.put(rows, timeout=0.1)
+            except queue.Full:
+                continue
+            with self.lock:
+                self.rows += len(rows)
+            return
+
+
+class BufferedSink:
+    """Buffer terbatas di depan sebuah OutputSink, dengan satu writer thread
+
+    write_batch dari thread crawling hanya memasukkan batch ke antrean; jika
+    baris di antrean sudah mencapai max_rows, pemanggil ditahan sampai writer
+    mengejar (backpressure ke fetcher). Semua operasi sink (open, write,
+    flush, close) berjalan di writer thread, sehingga sink tidak perlu
+    thread-safe (mis. koneksi SQLite). Sink di-flush saat antrean kosong
+    paling cepat setiap flush_interval detik, serta saat flush()/close().
+    """
+
+    def __init__(self, sink: OutputSink, max_rows: int = 5000, flush_interval: float = 1.0, metrics=None):
+        self.sink = sink
+        self.max_rows = max_rows
+        self.flush_interval = flush_interval
+        self.metrics = metrics
+        self.pending_rows = 0
+        self.condition = threading.Condition()
+        self.commands = queue.Queue()
+        self.error = None
+        self.opened = threading.Event()
+        self.thread = threading.Thread(target=self._run, name='sink-writer', daemon=True)
+        self.thread.start()
+        self.opened.wait()
+        self._raise_error()
+
+    def _raise_error(self):
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+
+    def _run(self):
+        try:
+            self.sink.open()
+        except Exception as e:
+            self.error = e
+            self.opened.set()
+            return
+        self.opened.set()
+        dirty = False
+        last_flush = time.monotonic()
+        while True:
+            try:
+                command, payload = self.commands.get(timeout=self.flush_interval)
+            except queue.Empty:
+                command, payload = None, None
+            try:
+                if command == 'write':
+                    started = time.perf_counter()
+                    self.sink.write_batch(payload)
+                    if self.metrics:
+                        self.metrics.observe('sink_write', time.perf_counter() - started)
+                    dirty = True
+                elif command in ['flush', 'close'] or (dirty and self.commands.empty()
+                                                       and time.monotonic() - last_flush >= self.flush_interval):
+                    if command == 'close':
+                        self.sink.close()
+                    else:
+                        self.sink.flush()
+                    dirty = False
+                    last_flush = time.monotonic()
+            except Exception as e:
+                self.error = self.error or e
+            finally:
+                if command == 'write':
+                    with self.condition:
+                        self.pending_rows -= len(payload)
+                        self.condition.notify_all()
+                elif command in ['flush', 'close']:
+                    payload.set()
+            if command == 'close':
+                return
+
+    def write_batch(self, rows: List[Dict]):
+        """Masukkan batch ke antrean; tertahan jika buffer penuh"""
+        if not rows:
+            return
+        self._raise_error()
+        started = time.perf_counter()
+        with self.condition:
+            while self.pending_rows and self.pending_rows + len(rows) > self.max_rows:
+                self.condition.wait()
+            self.pending_rows += len(rows)
+        waited = time.perf_counter() - started
+        if self.metrics and waited > 0.001:
+            self.metrics.observe('sink_backpressure', waited)
+        self.commands.put(('write', rows))
+
+    def flush(self):
+        done = threading.Event()
+        self.commands.put(('flush', done))
+        done.wait()
+        self._raise_error()
+
+    def close(self):
+        done = threading.Event()
+        self.commands.put(('close', done))
+        done.wait()
+        self.thread.join()
+        self._raise_error()
+
+    @property
+    def rows(self) -> int:
+        return self.sink.rows
+
+    @property
+    def path(self) -> str:
+        return self.sink.path
 
 
 class YouTubeCommentsCrawler:
@@ -61,23 +1337,57 @@ class YouTubeCommentsCrawler:
         self.youtube_service = None
         self.config = self.load_default_config()
         self.results = []
+        self.video_info_cache = {}
+        self.stats_lock = threading.Lock()
+        self._thread_local = threading.local()
+        self._fetch_executor = None
+        self._transform_executor = None
+        self._base_filename = None
+        self.metrics = CrawlMetrics()
+        self._metrics_exported_at = 0.0
+        self._archive_lock = threading.Lock()
+        self.row_consumers = []
+        self.completed_videos = set()
+        self._language_identifier = None
+        self.field_masks = {}
+        self.field_mask_ratios = {}
+        self.sink = None
+        self.stop_event = threading.Event()
         self.stats = {
             'total_videos': 0,
             'processed_videos': 0,
             'total_comments': 0,
             'total_replies': 0,
             'api_calls': 0,
+            'retries': 0,
             'start_time': None,
             'errors': []
         }
         
+    def say(self, *values, **kwargs):
+        """print() pesan progres; jika config['verbose'] False pesan dikirim ke logger modul
+
+        Pesan ⚠️/❌ dicatat di level WARNING, selainnya INFO; baris pemisah
+        (hanya '=' / '-') tidak dicatat.
+        """
+        if self.config['verbose']:
+            print(*values, **kwargs)
+            return
+        message = kwargs.get('sep', ' ').join(str(value) for value in values).strip()
+        if not message.strip('=-'):
+            return
+        logger.log(logging.WARNING if message.startswith(('⚠️', '❌')) else logging.INFO, message)
+        
     def load_default_config(self) -> Dict:
         """Load konfigurasi default untuk crawling"""
         return {
+            'verbose': True,  # False = pesan progres ke logging (logger youtube_comments_crawler), bukan stdout
             'max_comments_per_video': 1000,
+            'max_comments_per_channel': 10000,
             'include_replies': True,
             'comment_order': 'relevance',  # relevance, time
             'attributes': {
+                'comment_id': False,  # otomatis aktif untuk --threads, --search-index, --track-changes
                 'comment_text': True,
                 'author_name': True,
                 'author_channel_id': True,
@@ -94,10 +1404,13 @@ class YouTubeCommentsCrawler:
                 'like_count': True,
                 'reply_count': True,
                 'parent_id': True,
+                'thread_id': False,
                 'word_count': True,
                 'has_links': True,
                 'has_mentions': True,
                 'sentiment_score': HAS_TEXTBLOB,
+                'language': False,
+                'near_dup_cluster': False,
                 'video_title': True,
                 'video_id': True,
                 'video_url': True,
@@ -106,14 +1419,98 @@ class YouTubeCommentsCrawler:
                 'crawl_timestamp': True
             },
             'output': {
-                'format': 'excel',  # excel, csv, json
+                'format': 'excel',  # excel, csv, json, ndjson, sqlite, parquet
                 'filename_prefix': 'youtube_comments',
                 'include_timestamp': True,
-                'save_config': True
+                'save_config': True,
+                'sink': None,  # None = tulis semua hasil di akhir run; file, sqlite, spool, pipe = stream per halaman
+                'sink_path': None,  # None = <output>.<ext> / <output>.db / <output>_spool / <output>.pipe
+                'buffer_rows': 5000,  # baris maksimal di buffer sink sebelum fetcher ditahan (backpressure)
+                'spool_max_files': 100  # file spool yang belum diambil consumer sebelum sink menunggu
             },
             'delays': {
                 'between_videos': 1.0,
                 'between_requests': 0.1
+            },
+            'scheduling': {
+                'skip_empty': True,  # skip video tanpa komentar / komentar dinonaktifkan
+                'priority': 'largest_first',  # largest_first, smallest_first, input
+                'workers': 1  # jumlah video yang di-crawl bersamaan
+            },
+            'sampling': {
+                'enabled': False,  # crawl sampel video berstrata + kolom sampling_weight untuk estimasi
+                'video_fraction': 0.1,  # fraksi video yang diambil di setiap strata commentCount
+                'comments': None,  # total komentar sampel, dibagi sebanding commentCount; None = video terpilih di-crawl penuh
+                'strata': [100, 1000, 10000],  # batas commentCount antar strata video
+                'seed': 42
+            },
+            'watch': {
+                'min_interval': 30,  # detik; batas bawah interval poll per video
+                'max_interval': 1800,  # detik; video sepi di-poll paling jarang sekali per interval ini
+                'target_new_per_poll': 20,  # interval disesuaikan agar setiap poll membawa ± sekian thread baru
+                'quota_per_hour': 1000,  # laju quota global (token bucket) untuk seluruh video
+                'burst': 10,  # request yang boleh dikirim beruntun sebelum dibatasi laju
+                'max_pages_per_poll': 5,  # halaman order=time maksimal per poll sebelum berhenti mencari komentar lama
+                'backfill_pages': 1,  # halaman terbaru yang diambil saat poll pertama
+                'duration': None  # detik; None = sampai dihentikan (Ctrl+C)
+            },
+            'budget': {
+                'seconds': None,  # batas waktu crawl; diisi = mode halaman round-robin lintas video
+                'quota_units': None,  # batas quota unit crawl (termasuk request info video)
+                'policy': 'round_robin',  # round_robin (halaman sama rata) atau weighted (sebanding estimasi halaman)
+                'resume_file': None  # token halaman video yang belum selesai; None = <output>_resume.json
+            },
+            'archive': {
+                'enabled': False,  # simpan setiap halaman API mentah (NDJSON gzip) untuk replay
+                'dir': None  # default: <output>_raw
+            },
+            'profiling': {
+                'top_n': 25,  # jumlah fungsi / lokasi alokasi teratas di laporan profil
+                'traceback_depth': 1  # kedalaman traceback tracemalloc
+            },
+            'metrics': {
+                'export': True,  # tulis <output>_metrics.json dan <output>_metrics.prom
+                'interval': 30  # detik minimal antar update file .prom selama crawling
+            },
+            'api': {
+                'endpoint': os.getenv('YOUTUBE_API_ENDPOINT'),  # None = server resmi YouTube
+                'retries': 3,
+                'backoff': 1.0,  # detik, dikali 2 setiap retry
+                'validation_cache': '.api_key_cache.json',  # hash API key yang sudah tervalidasi
+                'validation_ttl': 24 * 3600,  # detik; 0 = selalu validasi ulang
+                'partial_response': True,  # minta hanya field dari atribut aktif (fields=); nonaktif saat archive
+                'measure_savings': False  # +1 request tanpa fields per endpoint per crawl (dihitung di api_calls/quota) untuk estimasi bytes dihemat
+            },
+            'pipeline': {
+                'prefetch': True,  # ambil halaman berikutnya sambil memproses halaman saat ini
+                'queue_size': 2,  # maksimal halaman yang menunggu diproses (backpressure)
+                'transform_workers': 0  # >0 = halaman mentah diubah menjadi baris di process pool
+            },
+            'refresh': {
+                'workers': 4  # request batch (50 ID) yang berjalan bersamaan saat --refresh
+            },
+            'near_duplicates': {
+                'num_perm': 64,  # jumlah fungsi hash MinHash
+                'bands': 8,  # band LSH; threshold Jaccard ±(1/bands)^(bands/num_perm)
+                'shingle_size': 5,  # panjang shingle (byte, maks 8) dari teks yang dinormalisasi
+                'index': None  # file SQLite band LSH; None = <output>_lsh.db sementara (dihapus di akhir run)
+            },
+            'merge': {
+                'chunksize': 50000  # baris per chunk saat --merge (memori tetap datar)
+            },
+            'search': {
+                'enabled': False,  # bangun index full-text (SQLite FTS5) atas comment_text
+                'index': None  # None = <output>_search.db; isi path tetap untuk mengumpulkan banyak crawl
+            },
+            'aggregates': {
+                'enabled': False  # tulis ringkasan per author dan per video di samping output utama (--aggregates)
+            },
+            'threads': {
+                'enabled': False  # tulis index thread CSR (parent -> children, depth, thread_size) (--threads)
+            },
+            'changes': {
+                'enabled': False,  # tulis <output>_changes.ndjson (inserted/edited/deleted) antar crawl
+                'index': 'comment_index.db'  # index fingerprint per komentar, dipakai ulang setiap crawl
             }
         }
     
@@ -199,6 +1596,28 @@ class YouTubeCommentsCrawler:
                 print(f"❌ Error: {e}")
         return False
     
+    def setup_api_key_batch(self, validate: bool = True) -> bool:
+        """Setup API key tanpa prompt (environment variable / file konfigurasi) untuk mode batch
+        
+        Dengan validate=False key langsung dipakai tanpa test request.
+        """
+        env_key = os.getenv('YOUTUBE_API_KEY')
+        if env_key and env_key != 'YOUR_API_KEY_HERE':
+            api_key = env_key
+        else:
+            api_key = self.load_api_key_from_config()
+        if not api_key:
+            self.say("❌ Tidak ditemukan API key di environment variable atau file konfigurasi.")
+            return False
+        if not validate:
+            self.api_key = api_key
+            self.youtube_service = self.build_service(api_key)
+            return True
+        if self.validate_api_key(api_key):
+            self.api_key = api_key
+            return True
+        return False
+    
     def load_api_key_from_config(self) -> Optional[str]:
         """Load API key dari file konfigurasi"""
         config_files = ['api_key.txt', 'config.ini', '.env']
@@ -226,7 +1645,7 @@ class YouTubeCommentsCrawler:
                                     if key and key != 'YOUR_API_KEY_HERE':
                                         return key
                 except Exception as e:
-                    print(f"⚠️ Error membaca {config_file}: {e}")
+                    self.say(f"⚠️ Error membaca {config_file}: {e}")
                     
         return None
     
@@ -253,10 +1672,15 @@ class YouTubeCommentsCrawler:
         """Validasi API key dengan test request"""
         if not api_key or len(api_key) < 30:
             return False
+        
+        if self.is_api_key_validation_cached(api_key):
+            print("✅ API key valid! (cache validasi)")
+            self.youtube_service = self.build_service(api_key)
+            return True
             
         try:
             print("🔍 Validating API key...")
-            youtube = build('youtube', 'v3', developerKey=api_key)
+            youtube = self.build_service(api_key)
             
             # Test request
             request = youtube.channels().list(
@@ -267,9 +1691,10 @@ class YouTubeCommentsCrawler:
             
             print("✅ API key valid!")
             self.youtube_service = youtube
+            self.cache_api_key_validation(api_key)
             return True
             
-        except HttpError as e:
+        except _errors.HttpError as e:
             print(f"❌ HTTP Error: {e}")
             self.diagnose_api_error(str(e))
             return False
@@ -277,25 +1702,190 @@ class YouTubeCommentsCrawler:
             print(f"❌ Error: {e}")
             return False
     
-    def diagnose_api_error(self, error_message: str):
-        """Diagnosa error API key dan berikan solusi"""
-        error_str = error_message.lower()
-        
-        print("\n🔍 DIAGNOSA ERROR:")
-        print("-" * 30)
-        
-        if "403" in error_str or "forbidden" in error_str:
-            print("❌ MASALAH: API Key Restricted")
-            print("📋 SOLUSI:")
-            print("   1. Buka Google Cloud Console")
-            print("   2. Edit API Key → Application restrictions → Pilih 'None'")
-            print("   3. Save dan coba lagi")
+    def is_api_key_validation_cached(self, api_key: str) -> bool:
+        """Cek apakah API key sudah tervalidasi dalam rentang TTL"""
+        ttl = self.config['api']['validation_ttl']
+        cache_file = self.config['api']['validation_cache']
+        if not ttl or not cache_file or not os.path.exists(cache_file):
+            return False
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            validated_at = cache.get(hashlib.sha256(api_key.encode('utf-8')).hexdigest())
+            return validated_at is not None and time.time() - validated_at < ttl
+        except Exception:
+            return False
+    
+    def cache_api_key_validation(self, api_key: str):
+        """Catat waktu validasi API key (hanya hash key yang disimpan)"""
+        cache_file = self.config['api']['validation_cache']
+        if not cache_file:
+            return
+        try:
+            cache = {}
+            if os.path.exists(cache_file):
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    cache = json.load(f)
+            cache[hashlib.sha256(api_key.encode('utf-8')).hexdigest()] = time.time()
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+        except Exception as e:
+            print(f"⚠️ Error menyimpan cache validasi API key: {e}")
+    
+    def build_service(self, api_key: str):
+        """Buat YouTube service object baru"""
+        client_options = None
+        if self.config['api']['endpoint']:
+            client_options = {'api_endpoint': self.config['api']['endpoint']}
+        return _discovery.build('youtube', 'v3', developerKey=api_key, cache_discovery=False,
+                                client_options=client_options)
+    
+    def execute_request(self, request) -> Dict:
+        """Eksekusi request API dengan retry + exponential backoff untuk error sementara"""
+        retries = self.config['api']['retries']
+        method_id = getattr(request, 'methodId', None) or 'youtube.unknown'
+        endpoint = method_id.split('.')[1] if method_id.count('.') >= 2 else method_id
+        if hasattr(request, 'postproc'):
+            postproc = request.postproc
             
-        elif "400" in error_str or "invalid" in error_str:
-            print("❌ MASALAH: API Key Tidak Valid")
-            print("📋 SOLUSI:")
-            print("   1. Periksa kembali API Key")
-            print("   2. Pastikan tidak ada spasi di awal/akhir")
+            masked = 'fields=' in (getattr(request, 'uri', '') or '')
+            
+            def measured_postproc(resp, content):
+                self.metrics.incr('bytes_received', len(content or b''), endpoint=endpoint)
+                if masked:
+                    self.metrics.incr('bytes_received_masked', len(content or b''), endpoint=endpoint)
+                with self.metrics.time('json_parse'):
+                    return postproc(resp, content)
+            request.postproc = measured_postproc
+        for attempt in range(retries + 1):
+            self.metrics.incr('api_requests', endpoint=endpoint)
+            self.metrics.incr('quota_units', QUOTA_COST.get(method_id, 1), endpoint=endpoint)
+            try:
+                with self.metrics.time('execute'):
+                    return request.execute()
+            except _errors.HttpError as e:
+                status = getattr(e.resp, 'status', None)
+                self.metrics.incr('api_errors', status=status)
+                if status not in RETRYABLE_STATUS or attempt == retries:
+                    raise
+            except (OSError, TimeoutError):
+                self.metrics.incr('api_errors', status='network')
+                if attempt == retries:
+                    raise
+            with self.stats_lock:
+                self.stats['retries'] += 1
+            self.metrics.incr('retries', endpoint=endpoint)
+            time.sleep(self.config['api']['backoff'] * (2 ** attempt))
+    
+    def get_service(self):
+        """Ambil YouTube service untuk thread saat ini
+        
+        Service object googleapiclient tidak thread-safe, sehingga setiap worker
+        thread dan fetch thread memakai service miliknya sendiri.
+        """
+        if threading.current_thread() is threading.main_thread() or not self.api_key:
+            return self.youtube_service
+        service = getattr(self._thread_local, 'service', None)
+        if service is None:
+            service = self.build_service(self.api_key)
+            self._thread_local.service = service
+        return service
+
+    def build_field_masks(self) -> Dict[str, str]:
+        """Susun parameter fields= per endpoint dari atribut yang aktif (dipanggil sekali per crawl)
+
+        Arsip raw butuh response lengkap agar bisa di-replay dengan atribut lain,
+        sehingga mask tidak dipakai saat archive aktif.
+        """
+        if not self.config['api']['partial_response'] or self.config['archive']['enabled']:
+            return {}
+        attributes = self.config['attributes']
+        comment_fields = sorted({field for attr, field in COMMENT_SNIPPET_FIELDS.items() if attributes.get(attr)})
+        # Snippet komentar utama selalu dibaca oleh process_comment_item
+        top_level = ['id'] if attributes['comment_id'] else []
+        top_level.append(f"snippet({','.join(comment_fields or ['publishedAt'])})")
+        thread_snippet = ['videoId', f"topLevelComment({','.join(top_level)})"]
+        if attributes['reply_count']:
+            thread_snippet.append('totalReplyCount')
+        items = ['id', f"snippet({','.join(thread_snippet)})"]
+        if self.config['include_replies']:
+            reply = ['id'] if attributes['comment_id'] else []
+            reply.append(f"snippet({','.join(comment_fields + ['parentId'])})")
+            items.append(f"replies(comments({','.join(reply)}))")
+        video_fields = sorted({field for attr, field in VIDEO_SNIPPET_FIELDS.items() if attributes.get(attr)})
+        video = ['id', 'statistics(commentCount)']
+        if video_fields:
+            video.append(f"snippet({','.join(video_fields)})")
+        return {
+            'commentThreads': f"nextPageToken,items({','.join(items)})",
+            'videos': f"items({','.join(video)})",
+        }
+
+    def list_request(self, resource: str, **params) -> Dict:
+        """Eksekusi <resource>().list dengan fields mask crawl ini (jika ada)
+
+        Request pertama per endpoint diulang sekali tanpa mask (jika
+        config['api']['measure_savings']) untuk mengukur rasio ukuran response
+        penuh vs response ter-mask; rasio ini dipakai untuk estimasi bytes dihemat.
+        Request tambahan ini ikut dihitung di stats['api_calls'] dan quota.
+        """
+        method = getattr(self.get_service(), resource)().list
+        fields = self.field_masks.get(resource)
+        if not fields:
+            return self.execute_request(method(**params))
+        response = self.execute_request(method(fields=fields, **params))
+        if not self.config['api']['measure_savings'] or not response.get('items'):
+            return response
+        with self.stats_lock:
+            if resource in self.field_mask_ratios:
+                return response
+            self.field_mask_ratios[resource] = None  # sedang diukur oleh thread ini
+        try:
+            full = self.execute_request(method(**params))
+            with self.stats_lock:
+                self.stats['api_calls'] += 1
+            masked_size = len(json.dumps(response, separators=(',', ':')))
+            self.field_mask_ratios[resource] = len(json.dumps(full, separators=(',', ':'))) / masked_size
+        except Exception as e:
+            self.say(f"⚠️ Error mengukur ukuran response penuh: {e}")
+        return response
+
+    def pending_savings_requests(self, resource: str) -> int:
+        """Jumlah request pengukuran measure_savings yang masih akan dikirim untuk resource"""
+        if not self.config['api']['measure_savings'] or not self.field_masks.get(resource):
+            return 0
+        return int(resource not in self.field_mask_ratios)
+
+    def estimated_bytes_saved(self) -> Tuple[float, float]:
+        """Estimasi (bytes dihemat, bytes tanpa mask) dari rasio ukuran per endpoint"""
+        saved = full = 0.0
+        for resource, ratio in self.field_mask_ratios.items():
+            if not ratio:
+                continue
+            masked = self.metrics.counter('bytes_received_masked', endpoint=resource)
+            saved += masked * (ratio - 1)
+            full += masked * ratio
+        return saved, full
+    
+    def diagnose_api_error(self, error_message: str):
+        """Diagnosa error API key dan berikan solusi"""
+        error_str = error_message.lower()
+        
+        print("\n🔍 DIAGNOSA ERROR:")
+        print("-" * 30)
+        
+        if "403" in error_str or "forbidden" in error_str:
+            print("❌ MASALAH: API Key Restricted")
+            print("📋 SOLUSI:")
+            print("   1. Buka Google Cloud Console")
+            print("   2. Edit API Key → Application restrictions → Pilih 'None'")
+            print("   3. Save dan coba lagi")
+            
+        elif "400" in error_str or "invalid" in error_str:
+            print("❌ MASALAH: API Key Tidak Valid")
+            print("📋 SOLUSI:")
+            print("   1. Periksa kembali API Key")
+            print("   2. Pastikan tidak ada spasi di awal/akhir")
             print("   3. Buat API Key baru jika perlu")
             
         elif "quota" in error_str:
@@ -440,7 +2030,7 @@ class YouTubeCommentsCrawler:
         except KeyboardInterrupt:
             print("\n❌ Tidak bisa keluar dengan Ctrl+C! Gunakan 'exit', 'back', atau '0' sesuai menu.")
             return self.input_urls_multiple()
-        return urls
+        return self.filter_video_urls(urls)
     
     def load_urls_from_excel(self) -> List[str] | None:
         """Load URLs dari file Excel
@@ -509,20 +2099,14 @@ class YouTubeCommentsCrawler:
                 else:
                     print("❌ Pilihan tidak valid! Input path file atau exit/back.")
         try:
-            # Try to read Excel file
-            df = pd.read_excel(filename)
-            print(f"✅ File berhasil dibaca: {len(df)} baris")
-            print(f"📋 Kolom yang tersedia: {list(df.columns)}")
+            # Hanya header dan kolom URL yang dibaca (read-only/streaming)
+            columns = self.read_excel_header(filename)
+            print(f"📋 Kolom yang tersedia: {columns}")
             # Find URL column
-            url_column = None
-            for col in df.columns:
-                col_str = str(col).lower()
-                if any(keyword in col_str for keyword in ['url', 'youtube', 'link']):
-                    url_column = col
-                    break
-            if not url_column:
+            url_column = self.find_url_column(columns)
+            if url_column is None:
                 print("\n📋 Pilih kolom yang berisi URL:")
-                for i, col in enumerate(df.columns, 1):
+                for i, col in enumerate(columns, 1):
                     print(f"   {i}. {col}")
                 while True:
                     try:
@@ -534,8 +2118,8 @@ class YouTubeCommentsCrawler:
                             if choice in ['back', 'kembali', 'b']:
                                 print("↩️ Kembali ke menu utama input video.")
                                 return self.get_video_urls()
-                        elif choice.isdigit() and 1 <= int(choice) <= len(df.columns):
-                            url_column = df.columns[int(choice)-1]
+                        elif choice.isdigit() and 1 <= int(choice) <= len(columns):
+                            url_column = int(choice) - 1
                             break
                         else:
                             print("❌ Pilihan tidak valid! Pilih nomor kolom atau exit/back.")
@@ -543,19 +2127,53 @@ class YouTubeCommentsCrawler:
                         print("\n❌ Tidak bisa keluar dengan Ctrl+C! Gunakan 'exit', 'back', atau '0' sesuai menu.")
                         continue
             # Extract URLs
-            urls = []
-            for idx, value in df[url_column].items():
-                if pd.notna(value) and str(value).strip():
-                    url = str(value).strip()
-                    video_id = self.extract_video_id(url)
-                    if video_id:
-                        urls.append(url)
-            print(f"✅ Berhasil memuat {len(urls)} URL valid dari {len(df)} baris")
+            values = self.read_excel_column(filename, url_column)
+            urls = self.filter_video_urls(values)
+            print(f"✅ Berhasil memuat {len(urls)} URL valid dari {len(values)} baris")
             return urls
         except Exception as e:
             print(f"❌ Error membaca file Excel: {e}")
             return []
     
+    def read_excel_header(self, filename) -> List[str]:
+        """Baca baris header sheet pertama tanpa memuat seluruh workbook"""
+        if str(filename).lower().endswith('.xls'):
+            return [str(col) for col in pd.read_excel(filename, nrows=0).columns]
+        header = list(next(self.iter_xlsx_rows(filename, max_row=1), ()))
+        while header and header[-1] is None:
+            header.pop()
+        return ['' if value is None else str(value) for value in header]
+    
+    def read_excel_column(self, filename, column_index: int) -> List:
+        """Baca satu kolom (tanpa header) secara streaming dari sheet pertama"""
+        if str(filename).lower().endswith('.xls'):
+            return pd.read_excel(filename, usecols=[column_index]).iloc[:, 0].tolist()
+        return [row[0] for row in self.iter_xlsx_rows(filename, min_row=2, min_col=column_index + 1,
+                                                      max_col=column_index + 1)
+                if row and row[0] is not None]
+    
+    def iter_xlsx_rows(self, filename, **bounds):
+        """Generator tuple nilai per baris dari sheet pertama file .xlsx
+        
+        Workbook dibuka read-only (openpyxl streaming) sehingga file besar tidak
+        dimuat utuh ke memori; bounds diteruskan ke iter_rows (min_row, max_row,
+        min_col, max_col) agar hanya kolom yang dibutuhkan yang dibaca.
+        """
+        from openpyxl import load_workbook
+        workbook = load_workbook(filename, read_only=True, data_only=True)
+        try:
+            yield from workbook.worksheets[0].iter_rows(values_only=True, **bounds)
+        finally:
+            workbook.close()
+    
+    def find_url_column(self, columns: List[str]) -> Optional[int]:
+        """Cari index kolom URL berdasarkan nama kolom"""
+        for i, col in enumerate(columns):
+            col_str = str(col).lower()
+            if any(keyword in col_str for keyword in URL_COLUMN_KEYWORDS):
+                return i
+        return None
+    
     def load_urls_from_txt(self) -> List[str] | None:
         """Load URLs dari file text
         
@@ -587,27 +2205,24 @@ class YouTubeCommentsCrawler:
                 print("❌ Pilihan tidak valid! Input path file atau exit/back.")
         try:
             with open(filename, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            urls = []
-            for line_num, line in enumerate(lines, 1):
-                line = line.strip()
-                if line.lower() in allowed_special:
-                    if line.lower() in ['quit', 'exit', 'batal', '0']:
-                        print("❌ Dibatalkan oleh user dari menu TXT.")
-                        return []
-                    if line.lower() in ['back', 'kembali', 'b']:
-                        print("↩️ Kembali ke menu utama input video.")
-                        return self.get_video_urls()
-                elif line and not line.startswith('#'):
-                    video_id = self.extract_video_id(line)
-                    if video_id:
-                        urls.append(line)
-                    else:
-                        print(f"⚠️ Line {line_num}: URL tidak valid - {line}")
-                elif not line:
-                    continue
-                else:
-                    print(f"❌ Line {line_num}: Input tidak valid! Ketik URL, 'exit', 'back', atau sesuai petunjuk.")
+                lines = [line.strip() for line in f]
+            # Kata kunci khusus di dalam file menentukan aksi (baris pertama yang ditemukan)
+            for line in lines:
+                if line.lower() in ['quit', 'exit', 'batal', '0']:
+                    print("❌ Dibatalkan oleh user dari menu TXT.")
+                    return []
+                if line.lower() in ['back', 'kembali', 'b']:
+                    print("↩️ Kembali ke menu utama input video.")
+                    return self.get_video_urls()
+            entries = [(line_num, line) for line_num, line in enumerate(lines, 1)
+                       if line and not line.startswith('#')]
+            video_ids = self.extract_video_ids([line for _, line in entries])
+            invalid = [entry for entry, video_id in zip(entries, video_ids) if pd.isna(video_id)]
+            for line_num, line in invalid[:10]:
+                print(f"⚠️ Line {line_num}: URL tidak valid - {line}")
+            if len(invalid) > 10:
+                print(f"⚠️ ... dan {len(invalid)-10} baris tidak valid lainnya")
+            urls = self.filter_video_urls([line for _, line in entries], video_ids)
             print(f"✅ Berhasil memuat {len(urls)} URL valid dari {len(lines)} baris")
             return urls
         except Exception as e:
@@ -615,24 +2230,81 @@ class YouTubeCommentsCrawler:
             print("⚠️ Pastikan file template sudah ada dan formatnya benar!")
             return []
     
+    def load_urls_from_file(self, filename: str) -> List[str]:
+        """Load URLs dari file Excel/CSV/txt tanpa prompt (mode batch)"""
+        suffix = Path(filename).suffix.lower()
+        if suffix in ['.xlsx', '.xls']:
+            columns = self.read_excel_header(filename)
+            url_column = self.find_url_column(columns)
+            values = self.read_excel_column(filename, 0 if url_column is None else url_column)
+        elif suffix == '.csv':
+            columns = list(pd.read_csv(filename, nrows=0).columns)
+            url_column = self.find_url_column(columns)
+            values = pd.read_csv(filename, usecols=[0 if url_column is None else url_column],
+                                 dtype=str).iloc[:, 0].tolist()
+        else:
+            with open(filename, 'r', encoding='utf-8') as f:
+                values = [line.strip() for line in f if not line.lstrip().startswith('#')]
+        urls = self.filter_video_urls(values)
+        print(f"✅ Berhasil memuat {len(urls)} URL valid dari {len(values)} baris ({filename})")
+        return urls
+    
+    def extract_video_ids(self, values: List) -> 'pd.Series':
+        """Extract video ID dari banyak URL sekaligus (vectorized); NaN untuk yang tidak valid"""
+        series = pd.Series(values, dtype='object').astype('string').str.strip()
+        return series.str.extract(VIDEO_ID_PATTERN, expand=False)
+    
+    def filter_video_urls(self, values: List, video_ids: Optional['pd.Series'] = None) -> List[str]:
+        """Ambil URL valid dan buang duplikat berdasarkan video ID (urutan pertama dipertahankan)
+        
+        video_ids = hasil extract_video_ids(values) jika sudah dihitung pemanggil.
+        """
+        series = pd.Series(values, dtype='object').astype('string').str.strip()
+        if video_ids is None:
+            video_ids = series.str.extract(VIDEO_ID_PATTERN, expand=False)
+        valid = video_ids.notna()
+        unique = ~video_ids[valid].duplicated()
+        duplicates = int((~unique).sum())
+        if duplicates:
+            print(f"♻️ {duplicates} URL duplikat (video ID sama) dilewati")
+        return series[valid][unique].tolist()
+    
     def extract_video_id(self, url: str) -> Optional[str]:
         """Extract video ID dari berbagai format YouTube URL"""
         if not url:
             return None
             
-        patterns = [
-            r'(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/embed\/|youtube\.com\/v\/)([a-zA-Z0-9_-]{11})',
-            r'youtube\.com\/watch\?.*v=([a-zA-Z0-9_-]{11})',
-            r'^([a-zA-Z0-9_-]{11})$'  # Just video ID
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
+        match = VIDEO_ID_PATTERN.search(url)
+        if match:
+            return match.group(1)
                 
         return None
     
+    def extract_channel_id(self, channel: str) -> Optional[str]:
+        """Extract channel ID dari URL channel, handle (@nama), atau channel ID langsung"""
+        if not channel:
+            return None
+        channel = channel.strip()
+        
+        match = re.search(r'(?:youtube\.com\/channel\/)?(UC[a-zA-Z0-9_-]{22})', channel)
+        if match:
+            return match.group(1)
+        
+        # Handle (@nama) perlu di-resolve lewat API
+        match = re.search(r'(?:youtube\.com\/)?(@[a-zA-Z0-9_.-]+)', channel)
+        if match and self.youtube_service:
+            try:
+                response = self.execute_request(self.youtube_service.channels().list(
+                    part='id',
+                    forHandle=match.group(1)
+                ))
+                self.stats['api_calls'] += 1
+                if response.get('items'):
+                    return response['items'][0]['id']
+            except Exception as e:
+                print(f"⚠️ Error resolving channel handle: {e}")
+        return None
+    
     def configure_crawling(self):
         """Konfigurasi parameter crawling secara interaktif"""
         print("\n⚙️ KONFIGURASI CRAWLING")
@@ -706,18 +2378,18 @@ class YouTubeCommentsCrawler:
         # Output format
         while not cancelled:
             try:
-                output_format = input("Format output (excel/csv/json) [excel]: ").strip().lower()
+                output_format = input("Format output (excel/csv/json/ndjson/sqlite/parquet) [excel]: ").strip().lower()
                 if output_format in allowed_special:
                     print("↩️ Kembali/batal dari konfigurasi crawling.")
                     cancelled = True
                     return "__BACK_TO_INPUT_VIDEO__"
                 if not output_format:
                     break
-                if output_format in ['excel', 'csv', 'json']:
+                if output_format in ['excel', 'csv', 'json', 'ndjson', 'sqlite', 'parquet']:
                     self.config['output']['format'] = output_format
                     break
                 else:
-                    print("❌ Pilih 'excel', 'csv', atau 'json', atau ketik 'back' untuk kembali.")
+                    print("❌ Pilih 'excel', 'csv', 'json', 'ndjson', 'sqlite', atau 'parquet', atau ketik 'back' untuk kembali.")
             except KeyboardInterrupt:
                 print("\n❌ Tidak bisa keluar dengan Ctrl+C! Gunakan 'back', 'exit', atau '0' untuk kembali/batal.")
                 continue
@@ -733,6 +2405,7 @@ class YouTubeCommentsCrawler:
         print(f"Include replies: {'Ya' if self.config['include_replies'] else 'Tidak'}")
         print(f"Urutan komentar: {self.config['comment_order']}")
         print(f"Format output: {self.config['output']['format']}")
+        print(f"Urutan video: {self.config['scheduling']['priority']} ({self.config['scheduling']['workers']} worker)")
         
         # Show enabled attributes
         enabled_attrs = [k for k, v in self.config['attributes'].items() if v]
@@ -746,83 +2419,682 @@ class YouTubeCommentsCrawler:
     def start_crawling(self, video_urls: List[str]):
         """Mulai proses crawling"""
         if not self.youtube_service:
-            print("❌ YouTube service belum ready!")
+            self.say("❌ YouTube service belum ready!")
             return
             
         if not video_urls:
-            print("❌ Tidak ada URL video untuk diproses!")
+            self.say("❌ Tidak ada URL video untuk diproses!")
             return
         
-        print("\n🚀 MEMULAI CRAWLING")
-        print("=" * 40)
+        self.say("\n🚀 MEMULAI CRAWLING")
+        self.say("=" * 40)
         
         self.stats['total_videos'] = len(video_urls)
         self.stats['start_time'] = datetime.now()
         
-        print(f"📺 Total video: {len(video_urls)}")
-        print(f"⚙️ Max komentar per video: {self.config['max_comments_per_video']}")
-        print(f"📊 Include replies: {'Ya' if self.config['include_replies'] else 'Tidak'}")
-        print("\n🎬 Memulai proses...")
+        self.say(f"📺 Total video: {len(video_urls)}")
+        self.say(f"⚙️ Max komentar per video: {self.config['max_comments_per_video']}")
+        self.say(f"📊 Include replies: {'Ya' if self.config['include_replies'] else 'Tidak'}")
+        self.setup_row_consumers()
+        self.field_masks = self.build_field_masks()
+        self.setup_sink()
+        
+        video_ids = []
+        for url in video_urls:
+            video_id = self.extract_video_id(url)
+            if video_id:
+                video_ids.append(video_id)
+            else:
+                self.say(f"❌ Video ID tidak valid, skip: {url}")
+        
+        # Metadata semua video diambil batch, lalu dijadwalkan berdasarkan commentCount
+        quota_start = self.metrics.counter('quota_units')
+        self.say("\n🔎 Mengambil info video...")
+        video_infos, info_calls = self.get_videos_info(video_ids)
+        self.stats['api_calls'] += info_calls
+        jobs = self.schedule_videos(video_ids, video_infos)
+        if self.config['sampling']['enabled']:
+            jobs = self.sample_jobs(jobs)
+        
+        workers = max(1, int(self.config['scheduling']['workers']))
+        total_calls = sum(job['estimated_calls'] for job in jobs)
+        self.say(f"🗓️ Jadwal: {len(jobs)} video, estimasi {total_calls} API calls, {workers} worker")
+        self.say("\n🎬 Memulai proses...")
+        
+        budget = self.config['budget']
+        if budget['seconds'] or budget['quota_units'] or budget['resume_file']:
+            self._crawl_jobs_budgeted(jobs, workers, quota_start)
+        elif workers == 1:
+            self._crawl_jobs_sequential(jobs)
+        else:
+            self._crawl_jobs_concurrent(jobs, workers)
+        
+        # Final summary
+        self.show_crawling_summary()
+        
+        # Save results
+        self.close_sink()
+        if self.results:
+            self.save_results()
+        self.close_row_consumers()
+        self.shutdown_transform_pool()
+        self.shutdown_fetch_pool()
+        self.export_metrics(final=True)
+    
+    def iter_comments(self, video_ids: List[str], as_frame: bool = False, max_pending: int = 50):
+        """Generator batch baris komentar untuk daftar video ID/URL (API untuk notebook/pipeline)
+        
+        start_crawling dijalankan di thread terpisah dengan QueueSink, sehingga
+        penjadwalan, worker, prefetch, retry, cache, budget, dan sampling dari
+        config tetap berlaku, tetapi hasil tidak dikumpulkan di self.results.
+        Satu batch = baris dari satu halaman API (satu video saat sampling).
+        Antrean menampung maksimal max_pending batch; jika pemanggil lambat,
+        fetcher ikut tertahan. Menghentikan iterasi (break/close) menghentikan
+        crawl. as_frame=True menghasilkan DataFrame bertipe OUTPUT_SCHEMA.
+        """
+        if not self.youtube_service:
+            raise RuntimeError("YouTube service belum ready (set API key terlebih dahulu)")
+        batches = queue.Queue(maxsize=max(1, max_pending))
+        finished = object()
+        failure = []
+        self.stop_event.clear()
+        self.sink = QueueSink(batches, self.stop_event)
         
-        for i, url in enumerate(video_urls, 1):
+        def crawl():
             try:
-                print(f"\n📹 [{i}/{len(video_urls)}] Processing: {url}")
-                
-                video_id = self.extract_video_id(url)
-                if not video_id:
-                    print("❌ Video ID tidak valid, skip")
-                    continue
-                
-                # Get video info
-                video_info = self.get_video_info(video_id)
-                if not video_info:
-                    print("❌ Tidak dapat mengambil info video, skip")
-                    continue
-                
-                # Get comments
-                comments, api_calls = self.get_video_comments(video_id, video_info)
+                self.start_crawling(list(video_ids))
+            except BaseException as e:
+                failure.append(e)
+            finally:
+                self.close_sink()
+                self.shutdown_transform_pool()
+                self.shutdown_fetch_pool()
+                while not self.stop_event.is_set():
+                    try:
+                        batches.put(finished, timeout=0.1)
+                        return
+                    except queue.Full:
+                        continue
+        
+        thread = threading.Thread(target=crawl, name='iter-comments', daemon=True)
+        thread.start()
+        try:
+            while True:
+                batch = batches.get()
+                if batch is finished:
+                    break
+                yield apply_output_schema(pd.DataFrame(batch)) if as_frame else batch
+            if failure:
+                raise failure[0]
+        finally:
+            self.stop_event.set()
+            thread.join()
+    
+    def schedule_videos(self, video_ids: List[str], video_infos: Dict[str, Dict]) -> List[Dict]:
+        """Susun urutan crawling video berdasarkan statistik commentCount
+        
+        Video tanpa komentar atau dengan komentar dinonaktifkan (commentCount
+        tidak ada di statistics) di-skip tanpa request commentThreads. Sisanya
+        diurutkan sesuai config['scheduling']['priority']; 'largest_first'
+        (LPT) meminimalkan makespan saat crawling dengan beberapa worker.
+        """
+        max_total = self.config['max_comments_per_video']
+        skip_empty = self.config['scheduling']['skip_empty']
+        jobs = []
+        for position, video_id in enumerate(dict.fromkeys(video_ids)):
+            video_info = video_infos.get(video_id)
+            if not video_info:
+                self.say(f"❌ Tidak dapat mengambil info video {video_id}, skip")
+                with self.stats_lock:
+                    self.stats['errors'].append(f"Video {video_id}: info video tidak ditemukan")
+                continue
+            statistics = video_info.get('statistics', {})
+            if 'commentCount' in statistics:
+                comment_count = int(statistics['commentCount'])
+            else:
+                comment_count = None  # Komentar dinonaktifkan
+            if skip_empty and not comment_count:
+                reason = 'komentar dinonaktifkan' if comment_count is None else '0 komentar'
+                self.say(f"⏭️ Skip {video_id}: {reason}")
+                continue
+            expected = min(comment_count or max_total, max_total)
+            jobs.append({
+                'video_id': video_id,
+                'video_info': video_info,
+                'comment_count': comment_count or 0,
+                'estimated_calls': max(1, math.ceil(expected / 100)),
+                'position': position
+            })
+        
+        priority = self.config['scheduling']['priority']
+        if priority == 'largest_first':
+            jobs.sort(key=lambda job: (-job['estimated_calls'], -job['comment_count'], job['position']))
+        elif priority == 'smallest_first':
+            jobs.sort(key=lambda job: (job['estimated_calls'], job['comment_count'], job['position']))
+        return jobs
+    
+    def sample_jobs(self, jobs: List[Dict]) -> List[Dict]:
+        """Pilih sampel video berstrata dan kuota komentar per video, beserta bobot sampling
+
+        Tahap 1: video dikelompokkan per strata commentCount
+        (config['sampling']['strata']) dan dari setiap strata diambil sampel acak
+        sederhana ceil(video_fraction * N_h) video, bobot N_h / n_h. Video terpilih
+        di-crawl penuh (cluster sample, max_comments_per_video diabaikan).
+        Tahap 2 (opsional): jika config['sampling']['comments'] diisi, total
+        komentar sampel dibagi ke video terpilih sebanding commentCount. Halaman
+        commentThreads hanya bisa diambil berurutan lewat pageToken, sehingga
+        kuota per video diisi dari thread pertama sesuai comment_order (bukan
+        sampel acak dalam video); video seperti ini ditandai sample_truncated.
+        Bobot akhir per baris dihitung di apply_sampling_weight setelah jumlah
+        baris video diketahui.
+        """
+        settings = self.config['sampling']
+        rng = random.Random(settings['seed'])
+        boundaries = sorted(settings['strata'])
+        strata = {}
+        for job in jobs:
+            strata.setdefault(bisect.bisect_right(boundaries, job['comment_count']), []).append(job)
+
+        selected = {}
+        for members in strata.values():
+            size = min(len(members), max(1, math.ceil(settings['video_fraction'] * len(members))))
+            for job in rng.sample(members, size):
+                job['video_weight'] = len(members) / size
+                selected[id(job)] = job
+
+        sampled = [job for job in jobs if id(job) in selected]
+        total_comments = sum(job['comment_count'] for job in sampled)
+        max_per_video = self.config['max_comments_per_video']
+        for job in sampled:
+            quota = math.inf
+            if settings['comments'] and total_comments:
+                quota = max(1, math.ceil(settings['comments'] * job['comment_count'] / total_comments))
+            job['max_comments'] = quota
+            job['estimated_calls'] = max(1, math.ceil(min(quota, job['comment_count']) / 100))
+        self.say(f"🎲 Sampling: {len(sampled)}/{len(jobs)} video dari {len(strata)} strata, "
+                 f"estimasi {sum(job['estimated_calls'] for job in sampled)} API calls "
+                 f"(vs {sum(math.ceil(min(job['comment_count'], max_per_video) / 100) or 1 for job in jobs)} tanpa sampling)")
+        return sampled
+
+    def apply_sampling_weight(self, rows: List[Dict], job: Dict):
+        """Tulis sampling_weight = bobot video * commentCount / jumlah baris video (hanya saat mode sampling)
+
+        rows harus seluruh baris video tersebut. Untuk video yang di-crawl penuh
+        bobot ini adalah bobot cluster sample per strata (jumlah bobot menaksir
+        total commentCount populasi). Video yang berhenti sebelum selesai (kuota
+        sampling.comments, budget, atau error) ditandai sample_truncated=True:
+        barisnya adalah thread pertama sesuai comment_order, bukan sampel acak,
+        sehingga estimasi yang memakainya hanya perkiraan.
+        """
+        if 'video_weight' not in job or not rows:
+            return
+        within_weight = job['comment_count'] / len(rows) if job['comment_count'] else 1.0
+        weight = round(job['video_weight'] * within_weight, 6)
+        truncated = job['video_id'] not in self.completed_videos
+        for row in rows:
+            row['sampling_weight'] = weight
+            row['sample_truncated'] = truncated
+
+    def crawl_video_job(self, job: Dict) -> Tuple[List[Dict], int]:
+        """Crawl satu video hasil schedule_videos"""
+        return self.get_video_comments(job['video_id'], job['video_info'], job.get('max_comments'))
+    
+    def _record_video_result(self, job: Dict, comments: List[Dict], api_calls: int):
+        """Simpan hasil satu video ke results dan stats"""
+        self.apply_sampling_weight(comments, job)
+        self.emit_rows(comments, weighted=True)
+        with self.stats_lock:
+            if self.sink is None:
+                self.results.extend(comments)
+            self.stats['total_comments'] += len(comments)
+            self.stats['api_calls'] += api_calls
+            self.stats['processed_videos'] += 1
+        self.metrics.incr('comments', len(comments))
+        self.metrics.incr('videos')
+        complete = [job['video_id']] if job['video_id'] in self.completed_videos else []
+        self.on_rows_produced(comments, complete)
+        self.export_metrics()
+    
+    def _print_progress(self, done: int, jobs: List[Dict], remaining_calls: int, workers: int):
+        """Tampilkan progress dan ETA berdasarkan sisa estimasi API calls"""
+        progress = (done / len(jobs)) * 100 if jobs else 100.0
+        elapsed = (datetime.now() - self.stats['start_time']).total_seconds()
+        calls_done = max(1, self.stats['api_calls'])
+        eta = remaining_calls * (elapsed / calls_done) / workers
+        self.say(f"📊 Progress: {progress:.1f}% ({done}/{len(jobs)}) - ETA ±{eta:.0f} detik")
+    
+    def _crawl_jobs_sequential(self, jobs: List[Dict]):
+        """Crawl video satu per satu sesuai urutan jadwal"""
+        remaining_calls = sum(job['estimated_calls'] for job in jobs)
+        for i, job in enumerate(jobs, 1):
+            if self.stop_event.is_set():
+                break
+            try:
+                self.say(f"\n📹 [{i}/{len(jobs)}] Processing: {job['video_id']} (±{job['comment_count']} komentar)")
                 
+                comments, api_calls = self.crawl_video_job(job)
+                self._record_video_result(job, comments, api_calls)
                 if comments:
-                    self.results.extend(comments)
-                    self.stats['total_comments'] += len(comments)
-                    self.stats['api_calls'] += api_calls
-                    print(f"✅ Berhasil: {len(comments)} komentar")
+                    self.say(f"✅ Berhasil: {len(comments)} komentar")
                 else:
-                    print("⚠️ Tidak ada komentar ditemukan")
+                    self.say("⚠️ Tidak ada komentar ditemukan")
                 
-                self.stats['processed_videos'] += 1
-                
-                # Progress update
-                progress = (i / len(video_urls)) * 100
-                print(f"📊 Progress: {progress:.1f}% ({i}/{len(video_urls)})")
+                remaining_calls -= job['estimated_calls']
+                self._print_progress(i, jobs, remaining_calls, 1)
                 
                 # Delay between videos
-                if i < len(video_urls):
+                if i < len(jobs):
                     time.sleep(self.config['delays']['between_videos'])
                     
             except KeyboardInterrupt:
-                print("\n⏹️ Crawling dihentikan oleh user")
+                self.say("\n⏹️ Crawling dihentikan oleh user")
                 break
             except Exception as e:
-                print(f"❌ Error processing {url}: {e}")
-                self.stats['errors'].append(f"Video {i}: {str(e)}")
+                self.say(f"❌ Error processing {job['video_id']}: {e}")
+                self.stats['errors'].append(f"Video {job['video_id']}: {str(e)}")
                 continue
+    
+    def _crawl_jobs_concurrent(self, jobs: List[Dict], workers: int):
+        """Crawl beberapa video bersamaan; job di-submit sesuai urutan jadwal"""
+        def run_job(job):
+            if self.stop_event.is_set():
+                return [], 0
+            result = self.crawl_video_job(job)
+            time.sleep(self.config['delays']['between_videos'])
+            return result
+        
+        remaining_calls = sum(job['estimated_calls'] for job in jobs)
+        executor = ThreadPoolExecutor(max_workers=workers)
+        futures = {executor.submit(run_job, job): job for job in jobs}
+        done = 0
+        try:
+            for future in as_completed(futures):
+                job = futures[future]
+                done += 1
+                try:
+                    comments, api_calls = future.result()
+                    self._record_video_result(job, comments, api_calls)
+                    self.say(f"✅ [{done}/{len(jobs)}] {job['video_id']}: {len(comments)} komentar")
+                except Exception as e:
+                    self.say(f"❌ Error processing {job['video_id']}: {e}")
+                    self.stats['errors'].append(f"Video {job['video_id']}: {str(e)}")
+                remaining_calls -= job['estimated_calls']
+                self._print_progress(done, jobs, remaining_calls, workers)
+        except KeyboardInterrupt:
+            self.say("\n⏹️ Crawling dihentikan oleh user")
+            executor.shutdown(wait=False, cancel_futures=True)
+            return
+        executor.shutdown()
+
+    def resume_file_path(self) -> str:
+        """Lokasi file resume mode budget"""
+        return self.config['budget']['resume_file'] or f"{self.output_base_filename()}_resume.json"
+
+    def load_resume_state(self, path: str) -> Dict[str, Dict]:
+        """Baca state per video (page_token, rows, pages, done) dari file resume"""
+        if not path or not os.path.exists(path):
+            return {}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f).get('videos', {})
+        except Exception as e:
+            self.say(f"⚠️ Error membaca file resume: {e}")
+            return {}
+
+    def _crawl_jobs_budgeted(self, jobs: List[Dict], workers: int, quota_start: float):
+        """Crawl per halaman secara bergiliran lintas video sampai selesai atau budget habis
+
+        Setiap giliran mengambil satu halaman dari video dengan prioritas
+        terendah: jumlah halaman yang sudah diambil (round_robin) atau jumlah
+        halaman dibagi estimasi total halaman (weighted, sehingga semua video
+        maju dengan persentase yang sama). Sebelum setiap giliran batas waktu
+        dan quota diperiksa; jika habis, hasil yang sudah terkumpul tetap
+        disimpan dan page token video yang belum selesai ditulis ke file resume.
+        """
+        budget = self.config['budget']
+        weighted = budget['policy'] == 'weighted'
+        resume_path = self.resume_file_path()
+        resumed = self.load_resume_state(budget['resume_file'])
+
+        heap = []
+        for order, job in enumerate(jobs):
+            state = resumed.get(job['video_id'], {})
+            if state.get('done'):
+                continue
+            job.update(page_token=state.get('page_token'), rows=state.get('rows', 0),
+                       pages=state.get('pages', 0), done=False,
+                       limit=job.get('max_comments') or self.config['max_comments_per_video'])
+            weight = job['estimated_calls'] if weighted else 1
+            heapq.heappush(heap, ((job['pages'] + 1) / weight, order, job))
+        if resumed:
+            self.say(f"⏯️ Resume: {len(heap)} video belum selesai dari {resume_path}")
+        self.say(f"⏳ Budget: waktu {budget['seconds'] or '-'} detik, quota {budget['quota_units'] or '-'} unit, "
+                 f"kebijakan {budget['policy']}")
+
+        def fetch(job):
+            if not job['pages']:
+                self.archive_raw(job['video_id'], {'kind': 'video', 'item': job['video_info']})
+            return self.fetch_comment_page(job['page_token'], min(100, job['limit'] - job['rows']),
+                                           videoId=job['video_id'], order=self.config['comment_order'])
+
+        executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+        stop_reason = None
+        last_progress = time.monotonic()
+        pages_total = 0
+        try:
+            while heap:
+                elapsed = (datetime.now() - self.stats['start_time']).total_seconds()
+                quota_used = self.metrics.counter('quota_units') - quota_start
+                if self.stop_event.is_set():
+                    stop_reason = "dihentikan pemanggil"
+                    break
+                if budget['seconds'] and elapsed >= budget['seconds']:
+                    stop_reason = f"batas waktu {budget['seconds']} detik"
+                    break
+                if budget['quota_units'] and quota_used >= budget['quota_units']:
+                    stop_reason = f"batas quota {budget['quota_units']} unit"
+                    break
+                # Satu halaman = 1 unit; jangan ambil lebih banyak halaman dari sisa quota
+                # (termasuk 1 unit untuk request pengukuran measure_savings yang belum jalan)
+                batch_size = workers
+                if budget['quota_units']:
+                    remaining = int(budget['quota_units'] - quota_used) - self.pending_savings_requests('commentThreads')
+                    if remaining < 1:
+                        stop_reason = f"batas quota {budget['quota_units']} unit"
+                        break
+                    batch_size = min(batch_size, remaining)
+                batch = [heapq.heappop(heap) for _ in range(min(batch_size, len(heap)))]
+                jobs_in_batch = [job for _, _, job in batch]
+                if executor:
+                    futures = [executor.submit(fetch, job) for job in jobs_in_batch]
+                    outcomes = []
+                    for future in futures:
+                        try:
+                            outcomes.append((future.result(), None))
+                        except Exception as e:
+                            outcomes.append((None, e))
+                else:
+                    outcomes = []
+                    for job in jobs_in_batch:
+                        try:
+                            outcomes.append((fetch(job), None))
+                        except Exception as e:
+                            outcomes.append((None, e))
+                # Semua halaman batch ditransformasi bersamaan (paralel jika ada process pool)
+                transforms = [self.submit_transform(response.get('items', []), job['video_info'],
+                                                    job['limit'] - job['rows'])
+                              if error is None else None
+                              for job, (response, error) in zip(jobs_in_batch, outcomes)]
+
+                for (_, order, job), (response, error), transform in zip(batch, outcomes, transforms):
+                    if error is not None:
+                        self.say(f"❌ Error processing {job['video_id']}: {error}")
+                        self.stats['errors'].append(f"Video {job['video_id']}: {str(error)}")
+                        job['done'] = True
+                        continue
+                    pages_total += 1
+                    job['pages'] += 1
+                    rows = transform.result()
+                    self.emit_rows(rows)
+                    if 'video_weight' in job:
+                        job.setdefault('sampled_rows', []).extend(rows)
+                    job['rows'] += len(rows)
+                    job['page_token'] = response.get('nextPageToken')
+                    complete = []
+                    if not job['page_token'] or not response.get('items') or job['rows'] >= job['limit']:
+                        job['done'] = True
+                        if job['rows'] < job['limit']:
+                            self.completed_videos.add(job['video_id'])
+                            complete = [job['video_id']]
+                    with self.stats_lock:
+                        if self.sink is None:
+                            self.results.extend(rows)
+                        self.stats['total_comments'] += len(rows)
+                        self.stats['api_calls'] += 1
+                        self.stats['processed_videos'] += job['done']
+                    self.metrics.incr('comments', len(rows))
+                    self.metrics.incr('videos', job['done'])
+                    if job['done']:
+                        self.apply_sampling_weight(job.get('sampled_rows', []), job)
+                        self.emit_rows(job.get('sampled_rows', []), weighted=True)
+                    self.on_rows_produced(rows, complete)
+                    if not job['done']:
+                        weight = job['estimated_calls'] if weighted else 1
+                        heapq.heappush(heap, ((job['pages'] + 1) / weight, order, job))
+
+                self.export_metrics()
+                if time.monotonic() - last_progress >= 5:
+                    last_progress = time.monotonic()
+                    self.say(f"📊 {pages_total} halaman, {self.stats['total_comments']} komentar, "
+                             f"{len(jobs) - len(heap)}/{len(jobs)} video selesai")
+                time.sleep(self.config['delays']['between_requests'])
+        except KeyboardInterrupt:
+            stop_reason = "dihentikan oleh user"
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        pending = [job for _, _, job in heap]
+        for job in pending:
+            self.apply_sampling_weight(job.get('sampled_rows', []), job)
+            self.emit_rows(job.get('sampled_rows', []), weighted=True)
+        if stop_reason:
+            self.say(f"\n⏹️ Crawling dihentikan: {stop_reason}; {len(pending)} video belum selesai")
+        if pending:
+            state = {}
+            for job in jobs:
+                previous = resumed.get(job['video_id'], {})
+                state[job['video_id']] = {'page_token': job.get('page_token'),
+                                          'rows': job.get('rows', previous.get('rows', 0)),
+                                          'pages': job.get('pages', previous.get('pages', 0)),
+                                          'done': job.get('done', previous.get('done', False))}
+            try:
+                with open(resume_path, 'w', encoding='utf-8') as f:
+                    json.dump({'saved_at': datetime.now().isoformat(), 'policy': budget['policy'],
+                               'videos': state}, f, indent=2)
+                self.say(f"⏯️ Token resume disimpan: {resume_path} (lanjutkan dengan --resume {resume_path})")
+            except Exception as e:
+                self.say(f"⚠️ Error menyimpan file resume: {e}")
+        elif resumed and os.path.exists(resume_path):
+            os.remove(resume_path)
+            self.say(f"✅ Semua video selesai; file resume {resume_path} dihapus")
+
+    def poll_new_threads(self, state: Dict, bucket: TokenBucket) -> Tuple[List[Dict], int]:
+        """Ambil thread order=time yang lebih baru dari thread terakhir yang sudah terlihat
+
+        Paging berhenti di thread pertama yang sudah ada di state['seen'] (semua
+        setelahnya lebih lama), saat halaman habis, atau setelah max_pages_per_poll.
+        Poll pertama hanya mengambil backfill_pages halaman terbaru.
+        """
+        settings = self.config['watch']
+        first_poll = not state['seen']
+        max_pages = settings['backfill_pages'] if first_poll else settings['max_pages_per_poll']
+        new_items = []
+        page_token = None
+        pages = 0
+        caught_up = False
+        while pages < max_pages:
+            bucket.acquire()
+            response = self.fetch_comment_page(page_token, 100, videoId=state['video_id'], order='time')
+            pages += 1
+            for item in response.get('items', []):
+                if item['id'] in state['seen']:
+                    caught_up = True
+                    break
+                new_items.append(item)
+            page_token = response.get('nextPageToken')
+            if caught_up or not page_token:
+                caught_up = True
+                break
+        if not caught_up and not first_poll:
+            # Lebih banyak komentar baru daripada max_pages_per_poll halaman; sebagian terlewat
+            self.metrics.incr('watch_gaps', video=state['video_id'])
+        for item in new_items:
+            state['seen'][item['id']] = None
+        while len(state['seen']) > 5000:
+            del state['seen'][next(iter(state['seen']))]
+        return new_items, pages
+
+    def watch_videos(self, video_urls: List[str]):
+        """Pantau komentar baru beberapa video secara terus-menerus (mode live)
+
+        Setiap video di-poll dengan commentThreads order=time dan hanya thread
+        baru yang diproses. Interval poll per video mengikuti kecepatan komentar
+        (EWMA thread baru per detik): target_new_per_poll / kecepatan, dibatasi
+        min_interval..max_interval, dan digandakan jika poll tidak membawa
+        komentar baru. Semua request berbagi satu token bucket
+        (quota_per_hour), sehingga banyak video ramai tidak melewati laju quota.
+        Baris baru langsung ditulis ke sink output (default sink file
+        <output>.<ext>, json menjadi ndjson) dan diteruskan ke row consumer.
+        Reply baru pada thread lama tidak terdeteksi karena urutan order=time
+        berdasarkan waktu thread.
+        """
+        if not self.youtube_service:
+            print("❌ YouTube service belum ready!")
+            return
+        settings = self.config['watch']
+        video_ids = [vid for vid in dict.fromkeys(self.extract_video_id(url) for url in video_urls) if vid]
+        if not video_ids:
+            print("❌ Tidak ada URL video untuk dipantau!")
+            return
+
+        print("\n🔴 MODE WATCH (LIVE)")
+        print("=" * 40)
+        print(f"📺 Video: {len(video_ids)} | interval {settings['min_interval']}-{settings['max_interval']} detik | "
+              f"quota {settings['quota_per_hour']} unit/jam")
+        print("⏹️ Tekan Ctrl+C untuk berhenti")
+        self.stats['start_time'] = datetime.now()
+        self.stats['total_videos'] = len(video_ids)
+        self.setup_row_consumers()
+        self.field_masks = self.build_field_masks()
+        self.setup_sink('file')
+        bucket = TokenBucket(settings['quota_per_hour'] / 3600.0, settings['burst'])
+
+        for _ in range(math.ceil(len(video_ids) / 50)):
+            bucket.acquire()
+        video_infos, info_calls = self.get_videos_info(video_ids)
+        self.stats['api_calls'] += info_calls
+        heap = []
+        states = {}
+        for order, video_id in enumerate(video_ids):
+            info = video_infos.get(video_id)
+            if not info or 'commentCount' not in info.get('statistics', {}):
+                print(f"⏭️ Skip {video_id}: info video tidak ditemukan atau komentar dinonaktifkan")
+                continue
+            states[video_id] = {'video_id': video_id, 'video_info': info, 'seen': {}, 'velocity': 0.0,
+                                'interval': settings['min_interval'], 'last_poll': None}
+            heapq.heappush(heap, (time.monotonic(), order, video_id))
+        self.stats['processed_videos'] = len(states)
+
+        deadline = time.monotonic() + settings['duration'] if settings['duration'] else None
+        try:
+            while heap:
+                due, order, video_id = heapq.heappop(heap)
+                now = time.monotonic()
+                if deadline and max(now, due) >= deadline:
+                    break
+                if due > now:
+                    time.sleep(due - now)
+                state = states[video_id]
+                try:
+                    items, pages = self.poll_new_threads(state, bucket)
+                except Exception as e:
+                    print(f"⚠️ Error polling {video_id}: {e}")
+                    self.stats['errors'].append(f"Video {video_id}: {str(e)}")
+                    items, pages = [], 0
+
+                polled_at = time.monotonic()
+                if state['last_poll'] is not None:
+                    rate = len(items) / max(polled_at - state['last_poll'], 1e-6)
+                    state['velocity'] = 0.5 * rate + 0.5 * state['velocity']
+                    if items and state['velocity'] > 0:
+                        state['interval'] = settings['target_new_per_poll'] / state['velocity']
+                    else:
+                        state['interval'] *= 2
+                    state['interval'] = min(settings['max_interval'], max(settings['min_interval'], state['interval']))
+                first_poll = state['last_poll'] is None
+                state['last_poll'] = polled_at
+
+                rows = self.transform_page(items, state['video_info'], math.inf)
+                with self.stats_lock:
+                    self.stats['api_calls'] += pages
+                    self.stats['total_comments'] += len(rows)
+                self.metrics.incr('comments', len(rows))
+                if rows:
+                    self.sink.write_batch(rows)
+                    self.on_rows_produced(rows, [])
+                    label = 'awal' if first_poll else 'baru'
+                    print(f"💬 [{datetime.now():%H:%M:%S}] {video_id}: +{len(rows)} komentar {label} "
+                          f"(poll berikutnya {state['interval']:.0f} detik)")
+                self.export_metrics()
+                heapq.heappush(heap, (polled_at + state['interval'], order, video_id))
+        except KeyboardInterrupt:
+            print("\n⏹️ Watch dihentikan oleh user")
+
+        print(f"\n📊 Watch selesai: {self.stats['total_comments']} komentar dari {len(states)} video, "
+              f"{self.stats['api_calls']} API calls")
+        self.close_sink()
+        gaps = self.metrics.counter('watch_gaps')
+        if gaps:
+            print(f"⚠️ {gaps:.0f} poll mencapai max_pages_per_poll; sebagian komentar mungkin terlewat")
+        self.close_row_consumers()
+        self.shutdown_transform_pool()
+        self.shutdown_fetch_pool()
+        self.export_metrics(final=True)
+
+    def start_channel_crawling(self, channel: str):
+        """Mulai crawling mode channel (satu stream untuk seluruh video di channel)"""
+        if not self.youtube_service:
+            print("❌ YouTube service belum ready!")
+            return
+        
+        channel_id = self.extract_channel_id(channel)
+        if not channel_id:
+            print(f"❌ Channel tidak valid: {channel}")
+            return
+        
+        print("\n🚀 MEMULAI CRAWLING CHANNEL")
+        print("=" * 40)
+        print(f"📡 Channel ID: {channel_id}")
+        print(f"⚙️ Max komentar per channel: {self.config['max_comments_per_channel']}")
+        print(f"📊 Include replies: {'Ya' if self.config['include_replies'] else 'Tidak'}")
+        
+        self.stats['start_time'] = datetime.now()
+        self.setup_row_consumers()
+        self.field_masks = self.build_field_masks()
+        self.setup_sink()
+        try:
+            comments, api_calls = self.get_channel_comments(channel_id)
+        except KeyboardInterrupt:
+            print("\n⏹️ Crawling dihentikan oleh user")
+            comments, api_calls = [], 0
+        
+        video_ids = {row.get('video_id') for row in comments if row.get('video_id')}
+        if self.sink is None:
+            self.results.extend(comments)
+        self.stats['total_videos'] = len(video_ids)
+        self.stats['processed_videos'] = len(video_ids)
+        self.stats['total_comments'] += len(comments)
+        self.stats['api_calls'] += api_calls
+        self.metrics.incr('comments', len(comments))
+        self.metrics.incr('videos', len(video_ids))
+        self.on_rows_produced(comments, sorted(video_ids & self.completed_videos))
+        print(f"✅ Berhasil: {len(comments)} komentar dari {len(video_ids)} video")
         
-        # Final summary
         self.show_crawling_summary()
         
-        # Save results
+        self.close_sink()
         if self.results:
             self.save_results()
+        self.close_row_consumers()
+        self.shutdown_transform_pool()
+        self.shutdown_fetch_pool()
+        self.export_metrics(final=True)
     
     def get_video_info(self, video_id: str) -> Optional[Dict]:
         """Ambil informasi video"""
         try:
-            request = self.youtube_service.videos().list(
-                part="snippet,statistics",
-                id=video_id
-            )
-            response = request.execute()
+            response = self.list_request('videos', part="snippet,statistics", id=video_id)
             
             if response['items']:
                 return response['items'][0]
@@ -830,89 +3102,251 @@ class YouTubeCommentsCrawler:
                 return None
                 
         except Exception as e:
-            print(f"⚠️ Error getting video info: {e}")
+            self.say(f"⚠️ Error getting video info: {e}")
             return None
     
-    def get_video_comments(self, video_id: str, video_info: Dict) -> Tuple[List[Dict], int]:
-        """Ambil komentar dari video"""
-        comments = []
+    def get_videos_info(self, video_ids: List[str]) -> Tuple[Dict[str, Dict], int]:
+        """Ambil informasi banyak video sekaligus (50 ID per request, dengan cache)"""
         api_calls = 0
-        next_page_token = None
+        missing = [vid for vid in dict.fromkeys(video_ids) if vid and vid not in self.video_info_cache]
+        for start in range(0, len(missing), 50):
+            chunk = missing[start:start + 50]
+            try:
+                response = self.list_request('videos', part="snippet,statistics",
+                                             id=','.join(chunk), maxResults=50)
+                api_calls += 1
+                for item in response.get('items', []):
+                    self.video_info_cache[item['id']] = item
+            except Exception as e:
+                self.say(f"⚠️ Error getting video info: {e}")
+        infos = {vid: self.video_info_cache[vid] for vid in video_ids if vid in self.video_info_cache}
+        return infos, api_calls
+    
+    def get_video_comments(self, video_id: str, video_info: Dict,
+                           max_total: Optional[int] = None) -> Tuple[List[Dict], int]:
+        """Ambil komentar dari video (max_total default config['max_comments_per_video'])"""
+        comments = []
+        counter = {'api_calls': 0}
+        max_total = max_total or self.config['max_comments_per_video']
+        self.archive_raw(video_id, {'kind': 'video', 'item': video_info})
+        pages = self.iter_comment_pages(counter, max_total, videoId=video_id,
+                                        order=self.config['comment_order'])
+        if self.config['pipeline']['prefetch']:
+            pages = self.prefetch_pages(pages)
+        transformed = self.transform_pipelined(pages, max_total, lambda response: (response['items'], video_info, None))
         
         try:
-            max_total = self.config['max_comments_per_video']
-            while len(comments) < max_total:
-                # Request comments
-                request = self.youtube_service.commentThreads().list(
-                    part='snippet,replies',
-                    videoId=video_id,
-                    maxResults=min(100, max_total - len(comments)),
-                    order=self.config['comment_order'],
-                    pageToken=next_page_token,
-                    textFormat='plainText'
-                )
-                response = request.execute()
-                api_calls += 1
-                if not response.get('items'):
-                    break
-                for item in response['items']:
-                    if len(comments) >= max_total:
-                        break
-                    comment_data = self.process_comment_item(item, video_info)
-                    comments.append(comment_data)
-                    if len(comments) >= max_total:
-                        break
-                    # Process replies if enabled
-                    if (self.config['include_replies'] and 
-                        'replies' in item and 
-                        'comments' in item['replies']):
-                        for reply_item in item['replies']['comments']:
-                            if len(comments) >= max_total:
-                                break
-                            reply_data = self.process_reply_item(reply_item, video_info, comment_data)
-                            comments.append(reply_data)
-                            self.stats['total_replies'] += 1
+            for rows in transformed:
+                comments.extend(rows)
+                self.emit_rows(rows)
                 if len(comments) >= max_total:
                     break
-                next_page_token = response.get('nextPageToken')
-                if not next_page_token:
-                    break
-                # Small delay between requests
-                time.sleep(self.config['delays']['between_requests'])
         except Exception as e:
-            print(f"⚠️ Error getting comments: {e}")
+            self.say(f"⚠️ Error getting comments: {e}")
+        finally:
+            transformed.close()
+            pages.close()
         # Truncate if over (should not happen, but for safety)
         if len(comments) > max_total:
             comments = comments[:max_total]
-        return comments, api_calls
+        elif counter.get('complete') and len(comments) < max_total:
+            self.completed_videos.add(video_id)
+        return comments, counter['api_calls']
     
-    def process_comment_item(self, item: Dict, video_info: Dict) -> Dict:
-        """Process item komentar menjadi data yang diperlukan"""
-        snippet = item['snippet']['topLevelComment']['snippet']
-        comment_data = {}
-        # Basic comment info
-        if self.config['attributes']['comment_text']:
-            comment_data['comment_text'] = self.clean_text(snippet.get('textDisplay', ''))
-        if self.config['attributes']['author_name']:
-            comment_data['author_name'] = snippet.get('authorDisplayName', '')
-        if self.config['attributes']['author_channel_id']:
-            comment_data['author_channel_id'] = snippet.get('authorChannelId', {}).get('value', '')
-        if self.config['attributes']['author_channel_url']:
-            channel_id = snippet.get('authorChannelId', {}).get('value', '')
-            comment_data['author_channel_url'] = f'https://www.youtube.com/channel/{channel_id}' if channel_id else ''
-        if self.config['attributes']['author_profile_image_url']:
-            comment_data['author_profile_image_url'] = snippet.get('authorProfileImageUrl', '')
-        if self.config['attributes']['author_is_verified']:
-            comment_data['author_is_verified'] = snippet.get('authorIsVerified', False)
-        if self.config['attributes']['author_is_channel_owner']:
-            comment_data['author_is_channel_owner'] = snippet.get('authorIsChannelOwner', False)
-        if self.config['attributes']['author_is_sponsor']:
-            comment_data['author_is_sponsor'] = snippet.get('authorIsSponsor', False)
-        if self.config['attributes']['is_liked_by_creator']:
-            comment_data['is_liked_by_creator'] = snippet.get('viewerRating', '') == 'like'
-        if self.config['attributes']['is_hearted_by_creator']:
-            comment_data['is_hearted_by_creator'] = snippet.get('viewerRating', '') == 'heart'
-        if self.config['attributes']['is_pinned']:
+    def get_channel_comments(self, channel_id: str) -> Tuple[List[Dict], int]:
+        """Ambil komentar seluruh video dalam satu channel sebagai satu stream
+        
+        Memakai commentThreads().list(allThreadsRelatedToChannelId=...) dengan
+        halaman penuh 100 item, sehingga video dengan sedikit komentar tidak
+        menghabiskan satu request per video. Metadata video diambil secara
+        batch (50 ID per request) lewat get_videos_info.
+        """
+        comments = []
+        counter = {'api_calls': 0}
+        max_total = self.config['max_comments_per_channel']
+        pages = self.iter_comment_pages(counter, max_total, allThreadsRelatedToChannelId=channel_id,
+                                        order=self.config['comment_order'])
+        if self.config['pipeline']['prefetch']:
+            pages = self.prefetch_pages(pages)
+        
+        def prepare(response):
+            items = response['items']
+            # Metadata video untuk halaman ini, hanya ID yang belum ada di cache
+            page_video_ids = [item['snippet'].get('videoId', '') for item in items]
+            page_infos, info_calls = self.get_videos_info(page_video_ids)
+            counter['api_calls'] += info_calls
+            if self.config['archive']['enabled']:
+                for video_info in page_infos.values():
+                    self.archive_raw(f'channel_{channel_id}', {'kind': 'video', 'item': video_info})
+            return items, None, self.video_info_cache
+        
+        transformed = self.transform_pipelined(pages, max_total, prepare)
+        try:
+            for rows in transformed:
+                comments.extend(rows)
+                self.emit_rows(rows)
+                if len(comments) >= max_total:
+                    break
+        except Exception as e:
+            print(f"⚠️ Error getting channel comments: {e}")
+        finally:
+            transformed.close()
+            pages.close()
+        if len(comments) > max_total:
+            comments = comments[:max_total]
+        elif counter.get('complete') and len(comments) < max_total:
+            self.completed_videos.update(row.get('video_id') for row in comments if row.get('video_id'))
+        return comments, counter['api_calls']
+    
+    def iter_comment_pages(self, counter: Dict, max_threads: int, **filters):
+        """Generator halaman commentThreads().list untuk satu video atau channel
+        
+        Berhenti jika halaman habis atau jumlah thread sudah mencapai max_threads.
+        Jumlah request dicatat di counter['api_calls']; counter['complete'] di-set
+        jika seluruh halaman sudah terambil.
+        """
+        next_page_token = None
+        threads = 0
+        while threads < max_threads and not self.stop_event.is_set():
+            response = self.fetch_comment_page(next_page_token, min(100, max_threads - threads), **filters)
+            counter['api_calls'] += 1
+            if not response.get('items'):
+                counter['complete'] = True
+                return
+            threads += len(response['items'])
+            yield response
+            next_page_token = response.get('nextPageToken')
+            if not next_page_token:
+                counter['complete'] = True
+                return
+            # Small delay between requests
+            time.sleep(self.config['delays']['between_requests'])
+    
+    def fetch_comment_page(self, page_token: Optional[str], max_results: int, **filters) -> Dict:
+        """Ambil satu halaman commentThreads().list dan simpan ke arsip raw (jika aktif)"""
+        response = self.list_request(
+            'commentThreads',
+            part='snippet,replies' if self.config['include_replies'] else 'snippet',
+            maxResults=max_results,
+            pageToken=page_token,
+            textFormat='plainText',
+            **filters
+        )
+        if 'videoId' in filters:
+            archive_key = filters['videoId']
+        else:
+            archive_key = f"channel_{filters.get('allThreadsRelatedToChannelId', '')}"
+        self.archive_raw(archive_key, {'kind': 'commentThreads', 'params': filters,
+                                       'page_token': page_token, 'response': response})
+        return response
+    
+    def prefetch_pages(self, pages):
+        """Jalankan generator halaman di fetch thread dengan antrean terbatas
+        
+        Halaman berikutnya di-request selagi halaman saat ini diproses. Antrean
+        berukuran config['pipeline']['queue_size'] menahan fetch thread jika
+        pemrosesan tertinggal. Error dari fetch thread dilempar ulang ke pemanggil.
+        Jika batas max komentar tercapai di tengah halaman, halaman yang sudah
+        di-prefetch (maksimal satu request) tidak terpakai.
+        """
+        page_queue = queue.Queue(maxsize=max(1, int(self.config['pipeline']['queue_size'])))
+        stop_event = threading.Event()
+        finished = object()
+        
+        def put(entry) -> bool:
+            while not stop_event.is_set():
+                try:
+                    page_queue.put(entry, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def produce():
+            try:
+                for page in pages:
+                    if not put((page, None)):
+                        return
+                put((finished, None))
+            except Exception as e:
+                put((finished, e))
+            finally:
+                pages.close()
+        
+        future = self._get_fetch_executor().submit(produce)
+        try:
+            while True:
+                page, error = page_queue.get()
+                if page is finished:
+                    if error is not None:
+                        raise error
+                    return
+                yield page
+        finally:
+            stop_event.set()
+            future.result()
+    
+    def _get_fetch_executor(self) -> ThreadPoolExecutor:
+        """Thread pool untuk fetch thread; thread dipakai ulang agar service per thread tidak dibuat ulang"""
+        with self.stats_lock:
+            if self._fetch_executor is None:
+                workers = max(1, int(self.config['scheduling']['workers']))
+                self._fetch_executor = ThreadPoolExecutor(max_workers=workers + 1,
+                                                          thread_name_prefix='fetch')
+            return self._fetch_executor
+    
+    def process_thread_item(self, item: Dict, video_info: Dict, limit: int,
+                            timestamp: Optional[str] = None) -> List[Dict]:
+        """Process satu comment thread (komentar utama + replies) dengan batas jumlah baris"""
+        if limit <= 0:
+            return []
+        started = time.perf_counter()
+        comment_data = self.process_comment_item(item, video_info, timestamp)
+        self.metrics.observe('process_comment_item', time.perf_counter() - started)
+        rows = [comment_data]
+        # Process replies if enabled
+        if (self.config['include_replies'] and 
+            'replies' in item and 
+            'comments' in item['replies']):
+            for reply_item in item['replies']['comments']:
+                if len(rows) >= limit:
+                    break
+                started = time.perf_counter()
+                rows.append(self.process_reply_item(reply_item, video_info, comment_data, timestamp))
+                self.metrics.observe('process_reply_item', time.perf_counter() - started)
+            with self.stats_lock:
+                self.stats['total_replies'] += len(rows) - 1
+        return rows
+    
+    def process_comment_item(self, item: Dict, video_info: Dict, timestamp: Optional[str] = None) -> Dict:
+        """Process item komentar menjadi data yang diperlukan (timestamp = crawl_timestamp, default sekarang)"""
+        snippet = item['snippet']['topLevelComment']['snippet']
+        comment_data = {}
+        # Basic comment info
+        if self.config['attributes']['comment_id']:
+            comment_data['comment_id'] = item['snippet']['topLevelComment'].get('id', item.get('id', ''))
+        if self.config['attributes']['comment_text']:
+            comment_data['comment_text'] = self.clean_text(snippet.get('textDisplay', ''))
+        if self.config['attributes']['author_name']:
+            comment_data['author_name'] = snippet.get('authorDisplayName', '')
+        if self.config['attributes']['author_channel_id']:
+            comment_data['author_channel_id'] = snippet.get('authorChannelId', {}).get('value', '')
+        if self.config['attributes']['author_channel_url']:
+            channel_id = snippet.get('authorChannelId', {}).get('value', '')
+            comment_data['author_channel_url'] = f'https://www.youtube.com/channel/{channel_id}' if channel_id else ''
+        if self.config['attributes']['author_profile_image_url']:
+            comment_data['author_profile_image_url'] = snippet.get('authorProfileImageUrl', '')
+        if self.config['attributes']['author_is_verified']:
+            comment_data['author_is_verified'] = snippet.get('authorIsVerified', False)
+        if self.config['attributes']['author_is_channel_owner']:
+            comment_data['author_is_channel_owner'] = snippet.get('authorIsChannelOwner', False)
+        if self.config['attributes']['author_is_sponsor']:
+            comment_data['author_is_sponsor'] = snippet.get('authorIsSponsor', False)
+        if self.config['attributes']['is_liked_by_creator']:
+            comment_data['is_liked_by_creator'] = snippet.get('viewerRating', '') == 'like'
+        if self.config['attributes']['is_hearted_by_creator']:
+            comment_data['is_hearted_by_creator'] = snippet.get('viewerRating', '') == 'heart'
+        if self.config['attributes']['is_pinned']:
             comment_data['is_pinned'] = item['snippet'].get('isPinned', False)
         if self.config['attributes']['publish_date']:
             comment_data['publish_date'] = snippet.get('publishedAt', '')
@@ -924,6 +3358,8 @@ class YouTubeCommentsCrawler:
             comment_data['reply_count'] = item['snippet'].get('totalReplyCount', 0)
         if self.config['attributes']['parent_id']:
             comment_data['parent_id'] = None  # Top-level comment
+        if self.config['attributes']['thread_id']:
+            comment_data['thread_id'] = item.get('id', '') or item['snippet']['topLevelComment'].get('id', '')
         # Video info
         if self.config['attributes']['video_id']:
             comment_data['video_id'] = video_info.get('id', '')
@@ -935,30 +3371,21 @@ class YouTubeCommentsCrawler:
             comment_data['channel_id'] = video_info.get('snippet', {}).get('channelId', '')
         if self.config['attributes']['channel_title']:
             comment_data['channel_title'] = video_info.get('snippet', {}).get('channelTitle', '')
-        # Analysis attributes
-        if self.config['attributes']['word_count'] and comment_data.get('comment_text'):
-            comment_data['word_count'] = len(comment_data['comment_text'].split())
-        if self.config['attributes']['has_links'] and comment_data.get('comment_text'):
-            comment_data['has_links'] = bool(re.search(r'http[s]?://|www\.', comment_data['comment_text']))
-        if self.config['attributes']['has_mentions'] and comment_data.get('comment_text'):
-            comment_data['has_mentions'] = bool(re.search(r'@\w+', comment_data['comment_text']))
-        if (self.config['attributes']['sentiment_score'] and HAS_TEXTBLOB and comment_data.get('comment_text')):
-            try:
-                blob = TextBlob(comment_data['comment_text'])
-                comment_data['sentiment_score'] = blob.sentiment.polarity
-            except:
-                comment_data['sentiment_score'] = 0
+        self.reserve_feature_columns(comment_data)
         if self.config['attributes']['crawl_timestamp']:
-            comment_data['crawl_timestamp'] = datetime.now().isoformat()
+            comment_data['crawl_timestamp'] = timestamp or datetime.now().isoformat()
         # Comment type
         comment_data['comment_type'] = 'main_comment'
         return comment_data
     
-    def process_reply_item(self, reply_item: Dict, video_info: Dict, parent_comment: Dict) -> Dict:
+    def process_reply_item(self, reply_item: Dict, video_info: Dict, parent_comment: Dict,
+                           timestamp: Optional[str] = None) -> Dict:
         """Process reply item"""
         snippet = reply_item['snippet']
         reply_data = {}
         # Basic reply info
+        if self.config['attributes']['comment_id']:
+            reply_data['comment_id'] = reply_item.get('id', '')
         if self.config['attributes']['comment_text']:
             reply_data['comment_text'] = self.clean_text(snippet.get('textDisplay', ''))
         if self.config['attributes']['author_name']:
@@ -990,8 +3417,12 @@ class YouTubeCommentsCrawler:
             reply_data['like_count'] = snippet.get('likeCount', 0)
         if self.config['attributes']['reply_count']:
             reply_data['reply_count'] = 0  # Replies don't have replies
+        # parentId reply selalu ID komentar utama (thread) di YouTube
+        thread_id = snippet.get('parentId') or parent_comment.get('thread_id') or parent_comment.get('comment_id', '')
         if self.config['attributes']['parent_id']:
-            reply_data['parent_id'] = reply_item.get('id', '') or parent_comment.get('video_id', '')
+            reply_data['parent_id'] = thread_id
+        if self.config['attributes']['thread_id']:
+            reply_data['thread_id'] = thread_id
         reply_data['parent_author'] = parent_comment.get('author_name', '')
         reply_data['comment_type'] = 'reply'
         # Video info (same as parent)
@@ -1005,23 +3436,204 @@ class YouTubeCommentsCrawler:
             reply_data['channel_id'] = parent_comment.get('channel_id', '')
         if self.config['attributes']['channel_title']:
             reply_data['channel_title'] = parent_comment.get('channel_title', '')
-        # Analysis attributes
-        if self.config['attributes']['word_count'] and reply_data.get('comment_text'):
-            reply_data['word_count'] = len(reply_data['comment_text'].split())
-        if self.config['attributes']['has_links'] and reply_data.get('comment_text'):
-            reply_data['has_links'] = bool(re.search(r'http[s]?://|www\.', reply_data['comment_text']))
-        if self.config['attributes']['has_mentions'] and reply_data.get('comment_text'):
-            reply_data['has_mentions'] = bool(re.search(r'@\w+', reply_data['comment_text']))
-        if (self.config['attributes']['sentiment_score'] and HAS_TEXTBLOB and reply_data.get('comment_text')):
-            try:
-                blob = TextBlob(reply_data['comment_text'])
-                reply_data['sentiment_score'] = blob.sentiment.polarity
-            except:
-                reply_data['sentiment_score'] = 0
+        self.reserve_feature_columns(reply_data)
         if self.config['attributes']['crawl_timestamp']:
-            reply_data['crawl_timestamp'] = datetime.now().isoformat()
+            reply_data['crawl_timestamp'] = timestamp or datetime.now().isoformat()
         return reply_data
     
+    def reserve_feature_columns(self, row: Dict):
+        """Slot kolom fitur turunan di posisi semula (sebelum crawl_timestamp); nilainya diisi apply_batch_features"""
+        if not row.get('comment_text'):
+            return
+        attributes = self.config['attributes']
+        for attr in FEATURE_ATTRIBUTES:
+            if attributes[attr] and (attr != 'sentiment_score' or HAS_TEXTBLOB):
+                row[attr] = None
+    
+    def transform_items(self, items: List[Dict], video_info: Optional[Dict], limit: float,
+                        video_infos: Optional[Dict[str, Dict]] = None, timestamp: Optional[str] = None) -> List[Dict]:
+        """Ubah item satu halaman commentThreads menjadi maksimal limit baris, plus fitur batch
+        
+        video_info dipakai untuk semua item; jika None (mode channel/arsip),
+        info dicari per item dari video_infos berdasarkan snippet.videoId.
+        """
+        rows = []
+        for item in items:
+            if len(rows) >= limit:
+                break
+            if video_info is None:
+                video_id = item['snippet'].get('videoId', '')
+                info = (video_infos or {}).get(video_id, {'id': video_id, 'snippet': {}})
+            else:
+                info = video_info
+            rows.extend(self.process_thread_item(item, info, limit - len(rows), timestamp))
+        self.apply_batch_features(rows)
+        return rows
+    
+    def submit_transform(self, items: List[Dict], video_info: Optional[Dict], limit: float,
+                         video_infos: Optional[Dict[str, Dict]] = None) -> Future:
+        """Jadwalkan transformasi satu halaman; return Future berisi list baris
+        
+        crawl_timestamp dihitung sekali per halaman. Dengan
+        config['pipeline']['transform_workers'] > 0 halaman dikirim ke process
+        pool, sehingga transformasi (pure Python) memakai banyak core sementara
+        fetch thread tetap menunggu I/O; tanpa pool transformasi langsung
+        dijalankan di thread pemanggil.
+        """
+        timestamp = datetime.now().isoformat()
+        executor = self._get_transform_executor()
+        if executor is None:
+            future = Future()
+            try:
+                future.set_result(self.transform_items(items, video_info, limit, video_infos, timestamp))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+        if video_info is None:
+            page_ids = {item['snippet'].get('videoId', '') for item in items}
+            video_infos = {vid: info for vid, info in (video_infos or {}).items() if vid in page_ids}
+        future = Future()
+        pooled = executor.submit(_transform_page_worker, items, video_info, limit, video_infos, timestamp)
+        pooled.add_done_callback(lambda done: self._finish_pooled_transform(done, future))
+        return future
+    
+    def transform_page(self, items: List[Dict], video_info: Optional[Dict], limit: float,
+                       video_infos: Optional[Dict[str, Dict]] = None) -> List[Dict]:
+        """Transformasi satu halaman dan tunggu hasilnya (lihat submit_transform)"""
+        with self.metrics.time('transform_page'):
+            return self.submit_transform(items, video_info, limit, video_infos).result()
+    
+    def transform_pipelined(self, pages, max_total: float, prepare):
+        """Transformasi halaman dari generator pages dengan beberapa Future sekaligus; hasil berurutan
+        
+        prepare(response) -> (items, video_info, video_infos) dijalankan di
+        thread pemanggil. Dengan process pool, sampai 2 x transform_workers
+        halaman dari antrean prefetch ditransformasi bersamaan; tanpa pool
+        satu halaman per giliran seperti transform_page. Jumlah baris tiap
+        halaman pasti (1 + inline replies per thread, dipotong limit), sehingga
+        limit setiap halaman sama dengan crawl berurutan dan tidak ada halaman
+        yang dijadwalkan setelah max_total terpenuhi. Error fetch dilempar
+        setelah halaman sebelumnya selesai dikirim ke pemanggil.
+        """
+        workers = int(self.config['pipeline']['transform_workers'] or 0)
+        depth = 2 * workers if workers > 0 else 1
+        in_flight = deque()
+        planned = 0
+        error = None
+        pages_left = True
+        while True:
+            while pages_left and len(in_flight) < depth and planned < max_total:
+                try:
+                    items, video_info, video_infos = prepare(next(pages))
+                except StopIteration:
+                    pages_left = False
+                    break
+                except Exception as e:
+                    error, pages_left = e, False
+                    break
+                limit = max_total - planned
+                started = time.perf_counter()
+                future = self.submit_transform(items, video_info, limit, video_infos)
+                in_flight.append((future, time.perf_counter() - started))
+                planned += min(limit, self.page_row_count(items))
+            if not in_flight:
+                break
+            future, submit_seconds = in_flight.popleft()
+            started = time.perf_counter()
+            rows = future.result()
+            # Waktu thread pemanggil untuk halaman ini: transformasi langsung atau menunggu pool
+            self.metrics.observe('transform_page', submit_seconds + time.perf_counter() - started)
+            yield rows
+        if error is not None:
+            raise error
+    
+    def page_row_count(self, items: List[Dict]) -> int:
+        """Jumlah baris yang dihasilkan satu halaman tanpa limit (komentar utama + inline replies)"""
+        if not self.config['include_replies']:
+            return len(items)
+        return sum(1 + len(item.get('replies', {}).get('comments', [])) for item in items)
+    
+    def _finish_pooled_transform(self, done: Future, future: Future):
+        """Gabungkan metrik worker ke self.metrics, catat replies, lalu teruskan baris ke future"""
+        try:
+            rows, state = done.result()
+        except Exception as e:
+            future.set_exception(e)
+            return
+        self.metrics.merge_state(state)
+        replies = sum(1 for row in rows if row.get('comment_type') == 'reply')
+        with self.stats_lock:
+            self.stats['total_replies'] += replies
+        future.set_result(rows)
+    
+    def _get_transform_executor(self) -> Optional[ProcessPoolExecutor]:
+        """Process pool transformasi (None jika transform_workers = 0)
+        
+        Memakai start method spawn karena pool dibuat saat fetch thread sudah
+        berjalan (fork dari proses multi-thread rawan deadlock).
+        """
+        workers = int(self.config['pipeline']['transform_workers'] or 0)
+        if workers <= 0:
+            return None
+        with self.stats_lock:
+            if self._transform_executor is None:
+                self._transform_executor = ProcessPoolExecutor(
+                    max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_transform_worker, initargs=(self.config,))
+            return self._transform_executor
+    
+    def shutdown_transform_pool(self):
+        """Hentikan process pool transformasi di akhir run"""
+        if self._transform_executor is not None:
+            self._transform_executor.shutdown()
+            self._transform_executor = None
+    
+    def shutdown_fetch_pool(self):
+        """Hentikan thread pool prefetch di akhir run (dibuat ulang jika crawler dipakai lagi)"""
+        with self.stats_lock:
+            executor, self._fetch_executor = self._fetch_executor, None
+        if executor is not None:
+            executor.shutdown()
+    
+    def apply_batch_features(self, rows: List[Dict]):
+        """Hitung fitur turunan comment_text (word_count, has_links, has_mentions, language,
+        sentiment_score) untuk satu batch baris, biasanya satu halaman API"""
+        if not rows:
+            return
+        attributes = self.config['attributes']
+        started = time.perf_counter()
+        texts = [row.get('comment_text') for row in rows]
+        for row, text in zip(rows, texts):
+            if not text:
+                continue
+            if attributes['word_count']:
+                row['word_count'] = len(text.split())
+            if attributes['has_links']:
+                row['has_links'] = bool(LINK_PATTERN.search(text))
+            if attributes['has_mentions']:
+                row['has_mentions'] = bool(MENTION_PATTERN.search(text))
+        if attributes['language']:
+            with self.metrics.time('language'):
+                for row, language in zip(rows, self.get_language_identifier().predict(texts)):
+                    row['language'] = language
+        if attributes['sentiment_score'] and HAS_TEXTBLOB:
+            for row, text in zip(rows, texts):
+                if not text:
+                    continue
+                sentiment_started = time.perf_counter()
+                try:
+                    row['sentiment_score'] = _textblob.TextBlob(text).sentiment.polarity
+                except:
+                    row['sentiment_score'] = 0
+                self.metrics.observe('sentiment', time.perf_counter() - sentiment_started)
+        self.metrics.observe('batch_features', time.perf_counter() - started)
+    
+    def get_language_identifier(self) -> 'LanguageIdentifier':
+        """Model bahasa dibangun sekali per crawler saat pertama dipakai"""
+        if self._language_identifier is None:
+            self._language_identifier = LanguageIdentifier()
+        return self._language_identifier
+    
     def clean_text(self, text: str) -> str:
         """Clean text dari karakter yang tidak diinginkan"""
         if not text:
@@ -1031,72 +3643,786 @@ class YouTubeCommentsCrawler:
         text = re.sub(r'\s+', ' ', text)
         return text.strip()
     
+    def setup_row_consumers(self):
+        """Siapkan consumer baris hasil crawling sesuai config (near-duplicate, ringkasan, index thread, pencarian, change log)
+        
+        Dipanggil sebelum build_field_masks: atribut yang dibutuhkan consumer
+        (comment_id, parent_id) diaktifkan di sini agar ikut diminta dari API.
+        """
+        for feature, required in ROW_CONSUMER_ATTRIBUTES.items():
+            missing = [attr for attr in required if not self.config['attributes'][attr]]
+            if self.config[feature]['enabled'] and missing:
+                self.config['attributes'].update(dict.fromkeys(missing, True))
+                self.say(f"💡 Atribut {', '.join(missing)} diaktifkan (dibutuhkan {feature})")
+        if self.config['attributes']['near_dup_cluster']:
+            settings = self.config['near_duplicates']
+            try:
+                self.row_consumers.append(NearDuplicateDetector(
+                    settings['index'] or f"{self.output_base_filename()}_lsh.db",
+                    num_perm=settings['num_perm'], bands=settings['bands'],
+                    shingle_size=settings['shingle_size'], temporary=not settings['index'], report=self.say))
+            except Exception as e:
+                self.say(f"⚠️ Error membuka index near-duplicate: {e}")
+        if self.config['aggregates']['enabled']:
+            self.row_consumers.append(RowAggregator(self.write_table, report=self.say))
+        if self.config['threads']['enabled']:
+            self.row_consumers.append(ThreadIndex(self.write_table, report=self.say))
+        if self.config['search']['enabled']:
+            try:
+                index_path = self.config['search']['index'] or f"{self.output_base_filename()}_search.db"
+                self.row_consumers.append(SearchIndex(index_path, report=self.say))
+            except Exception as e:
+                self.say(f"⚠️ Error membuka index pencarian: {e}")
+        if self.config['changes']['enabled']:
+            try:
+                log_path = f"{self.output_base_filename()}_changes.ndjson"
+                self.row_consumers.append(ChangeTracker(self.config['changes']['index'], log_path, report=self.say))
+            except Exception as e:
+                self.say(f"⚠️ Error membuka index perubahan: {e}")
+    
+    def on_rows_produced(self, rows: List[Dict], complete_videos: List[str]):
+        """Teruskan baris baru ke semua consumer; complete_videos = video yang ter-crawl lengkap"""
+        for consumer in self.row_consumers:
+            try:
+                consumer.consume(rows, complete_videos)
+            except Exception as e:
+                self.say(f"⚠️ Error {type(consumer).__name__}: {e}")
+    
+    def close_row_consumers(self):
+        """Tutup semua consumer di akhir run"""
+        for consumer in self.row_consumers:
+            try:
+                consumer.close()
+            except Exception as e:
+                self.say(f"⚠️ Error menutup {type(consumer).__name__}: {e}")
+        self.row_consumers = []
+    
+    def setup_sink(self, kind: str = None):
+        """Buka sink output streaming (file/sqlite/spool/pipe) di belakang BufferedSink
+
+        Tanpa sink, hasil dikumpulkan di memori dan ditulis save_results() di
+        akhir run. Dengan sink, setiap halaman langsung diteruskan ke sink dan
+        self.results tidak diisi, sehingga memori tidak tumbuh dengan ukuran crawl.
+        """
+        output = self.config['output']
+        kind = output['sink'] or kind
+        if not kind or self.sink is not None:
+            return
+        base = self.output_base_filename()
+        extension = {'excel': 'xlsx', 'sqlite': 'db', 'json': 'ndjson'}.get(output['format'], output['format'])
+        default_paths = {'file': f"{base}.{extension}", 'sqlite': f"{base}.db",
+                         'spool': f"{base}_spool", 'pipe': f"{base}.pipe"}
+        if kind not in default_paths:
+            raise ValueError(f"Sink tidak dikenal: {kind}")
+        path = output['sink_path'] or default_paths[kind]
+        if kind == 'file':
+            columns = [attr for attr, enabled in self.config['attributes'].items() if enabled]
+            sink = FileSink(path, columns)
+        elif kind == 'sqlite':
+            sink = SQLiteSink(path)
+        elif kind == 'spool':
+            sink = SpoolSink(path, output['spool_max_files'])
+        else:
+            sink = PipeSink(path)
+        self.sink = BufferedSink(sink, max_rows=output['buffer_rows'], metrics=self.metrics)
+        self.say(f"🚰 Output di-stream ke {kind}: {path}")
+    
+    def emit_rows(self, rows: List[Dict], weighted: bool = False):
+        """Kirim satu batch baris ke sink (tertahan jika buffer sink penuh)
+
+        Saat sampling aktif, baris baru dikirim setelah sampling_weight
+        dihitung di akhir video (weighted=True); tanpa sampling, baris dikirim
+        per halaman (weighted=False).
+        """
+        if self.sink is None or not rows or bool(self.config['sampling']['enabled']) != weighted:
+            return
+        self.sink.write_batch(rows)
+    
+    def close_sink(self):
+        """Flush dan tutup sink di akhir run"""
+        if self.sink is None:
+            return
+        try:
+            self.sink.close()
+            self.say(f"✅ Hasil di-stream: {self.sink.path} ({self.sink.rows} baris)")
+        except Exception as e:
+            self.say(f"⚠️ Error menutup sink output: {e}")
+        self.sink = None
+    
     def show_crawling_summary(self):
         """Tampilkan ringkasan hasil crawling"""
         end_time = datetime.now()
         duration = end_time - self.stats['start_time']
         
-        print("\n" + "=" * 50)
-        print("📊 RINGKASAN HASIL CRAWLING")
-        print("=" * 50)
-        print(f"📺 Video diproses: {self.stats['processed_videos']}/{self.stats['total_videos']}")
-        print(f"💬 Total komentar: {self.stats['total_comments']}")
-        print(f"↩️ Total replies: {self.stats['total_replies']}")
-        print(f"🔄 API calls: {self.stats['api_calls']}")
-        print(f"⏱️ Durasi: {duration}")
-        print(f"📊 Rate: {self.stats['total_comments']/(duration.total_seconds()/60):.1f} komentar/menit")
+        self.say("\n" + "=" * 50)
+        self.say("📊 RINGKASAN HASIL CRAWLING")
+        self.say("=" * 50)
+        self.say(f"📺 Video diproses: {self.stats['processed_videos']}/{self.stats['total_videos']}")
+        self.say(f"💬 Total komentar: {self.stats['total_comments']}")
+        self.say(f"↩️ Total replies: {self.stats['total_replies']}")
+        self.say(f"🔄 API calls: {self.stats['api_calls']}")
+        if self.stats['retries']:
+            self.say(f"🔁 Retries: {self.stats['retries']}")
+        self.say(f"⏱️ Durasi: {duration}")
+        self.say(f"📊 Rate: {self.stats['total_comments']/(duration.total_seconds()/60):.1f} komentar/menit")
+        
+        stages = self.metrics.to_dict()['stages']
+        if stages:
+            self.say(f"📦 Data diterima: {self.metrics.counter('bytes_received')/1024:.1f} KB, "
+                     f"quota: {self.metrics.counter('quota_units'):.0f} unit")
+            masked = self.metrics.counter('bytes_received_masked')
+            if masked:
+                # Ukuran response ter-mask selalu dicatat; estimasi penghematan butuh rasio dari measure_savings
+                saved, full = self.estimated_bytes_saved()
+                estimate = (f", estimasi ±{saved/1024:.1f} KB dihemat ({saved/full:.0%} lebih kecil)" if full
+                            else " (estimasi penghematan: aktifkan api.measure_savings)")
+                self.say(f"✂️ Partial response (fields): {masked/1024:.1f} KB diterima ter-mask{estimate}")
+            self.say("⏱️ Waktu per tahap (total / p95):")
+            for stage, data in sorted(stages.items(), key=lambda x: -x[1]['total_seconds']):
+                p95 = data['p95_seconds']
+                p95_text = f"{p95*1000:.1f} ms" if p95 is not None else "-"
+                self.say(f"   • {stage}: {data['total_seconds']:.2f} s / {p95_text} ({data['count']}x)")
         
         if self.stats['errors']:
-            print(f"\n⚠️ Errors: {len(self.stats['errors'])}")
+            self.say(f"\n⚠️ Errors: {len(self.stats['errors'])}")
             for error in self.stats['errors'][:3]:  # Show first 3 errors
-                print(f"   • {error}")
+                self.say(f"   • {error}")
             if len(self.stats['errors']) > 3:
-                print(f"   ... dan {len(self.stats['errors'])-3} error lainnya")
+                self.say(f"   ... dan {len(self.stats['errors'])-3} error lainnya")
+    
+    def archive_raw(self, key: str, record: Dict):
+        """Tambahkan satu record mentah ke arsip <archive_dir>/<key>.ndjson.gz"""
+        if not self.config['archive']['enabled']:
+            return
+        archive_dir = self.config['archive']['dir'] or f"{self.output_base_filename()}_raw"
+        record = dict(record, fetched_at=datetime.now().isoformat())
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        try:
+            with self._archive_lock:
+                os.makedirs(archive_dir, exist_ok=True)
+                # Mode append menambah member gzip baru; tetap terbaca sebagai satu stream
+                with gzip.open(os.path.join(archive_dir, f"{key}.ndjson.gz"), 'at', encoding='utf-8') as f:
+                    f.write(line)
+        except Exception as e:
+            self.say(f"⚠️ Error menulis arsip raw: {e}")
+    
+    def transform_archive_file(self, path: str) -> Tuple[List[Dict], int]:
+        """Jalankan ulang transformasi untuk satu file arsip, tanpa request API"""
+        is_channel = os.path.basename(path).startswith('channel_')
+        max_total = self.config['max_comments_per_channel' if is_channel else 'max_comments_per_video']
+        video_infos = {}
+        responses = []
+        # Halaman diarsip saat di-fetch (prefetch berjalan lebih dulu), sedangkan di arsip
+        # channel info video baru ditulis setelah halamannya; kumpulkan semua info video dulu
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                record = json.loads(line)
+                if record.get('kind') == 'video':
+                    video_infos[record['item'].get('id', '')] = record['item']
+                else:
+                    responses.append(record['response'])
+        rows = []
+        pages = 0
+        for response in responses:
+            if len(rows) >= max_total:
+                break
+            pages += 1
+            rows.extend(self.transform_items(response.get('items', []), None, max_total - len(rows),
+                                             video_infos, datetime.now().isoformat()))
+        return rows, pages
+    
+    def replay_archive(self, archive_dir: str):
+        """Replay arsip raw: transformasi ulang semua file secara paralel (tanpa API call)"""
+        files = sorted(str(path) for path in Path(archive_dir).glob('*.ndjson.gz'))
+        if not files:
+            print(f"❌ Tidak ada file arsip (*.ndjson.gz) di {archive_dir}")
+            return
+        
+        print("\n♻️ REPLAY ARSIP RAW")
+        print("=" * 40)
+        print(f"📁 Arsip: {archive_dir} ({len(files)} file)")
+        self.stats['start_time'] = datetime.now()
+        self.stats['total_videos'] = len(files)
+        
+        # Arsip baru tidak ditulis saat replay
+        self.config['archive']['enabled'] = False
+        self.setup_row_consumers()
+        self.setup_sink()
+        workers = min(len(files), os.cpu_count() or 1)
+        # spawn: writer thread BufferedSink sudah berjalan (fork dari proses multi-thread rawan deadlock)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+            futures = {executor.submit(_replay_archive_file, self.config, path): path for path in files}
+            # Baris tiap file langsung dikirim ke sink begitu selesai (urutan selesai, bukan urutan file)
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    rows, pages, replies = future.result()
+                except Exception as e:
+                    print(f"❌ Error replay {path}: {e}")
+                    self.stats['errors'].append(f"Replay {path}: {str(e)}")
+                    continue
+                if self.sink is not None:
+                    self.sink.write_batch(rows)
+                else:
+                    self.results.extend(rows)
+                self.on_rows_produced(rows, [])
+                self.stats['total_comments'] += len(rows)
+                self.stats['processed_videos'] += 1
+                self.stats['total_replies'] += replies
+                print(f"✅ {os.path.basename(path)}: {len(rows)} komentar dari {pages} halaman")
+        
+        self.show_crawling_summary()
+        self.close_sink()
+        if self.results:
+            self.save_results()
+        self.close_row_consumers()
+        self.export_metrics(final=True)
+
+    def fetch_engagement(self, comment_type: str, comment_ids: List[str]) -> Dict[str, Dict]:
+        """Ambil like_count/updated_at/reply_count terbaru untuk maksimal 50 comment ID (1 request)
+
+        Komentar utama diambil lewat commentThreads().list(id=...) karena hanya resource
+        thread yang memuat totalReplyCount; reply lewat comments().list(id=...).
+        Biaya quota keduanya sama (1 unit per 50 ID).
+        """
+        service = self.get_service()
+        ids = ','.join(comment_ids)
+        engagement = {}
+        if comment_type == 'main_comment':
+            response = self.execute_request(service.commentThreads().list(
+                part='snippet', id=ids,
+                fields='items(id,snippet(totalReplyCount,topLevelComment(snippet(likeCount,updatedAt))))'))
+            for item in response.get('items', []):
+                snippet = item['snippet']['topLevelComment']['snippet']
+                engagement[item['id']] = {'like_count': snippet.get('likeCount', 0),
+                                          'updated_at': snippet.get('updatedAt', ''),
+                                          'reply_count': item['snippet'].get('totalReplyCount', 0)}
+        else:
+            response = self.execute_request(service.comments().list(
+                part='snippet', id=ids, fields='items(id,snippet(likeCount,updatedAt))'))
+            for item in response.get('items', []):
+                engagement[item['id']] = {'like_count': item['snippet'].get('likeCount', 0),
+                                          'updated_at': item['snippet'].get('updatedAt', '')}
+        return engagement
+
+    def refresh_engagement(self, store: str):
+        """Perbarui like_count, updated_at, dan reply_count di output SQLite/Parquet tanpa crawl ulang"""
+        print("\n🔄 REFRESH ENGAGEMENT")
+        print("=" * 40)
+        is_sqlite = Path(store).suffix.lower() in ['.db', '.sqlite', '.sqlite3']
+        if not is_sqlite and Path(store).suffix.lower() != '.parquet':
+            print("❌ Refresh hanya mendukung output SQLite (.db) atau Parquet (.parquet)")
+            return
+        try:
+            if is_sqlite:
+                conn = sqlite3.connect(store)
+                df = pd.read_sql_query('SELECT * FROM comments LIMIT 0', conn)
+                columns = list(df.columns)
+                if 'comment_id' in columns:
+                    select = 'comment_id, comment_type' if 'comment_type' in columns else 'comment_id'
+                    df = pd.read_sql_query(f'SELECT {select} FROM comments', conn)
+            else:
+                df = apply_output_schema(pd.read_parquet(store))
+                columns = list(df.columns)
+        except Exception as e:
+            print(f"❌ Error membaca {store}: {e}")
+            return
+        if 'comment_id' not in columns:
+            print("❌ Kolom comment_id tidak ada; crawl ulang dengan atribut comment_id aktif")
+            return
+        targets = [c for c in ['like_count', 'updated_at', 'reply_count'] if c in columns]
+
+        # Reply ID YouTube berbentuk <thread_id>.<reply_id>
+        if 'comment_type' in df.columns:
+            is_reply = df['comment_type'] == 'reply'
+        else:
+            is_reply = df['comment_id'].str.contains('.', regex=False)
+        chunks = []
+        for comment_type, ids in [('main_comment', df.loc[~is_reply, 'comment_id']),
+                                  ('reply', df.loc[is_reply, 'comment_id'])]:
+            ids = ids.dropna().drop_duplicates().tolist()
+            chunks.extend((comment_type, ids[i:i + 50]) for i in range(0, len(ids), 50))
+        total_ids = sum(len(ids) for _, ids in chunks)
+        print(f"📁 Store: {store} ({total_ids} komentar, {len(chunks)} request)")
+
+        self.stats['start_time'] = datetime.now()
+        engagement = {}
+        workers = max(1, self.config['refresh']['workers'])
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(self.fetch_engagement, comment_type, ids): ids
+                       for comment_type, ids in chunks}
+            for done, future in enumerate(as_completed(futures), 1):
+                try:
+                    engagement.update(future.result())
+                except Exception as e:
+                    print(f"❌ Error refresh: {e}")
+                    self.stats['errors'].append(f"Refresh: {str(e)}")
+                if done % 20 == 0 or done == len(chunks):
+                    print(f"📊 {done}/{len(chunks)} request selesai")
+
+        try:
+            if is_sqlite:
+                assignments = ', '.join(f'{column} = ?' for column in targets)
+                rows = [[values.get(column, 0) for column in targets] + [comment_id]
+                        for comment_id, values in engagement.items()]
+                if targets:
+                    conn.executemany(f'UPDATE comments SET {assignments} WHERE comment_id = ?', rows)
+                    conn.commit()
+                conn.close()
+            else:
+                for column in targets:
+                    refreshed = df['comment_id'].map(
+                        {comment_id: values[column] for comment_id, values in engagement.items() if column in values})
+                    refreshed = apply_output_schema(pd.DataFrame({column: refreshed}))[column]
+                    df[column] = refreshed.fillna(df[column]).astype(df[column].dtype)
+                # Tulis ke file sementara lalu rename agar store tidak rusak jika gagal di tengah
+                df.to_parquet(store + '.tmp', index=False)
+                os.replace(store + '.tmp', store)
+        except Exception as e:
+            print(f"❌ Error memperbarui {store}: {e}")
+            return
+
+        duration = datetime.now() - self.stats['start_time']
+        print(f"\n✅ {len(engagement)} komentar diperbarui ({', '.join(targets)})")
+        if total_ids - len(engagement):
+            print(f"⚠️ {total_ids - len(engagement)} komentar tidak ditemukan (dihapus/disembunyikan)")
+        print(f"🔌 API calls: {int(self.metrics.counter('api_requests'))} | ⏱️ Durasi: {duration}")
+
+    def search_comments(self, index_path: str, query: str, author: Optional[str] = None,
+                        video_id: Optional[str] = None, since: Optional[str] = None,
+                        until: Optional[str] = None, limit: int = 20) -> List[Dict]:
+        """Cari komentar di index FTS5 (sintaks query FTS5), diurutkan bm25
+        
+        author cocok dengan author_channel_id atau author_name; since/until
+        dibandingkan dengan publish_date (ISO 8601, mis. '2025-01-31').
+        """
+        conditions, params = ['comments_fts MATCH ?'], [query]
+        if author:
+            conditions.append('(c.author_channel_id = ? OR c.author_name = ?)')
+            params += [author, author]
+        if video_id:
+            conditions.append('c.video_id = ?')
+            params.append(video_id)
+        if since:
+            conditions.append('c.publish_date >= ?')
+            params.append(since)
+        if until:
+            # Tanggal saja: sertakan seluruh hari tersebut
+            conditions.append('c.publish_date <= ?')
+            params.append(until + '\uffff' if len(until) == 10 else until)
+        params.append(limit)
+        conn = sqlite3.connect(f'file:{index_path}?mode=ro', uri=True)
+        try:
+            cursor = conn.execute(f'''
+                SELECT c.comment_id, c.video_id, c.author_name, c.publish_date, c.like_count,
+                       snippet(comments_fts, 0, '[', ']', '…', 16) AS snippet,
+                       bm25(comments_fts) AS score
+                FROM comments_fts JOIN comments c ON c.rowid = comments_fts.rowid
+                WHERE {' AND '.join(conditions)}
+                ORDER BY score LIMIT ?''', params)
+            columns = [description[0] for description in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+        finally:
+            conn.close()
+    
+    def show_search_results(self, results: List[Dict], elapsed: float):
+        """Tampilkan hasil search_comments"""
+        print(f"\n🔍 {len(results)} hasil ({elapsed * 1000:.1f} ms)")
+        print("=" * 40)
+        for i, result in enumerate(results, 1):
+            print(f"{i}. {result['snippet']}")
+            print(f"   👤 {result['author_name']} | 📅 {result['publish_date']} | 👍 {result['like_count']} "
+                  f"| 📺 {result['video_id']} | 🆔 {result['comment_id']}")
+    
+    def read_output_columns(self, path: str) -> List[str]:
+        """Daftar kolom output crawler tanpa membaca seluruh isi file"""
+        suffix = Path(path).suffix.lower()
+        if suffix == '.csv':
+            return list(pd.read_csv(path, nrows=0).columns)
+        if suffix in ['.ndjson', '.jsonl']:
+            with open(path, 'r', encoding='utf-8') as f:
+                first_line = f.readline()
+            return list(json.loads(first_line)) if first_line.strip() else []
+        if suffix == '.xlsx':
+            return self.read_excel_header(path)
+        if suffix == '.parquet':
+            import pyarrow.parquet as pq
+            return pq.read_schema(path).names
+        if suffix in ['.db', '.sqlite', '.sqlite3']:
+            conn = sqlite3.connect(path)
+            try:
+                return [row[1] for row in conn.execute('PRAGMA table_info(comments)')]
+            finally:
+                conn.close()
+        raise ValueError(f"Format tidak didukung untuk merge: {path}")
+    
+    def iter_output_chunks(self, path: str, chunksize: int):
+        """Generator DataFrame per chunk dari satu output crawler (csv/ndjson/xlsx/parquet/sqlite)"""
+        suffix = Path(path).suffix.lower()
+        if suffix == '.csv':
+            yield from pd.read_csv(path, chunksize=chunksize)
+        elif suffix in ['.ndjson', '.jsonl']:
+            # Nilai dibaca apa adanya (tanpa konversi tanggal/tipe) agar sama dengan sumber aslinya
+            with pd.read_json(path, lines=True, chunksize=chunksize, dtype=False,
+                              convert_dates=False, keep_default_dates=False) as reader:
+                yield from reader
+        elif suffix == '.xlsx':
+            header = self.read_excel_header(path)
+            rows = []
+            for values in self.iter_xlsx_rows(path, min_row=2, max_col=len(header)):
+                rows.append(values)
+                if len(rows) >= chunksize:
+                    yield pd.DataFrame(rows, columns=header)
+                    rows = []
+            if rows:
+                yield pd.DataFrame(rows, columns=header)
+        elif suffix == '.parquet':
+            import pyarrow.parquet as pq
+            for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+                yield batch.to_pandas()
+        elif suffix in ['.db', '.sqlite', '.sqlite3']:
+            conn = sqlite3.connect(path)
+            try:
+                yield from pd.read_sql_query('SELECT * FROM comments', conn, chunksize=chunksize)
+            finally:
+                conn.close()
+        else:
+            raise ValueError(f"Format tidak didukung untuk merge: {path}")
+    
+    def load_output(self, path: str, columns: Optional[List[str]] = None) -> 'pd.DataFrame':
+        """Baca output crawler (format apa pun) sebagai DataFrame bertipe OUTPUT_SCHEMA
+        
+        Dibaca per chunk (config['merge']['chunksize']) dan setiap chunk
+        langsung dikonversi, sehingga memori puncak mengikuti hasil bertipe,
+        bukan kolom object/string dari file teks.
+        """
+        frames = []
+        for chunk in self.iter_output_chunks(path, self.config['merge']['chunksize']):
+            if columns:
+                chunk = chunk[[column for column in columns if column in chunk.columns]]
+            frames.append(apply_output_schema(chunk))
+        return concat_typed(frames)
+    
+    def merge_keys(self, chunk: 'pd.DataFrame') -> 'pd.Series':
+        """Kunci dedupe per baris: comment_id, atau hash isi komentar untuk output lama tanpa comment_id"""
+        fallback_columns = [c for c in ['video_id', 'author_channel_id', 'author_name', 'publish_date', 'comment_text']
+                            if c in chunk.columns]
+        values = format_output_datetimes(chunk[fallback_columns].copy()).astype(str)
+        fallback = 'h' + pd.util.hash_pandas_object(values, index=False).astype(str)
+        if 'comment_id' not in chunk.columns:
+            return fallback
+        ids = chunk['comment_id'].astype('string')
+        return ids.where(ids.notna() & (ids != ''), fallback).astype(str)
+    
+    def merge_outputs(self, inputs: List[str], output: str):
+        """Gabungkan banyak output crawler menjadi satu dataset secara streaming
+        
+        Setiap file dibaca per chunk, baris yang comment_id-nya sudah pernah
+        ditulis dibuang lewat index SQLite di disk (bukan set di memori), lalu
+        chunk langsung ditulis ke output. File diproses dari yang terbaru
+        sehingga nilai engagement terbaru yang disimpan.
+        """
+        print("\n🧩 MERGE OUTPUT")
+        print("=" * 40)
+        files = []
+        for pattern in inputs:
+            matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+            files.extend(path for path in matches if path not in files)
+        output_path = os.path.abspath(output)
+        files = [path for path in files if os.path.abspath(path) != output_path]
+        missing = [path for path in files if not os.path.exists(path)]
+        if missing:
+            print(f"❌ File tidak ditemukan: {', '.join(missing)}")
+            return
+        if not files:
+            print("❌ Tidak ada file input untuk digabung!")
+            return
+        files.sort(key=os.path.getmtime, reverse=True)
+        
+        columns = []
+        for path in files:
+            try:
+                for column in self.read_output_columns(path):
+                    if column not in columns:
+                        columns.append(column)
+            except Exception as e:
+                print(f"❌ Error membaca header {path}: {e}")
+                return
+        print(f"📁 {len(files)} file input, {len(columns)} kolom -> {output}")
+        
+        started = time.perf_counter()
+        chunksize = self.config['merge']['chunksize']
+        seen_path = output + '.seen.db'
+        if os.path.exists(seen_path):
+            os.remove(seen_path)
+        seen = sqlite3.connect(seen_path)
+        seen.execute('PRAGMA cache_size = -65536')
+        seen.execute('PRAGMA synchronous = OFF')
+        seen.execute('PRAGMA journal_mode = OFF')
+        seen.execute('CREATE TABLE seen (key TEXT PRIMARY KEY) WITHOUT ROWID')
+        total_read = 0
+        writer = None
+        try:
+            writer = MergeWriter(output, columns)
+            for path in files:
+                file_read, file_written = 0, 0
+                for chunk in self.iter_output_chunks(path, chunksize):
+                    keys = self.merge_keys(chunk)
+                    unique = ~keys.duplicated()
+                    chunk, keys = chunk[unique.values], keys[unique]
+                    existing = set()
+                    key_list = keys.tolist()
+                    for i in range(0, len(key_list), 500):
+                        part = key_list[i:i + 500]
+                        query = f"SELECT key FROM seen WHERE key IN ({','.join('?' * len(part))})"
+                        existing.update(key for (key,) in seen.execute(query, part))
+                    new = ~keys.isin(existing)
+                    seen.executemany('INSERT INTO seen VALUES (?)', [(key,) for key in keys[new]])
+                    writer.write(chunk[new.values])
+                    file_read += len(unique)
+                    file_written += int(new.sum())
+                total_read += file_read
+                print(f"✅ {os.path.basename(path)}: {file_read} baris, {file_written} baru")
+            writer.close()
+        except Exception as e:
+            print(f"❌ Error merge: {e}")
+            # Jangan tinggalkan output setengah jadi
+            if writer is not None:
+                try:
+                    writer.close()
+                except Exception:
+                    pass
+                if os.path.exists(output):
+                    os.remove(output)
+            return
+        finally:
+            seen.close()
+            os.remove(seen_path)
+        
+        print(f"\n📊 Dibaca: {total_read} | Duplikat dibuang: {total_read - writer.rows} | "
+              f"Ditulis: {writer.rows} -> {output}")
+        print(f"⏱️ Durasi: {time.perf_counter() - started:.1f} detik")
+    
+    def load_config_file(self, path: str):
+        """Gabungkan konfigurasi dari file JSON (mis. <output>_config.json) ke config aktif"""
+        with open(path, 'r', encoding='utf-8') as f:
+            self.update_config(json.load(f))
+    
+    def update_config(self, overrides: Dict):
+        """Gabungkan overrides ke config aktif (dict bersarang digabung per key)"""
+        def merge(target: Dict, source: Dict):
+            for key, value in source.items():
+                if isinstance(value, dict) and isinstance(target.get(key), dict):
+                    merge(target[key], value)
+                else:
+                    target[key] = value
+        merge(self.config, overrides)
+    
+    def output_base_filename(self) -> str:
+        """Nama dasar file output untuk run ini (timestamp ditetapkan sekali per run)"""
+        if self._base_filename is None:
+            prefix = self.config['output']['filename_prefix']
+            if self.config['output']['include_timestamp']:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                self._base_filename = f"{prefix}_{timestamp}"
+            else:
+                self._base_filename = prefix
+        return self._base_filename
+    
+    def export_metrics(self, final: bool = False):
+        """Tulis metrik ke <output>_metrics.prom (berkala) dan <output>_metrics.json (akhir run)"""
+        if not self.config['metrics']['export']:
+            return
+        now = time.time()
+        if not final and now - self._metrics_exported_at < self.config['metrics']['interval']:
+            return
+        self._metrics_exported_at = now
+        base_filename = self.output_base_filename()
+        try:
+            # Tulis ke file sementara lalu rename agar scraper tidak membaca file setengah jadi
+            prom_filename = f"{base_filename}_metrics.prom"
+            with open(prom_filename + '.tmp', 'w', encoding='utf-8') as f:
+                f.write(self.metrics.to_prometheus())
+            os.replace(prom_filename + '.tmp', prom_filename)
+            if final:
+                report = {
+                    'run': base_filename,
+                    'finished_at': datetime.now().isoformat(),
+                    'stats': {k: (v.isoformat() if isinstance(v, datetime) else v)
+                              for k, v in self.stats.items()},
+                    'metrics': self.metrics.to_dict()
+                }
+                with open(f"{base_filename}_metrics.json", 'w', encoding='utf-8') as f:
+                    json.dump(report, f, indent=2, default=str)
+                self.say(f"📈 Metrik disimpan: {base_filename}_metrics.json, {prom_filename}")
+        except Exception as e:
+            self.say(f"⚠️ Error menyimpan metrik: {e}")
+    
+    def run_profiled(self, target, *args):
+        """Jalankan target di bawah cProfile + tracemalloc dan tulis laporan profil
+        
+        cProfile hanya mengukur thread yang mengaktifkannya, sehingga selama
+        profiling crawling dijalankan serial (1 worker, tanpa prefetch dan tanpa
+        process pool transformasi) agar
+        semua tahap transformasi terukur. Hasil ditulis ke <output>_profile.pstats
+        dan <output>_profile.txt.
+        """
+        import cProfile
+        import tracemalloc
+        
+        self.config['scheduling']['workers'] = 1
+        self.config['pipeline']['prefetch'] = False
+        self.config['pipeline']['transform_workers'] = 0
+        print("🔬 Mode profiling aktif (crawling serial: 1 worker, tanpa prefetch)")
+        
+        profiler = cProfile.Profile()
+        tracemalloc.start(self.config['profiling']['traceback_depth'])
+        profiler.enable()
+        try:
+            return target(*args)
+        finally:
+            profiler.disable()
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            self.write_profile_report(profiler, snapshot, peak)
+    
+    def write_profile_report(self, profiler, snapshot, peak_bytes: int):
+        """Tulis file pstats dan ringkasan hot function + lokasi alokasi teratas"""
+        import io
+        import pstats
+        
+        base_filename = self.output_base_filename()
+        top_n = self.config['profiling']['top_n']
+        try:
+            pstats_filename = f"{base_filename}_profile.pstats"
+            profiler.dump_stats(pstats_filename)
+            
+            stream = io.StringIO()
+            stats = pstats.Stats(profiler, stream=stream)
+            stats.strip_dirs()
+            
+            stream.write("=== FOKUS: TAHAP TRANSFORMASI ===\n")
+            focus = {
+                'process_comment_item': lambda f, n: n == 'process_comment_item',
+                'process_reply_item': lambda f, n: n == 'process_reply_item',
+                'clean_text': lambda f, n: n == 'clean_text',
+                'apply_batch_features': lambda f, n: n == 'apply_batch_features',
+                'LanguageIdentifier': lambda f, n: n == 'predict' and f == 'youtube_comments_crawler.py',
+                'TextBlob sentiment': lambda f, n: n == 'sentiment' and 'blob' in f,
+                'pd.DataFrame()': lambda f, n: n == '__init__' and f == 'frame.py',
+                'save_results': lambda f, n: n == 'save_results',
+            }
+            for label, matches in focus.items():
+                calls, cumulative = 0, 0.0
+                for (filename, _, name), (_, ncalls, _, cumtime, _) in stats.stats.items():
+                    if matches(filename, name):
+                        calls += ncalls
+                        cumulative += cumtime
+                stream.write(f"{label:<24} {calls:>10} calls {cumulative:>10.3f} s kumulatif\n")
+            
+            stream.write(f"\n=== TOP {top_n} FUNGSI (tottime) ===\n")
+            stats.sort_stats('tottime').print_stats(top_n)
+            stream.write(f"\n=== TOP {top_n} FUNGSI (cumulative) ===\n")
+            stats.sort_stats('cumulative').print_stats(top_n)
+            
+            stream.write(f"\n=== TOP {top_n} LOKASI ALOKASI (tracemalloc) ===\n")
+            stream.write(f"Peak traced memory: {peak_bytes / (1024 * 1024):.1f} MB\n")
+            for stat in snapshot.statistics('lineno')[:top_n]:
+                frame = stat.traceback[0]
+                stream.write(f"{stat.size / 1024:>10.1f} KB {stat.count:>9} blok  "
+                             f"{frame.filename}:{frame.lineno}\n")
+            
+            report_filename = f"{base_filename}_profile.txt"
+            with open(report_filename, 'w', encoding='utf-8') as f:
+                f.write(stream.getvalue())
+            print(f"🔬 Profil disimpan: {pstats_filename}, {report_filename}")
+        except Exception as e:
+            print(f"⚠️ Error menyimpan profil: {e}")
+    
+    def write_table(self, df: 'pd.DataFrame', table: str) -> str:
+        """Tulis DataFrame sesuai format output; tabel selain 'comments' ditulis di samping output utama
+        
+        Untuk SQLite semua tabel masuk ke file .db yang sama, format lain memakai
+        file <output>_<table>.<ext>. Return nama file yang ditulis.
+        """
+        output_format = self.config['output']['format']
+        base_filename = self.output_base_filename()
+        if table != 'comments' and output_format != 'sqlite':
+            base_filename = f"{base_filename}_{table}"
+        
+        if output_format == 'excel':
+            filename = f"{base_filename}.xlsx"
+            df.to_excel(filename, index=False, engine='openpyxl')
+            
+        elif output_format == 'csv':
+            filename = f"{base_filename}.csv"
+            df.to_csv(filename, index=False, encoding='utf-8')
+            
+        elif output_format == 'json':
+            filename = f"{base_filename}.json"
+            df.to_json(filename, orient='records', indent=2, force_ascii=False)
+            
+        elif output_format == 'ndjson':
+            filename = f"{base_filename}.ndjson"
+            df.to_json(filename, orient='records', lines=True, force_ascii=False)
+            
+        elif output_format == 'sqlite':
+            filename = f"{base_filename}.db"
+            conn = sqlite3.connect(filename)
+            try:
+                df.to_sql(table, conn, if_exists='replace', index=False)
+                if table == 'comments' and 'comment_id' in df.columns:
+                    conn.execute('CREATE INDEX IF NOT EXISTS idx_comments_comment_id ON comments (comment_id)')
+                conn.commit()
+            finally:
+                conn.close()
+            
+        elif output_format == 'parquet':
+            filename = f"{base_filename}.parquet"
+            df.to_parquet(filename, index=False)
+        return filename
+    
+    def build_dataframe(self, rows: List[Dict], typed: bool = True, batch_size: int = 50000) -> 'pd.DataFrame':
+        """DataFrame dari list baris; typed=True dikonversi ke OUTPUT_SCHEMA per batch
+        
+        Setiap batch langsung dikonversi sehingga kolom object besar tidak
+        pernah ada untuk seluruh hasil sekaligus.
+        """
+        if not typed:
+            return pd.DataFrame(rows)
+        return concat_typed([apply_output_schema(pd.DataFrame(rows[i:i + batch_size]))
+                             for i in range(0, len(rows), batch_size)])
     
     def save_results(self):
         """Simpan hasil crawling ke file"""
         if not self.results:
-            print("❌ Tidak ada data untuk disimpan!")
+            self.say("❌ Tidak ada data untuk disimpan!")
             return
         
-        # Generate filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        prefix = self.config['output']['filename_prefix']
+        base_filename = self.output_base_filename()
+        started = time.perf_counter()
         
-        if self.config['output']['include_timestamp']:
-            base_filename = f"{prefix}_{timestamp}"
-        else:
-            base_filename = prefix
-        
-        # Create DataFrame
-        df = pd.DataFrame(self.results)
+        # Create DataFrame (Parquet dengan skema bertipe)
+        df = self.build_dataframe(self.results, typed=self.config['output']['format'] == 'parquet')
         
         try:
-            if self.config['output']['format'] == 'excel':
-                filename = f"{base_filename}.xlsx"
-                df.to_excel(filename, index=False, engine='openpyxl')
-                
-            elif self.config['output']['format'] == 'csv':
-                filename = f"{base_filename}.csv"
-                df.to_csv(filename, index=False, encoding='utf-8')
-                
-            elif self.config['output']['format'] == 'json':
-                filename = f"{base_filename}.json"
-                df.to_json(filename, orient='records', indent=2, force_ascii=False)
+            filename = self.write_table(df, 'comments')
+            self.metrics.observe('sink_write', time.perf_counter() - started)
             
-            print(f"\n✅ Hasil berhasil disimpan: {filename}")
-            print(f"📊 Total records: {len(df)}")
-            print(f"📋 Columns: {len(df.columns)}")
+            self.say(f"\n✅ Hasil berhasil disimpan: {filename}")
+            self.say(f"📊 Total records: {len(df)}")
+            self.say(f"📋 Columns: {len(df.columns)}")
             
             # Save config if enabled
             if self.config['output']['save_config']:
                 config_filename = f"{base_filename}_config.json"
                 with open(config_filename, 'w') as f:
                     json.dump(self.config, f, indent=2)
-                print(f"⚙️ Konfigurasi disimpan: {config_filename}")
+                self.say(f"⚙️ Konfigurasi disimpan: {config_filename}")
                 
         except Exception as e:
-            print(f"❌ Error menyimpan file: {e}")
+            self.say(f"❌ Error menyimpan file: {e}")
     
     def run_interactive(self):
         """Jalankan mode interaktif"""
@@ -1199,6 +4525,90 @@ class YouTubeCommentsCrawler:
             print(f"\n❌ Unexpected error: {e}")
 
 
+def _replay_archive_file(config: Dict, path: str) -> Tuple[List[Dict], int, int]:
+    """Worker process untuk replay satu file arsip"""
+    crawler = YouTubeCommentsCrawler()
+    crawler.config = config
+    rows, pages = crawler.transform_archive_file(path)
+    return rows, pages, crawler.stats['total_replies']
+
+
+_transform_crawler = None
+
+
+def _init_transform_worker(config: Dict):
+    """Initializer process pool transformasi: satu crawler (tanpa service) per proses"""
+    global _transform_crawler
+    _transform_crawler = YouTubeCommentsCrawler()
+    _transform_crawler.config = config
+
+
+def _transform_page_worker(items: List[Dict], video_info: Optional[Dict], limit: float,
+                           video_infos: Optional[Dict[str, Dict]], timestamp: str) -> Tuple[List[Dict], Dict]:
+    """Worker process untuk transformasi satu halaman commentThreads
+
+    Return baris beserta metrik tahap halaman ini (process_comment_item,
+    sentiment, ...) agar bisa digabung ke CrawlMetrics proses induk.
+    """
+    rows = _transform_crawler.transform_items(items, video_info, limit, video_infos, timestamp)
+    return rows, _transform_crawler.metrics.pop_state()
+
+
+# Default untuk pemakaian sebagai library: tanpa file samping, pesan progres ke logging (bukan stdout)
+LIBRARY_DEFAULTS = {
+    'verbose': False,
+    'aggregates': {'enabled': False},
+    'threads': {'enabled': False},
+    'metrics': {'export': False},
+    'output': {'save_config': False},
+}
+
+
+def iter_comments(video_ids: List[str], api_key: Optional[str] = None, as_frame: bool = False, **options):
+    """Stream komentar beberapa video sebagai batch baris, tanpa menu interaktif
+    
+    options adalah override config (key level atas dari load_default_config),
+    mis. max_comments_per_video=500, include_replies=False,
+    attributes={'comment_id': True}, scheduling={'workers': 4}. Tanpa api_key,
+    key diambil dari YOUTUBE_API_KEY atau file konfigurasi (tanpa validasi).
+    
+        for batch in iter_comments(['dQw4w9WgXcQ'], max_comments_per_video=1000):
+            store.insert_many(batch)
+    """
+    crawler = YouTubeCommentsCrawler()
+    unknown = sorted(set(options) - set(crawler.config))
+    if unknown:
+        raise TypeError(f"Opsi tidak dikenal: {', '.join(unknown)}")
+    crawler.update_config(LIBRARY_DEFAULTS)
+    crawler.update_config(options)
+    if api_key:
+        crawler.api_key = api_key
+        crawler.youtube_service = crawler.build_service(api_key)
+    elif not crawler.setup_api_key_batch(validate=False):
+        raise ValueError("API key tidak ditemukan (argumen api_key, YOUTUBE_API_KEY, atau file konfigurasi)")
+    yield from crawler.iter_comments(video_ids, as_frame=as_frame)
+
+
+async def aiter_comments(video_ids: List[str], api_key: Optional[str] = None, as_frame: bool = False, **options):
+    """Varian async iter_comments: crawl berjalan di thread, batch diambil tanpa memblok event loop
+    
+        async for batch in aiter_comments(video_ids, api_key=KEY):
+            await store.insert_many(batch)
+    """
+    import asyncio
+    loop = asyncio.get_running_loop()
+    batches = iter_comments(video_ids, api_key, as_frame, **options)
+    finished = object()
+    try:
+        while True:
+            batch = await loop.run_in_executor(None, next, batches, finished)
+            if batch is finished:
+                return
+            yield batch
+    finally:
+        await loop.run_in_executor(None, batches.close)
+
+
 def main():
     """Main function"""
     parser = argparse.ArgumentParser(
@@ -1208,6 +4618,24 @@ def main():
 Examples:
   python youtube_comments_crawler.py
   python youtube_comments_crawler.py --api-key YOUR_API_KEY
+  python youtube_comments_crawler.py --channel https://www.youtube.com/@NamaChannel
+  python youtube_comments_crawler.py --input youtube_urls_template.xlsx
+  python youtube_comments_crawler.py --input youtube_urls_template.xlsx --profile
+  python youtube_comments_crawler.py --input youtube_urls_template.xlsx --archive
+  python youtube_comments_crawler.py --replay youtube_comments_20250730_120000_raw --config my_config.json
+  python youtube_comments_crawler.py --refresh youtube_comments_20250730_120000.db
+  python youtube_comments_crawler.py --input youtube_urls_template.xlsx --track-changes
+  python youtube_comments_crawler.py --input youtube_urls_template.xlsx --aggregates --threads
+  python youtube_comments_crawler.py --input youtube_urls_template.xlsx --time-budget 30 --quota-budget 2000
+  python youtube_comments_crawler.py --resume youtube_comments_20250730_120000_resume.json --time-budget 30
+  python youtube_comments_crawler.py --input youtube_urls_template.xlsx --sample 0.05 --sample-comments 20000
+  python youtube_comments_crawler.py --input live_videos.txt --watch --watch-duration 120 --config watch.json
+  python youtube_comments_crawler.py --input youtube_urls_template.xlsx --sink sqlite --sink-path comments.db
+  python youtube_comments_crawler.py --input youtube_urls_template.xlsx --sink spool --sink-path spool_dir
+  python youtube_comments_crawler.py --input youtube_urls_template.xlsx --transform-workers 4
+  python youtube_comments_crawler.py --input youtube_urls_template.xlsx --search-index comments_search.db
+  python youtube_comments_crawler.py --search "lagu AND enak" --search-index comments_search.db --since 2025-01-01
+  python youtube_comments_crawler.py --merge "youtube_comments_*.csv" youtube_comments_*.ndjson --merge-output all_comments.parquet
   
 Environment Variables:
   YOUTUBE_API_KEY    YouTube Data API v3 key
@@ -1219,6 +4647,172 @@ Environment Variables:
         help='YouTube Data API v3 key'
     )
     
+    parser.add_argument(
+        '--channel',
+        help='Crawl seluruh komentar channel (URL, @handle, atau channel ID) tanpa menu interaktif'
+    )
+    
+    parser.add_argument(
+        '--input',
+        help='File daftar URL video (.xlsx/.xls/.csv/.txt) untuk crawling tanpa menu interaktif'
+    )
+    
+    parser.add_argument(
+        '--time-budget',
+        type=float,
+        metavar='MINUTES',
+        help='Batas waktu crawl; halaman diambil bergiliran lintas video dan token resume disimpan saat habis'
+    )
+    
+    parser.add_argument(
+        '--quota-budget',
+        type=int,
+        metavar='UNITS',
+        help='Batas quota unit crawl (mode bergiliran yang sama dengan --time-budget)'
+    )
+    
+    parser.add_argument(
+        '--policy',
+        choices=['round_robin', 'weighted'],
+        help='Kebijakan giliran mode budget: round_robin (default) atau weighted (sebanding commentCount)'
+    )
+    
+    parser.add_argument(
+        '--sample',
+        type=float,
+        metavar='FRACTION',
+        help='Mode sampling: ambil fraksi video per strata commentCount, tambah kolom sampling_weight'
+    )
+    
+    parser.add_argument(
+        '--sample-comments',
+        type=int,
+        metavar='N',
+        help='Total komentar sampel, dibagi ke video terpilih sebanding commentCount (video terpotong ditandai sample_truncated)'
+    )
+    
+    parser.add_argument(
+        '--resume',
+        metavar='FILE',
+        help='Lanjutkan crawl budget dari file resume (<output>_resume.json); tanpa --input memakai daftar video di file'
+    )
+    
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='Pantau komentar baru video di --input secara terus-menerus (interval adaptif, laju quota global)'
+    )
+    
+    parser.add_argument(
+        '--watch-duration',
+        type=float,
+        metavar='MINUTES',
+        help='Lama --watch berjalan (default sampai Ctrl+C)'
+    )
+    
+    parser.add_argument(
+        '--sink',
+        choices=['file', 'sqlite', 'spool', 'pipe'],
+        help='Stream hasil per halaman ke sink (file, tabel SQLite, folder spool NDJSON, atau named pipe)'
+    )
+    
+    parser.add_argument(
+        '--sink-path',
+        metavar='PATH',
+        help='Lokasi sink (default <output>.<ext>, <output>.db, <output>_spool, atau <output>.pipe)'
+    )
+    
+    parser.add_argument(
+        '--transform-workers',
+        type=int,
+        metavar='N',
+        help='Ubah halaman mentah menjadi baris di N proses (beberapa halaman dari antrean prefetch sekaligus)'
+    )
+    
+    parser.add_argument(
+        '--archive',
+        action='store_true',
+        help='Simpan setiap halaman API mentah (NDJSON gzip) di folder <output>_raw'
+    )
+    
+    parser.add_argument(
+        '--track-changes',
+        action='store_true',
+        help='Catat komentar baru/diedit/dihapus sejak crawl sebelumnya ke <output>_changes.ndjson'
+    )
+    
+    parser.add_argument(
+        '--aggregates',
+        action='store_true',
+        help='Tulis ringkasan per author dan per video (<output>_author_summary / <output>_video_summary)'
+    )
+    
+    parser.add_argument(
+        '--threads',
+        action='store_true',
+        help='Tulis index thread CSR (parent -> children, depth, thread_size) ke <output>_thread_index'
+    )
+    
+    parser.add_argument(
+        '--search-index',
+        metavar='FILE',
+        help='File index full-text (SQLite FTS5): dibangun/diperbarui saat crawling, dibaca oleh --search'
+    )
+    
+    parser.add_argument(
+        '--search',
+        metavar='QUERY',
+        help='Cari komentar di --search-index (sintaks FTS5, urut relevansi bm25)'
+    )
+    
+    parser.add_argument('--author', help='Filter --search: author_channel_id atau nama author')
+    parser.add_argument('--video-id', help='Filter --search: video ID')
+    parser.add_argument('--since', help='Filter --search: publish_date >= tanggal (YYYY-MM-DD)')
+    parser.add_argument('--until', help='Filter --search: publish_date <= tanggal (YYYY-MM-DD)')
+    parser.add_argument('--limit', type=int, default=20, help='Jumlah hasil --search (default 20)')
+    
+    parser.add_argument(
+        '--merge',
+        nargs='+',
+        metavar='FILE',
+        help='Gabungkan banyak output (csv/ndjson/xlsx/parquet/db, boleh pola glob) tanpa duplikat comment_id'
+    )
+    
+    parser.add_argument(
+        '--merge-output',
+        metavar='FILE',
+        help='File hasil --merge; format dari ekstensi (.csv/.ndjson/.xlsx/.parquet/.db)'
+    )
+    
+    parser.add_argument(
+        '--replay',
+        metavar='ARCHIVE_DIR',
+        help='Transformasi ulang arsip raw tanpa request API (pakai --config untuk atribut/format baru)'
+    )
+    
+    parser.add_argument(
+        '--refresh',
+        metavar='STORE',
+        help='Perbarui like_count, updated_at, dan reply_count di output SQLite/Parquet (50 ID per request)'
+    )
+    
+    parser.add_argument(
+        '--config',
+        help='File konfigurasi JSON (mis. <output>_config.json) yang menimpa konfigurasi default'
+    )
+    
+    parser.add_argument(
+        '--skip-validation',
+        action='store_true',
+        help='Mode batch: pakai API key tanpa test request validasi'
+    )
+    
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Jalankan crawling di bawah cProfile + tracemalloc dan simpan laporan profil di samping output'
+    )
+    
     parser.add_argument(
         '--version',
         action='version',
@@ -1234,8 +4828,105 @@ Environment Variables:
     if args.api_key:
         os.environ['YOUTUBE_API_KEY'] = args.api_key
     
+    if args.config:
+        crawler.load_config_file(args.config)
+    if args.archive:
+        crawler.config['archive']['enabled'] = True
+    if args.track_changes:
+        crawler.config['changes']['enabled'] = True
+    if args.aggregates:
+        crawler.config['aggregates']['enabled'] = True
+    if args.threads:
+        crawler.config['threads']['enabled'] = True
+    if args.time_budget:
+        crawler.config['budget']['seconds'] = args.time_budget * 60
+    if args.quota_budget:
+        crawler.config['budget']['quota_units'] = args.quota_budget
+    if args.policy:
+        crawler.config['budget']['policy'] = args.policy
+    if args.resume:
+        crawler.config['budget']['resume_file'] = args.resume
+    if args.watch_duration:
+        crawler.config['watch']['duration'] = args.watch_duration * 60
+    if args.sink:
+        crawler.config['output']['sink'] = args.sink
+    if args.sink_path:
+        crawler.config['output']['sink_path'] = args.sink_path
+    if args.transform_workers is not None:
+        crawler.config['pipeline']['transform_workers'] = args.transform_workers
+    if args.sample or args.sample_comments:
+        crawler.config['sampling']['enabled'] = True
+        if args.sample:
+            crawler.config['sampling']['video_fraction'] = args.sample
+        if args.sample_comments:
+            crawler.config['sampling']['comments'] = args.sample_comments
+    if args.search_index and not args.search:
+        crawler.config['search'].update(enabled=True, index=args.search_index)
+    
+    def run(target, *target_args):
+        if args.profile:
+            return crawler.run_profiled(target, *target_args)
+        return target(*target_args)
+    
+    # Replay arsip raw (tanpa API key, tanpa request)
+    if args.replay:
+        run(crawler.replay_archive, args.replay)
+        return
+    
+    # Gabungkan output sebelumnya (tanpa API key)
+    if args.merge:
+        if not args.merge_output:
+            parser.error('--merge membutuhkan --merge-output FILE')
+        run(crawler.merge_outputs, args.merge, args.merge_output)
+        return
+    
+    # Pencarian full-text di index (tanpa API key)
+    if args.search:
+        index_path = args.search_index or crawler.config['search']['index']
+        if not index_path or not os.path.exists(index_path):
+            print("❌ Index pencarian tidak ditemukan; gunakan --search-index FILE")
+            sys.exit(1)
+        started = time.perf_counter()
+        try:
+            results = crawler.search_comments(index_path, args.search, author=args.author, video_id=args.video_id,
+                                              since=args.since, until=args.until, limit=args.limit)
+        except sqlite3.Error as e:
+            print(f"❌ Query pencarian tidak valid: {e}")
+            sys.exit(1)
+        crawler.show_search_results(results, time.perf_counter() - started)
+        return
+    
+    # Refresh engagement di output sebelumnya
+    if args.refresh:
+        if not crawler.setup_api_key_batch(validate=not args.skip_validation):
+            sys.exit(1)
+        run(crawler.refresh_engagement, args.refresh)
+        return
+    
+    # Channel mode (batch, tanpa menu interaktif)
+    if args.channel:
+        if not crawler.setup_api_key_batch(validate=not args.skip_validation):
+            sys.exit(1)
+        run(crawler.start_channel_crawling, args.channel)
+        return
+    
+    if args.watch and not args.input:
+        parser.error('--watch membutuhkan --input FILE')
+    
+    # Batch mode dari file daftar URL (atau daftar video di file resume)
+    if args.input or args.resume:
+        if args.input:
+            video_urls = crawler.load_urls_from_file(args.input)
+        else:
+            video_urls = [f'https://www.youtube.com/watch?v={video_id}'
+                          for video_id in crawler.load_resume_state(args.resume)]
+        if not crawler.setup_api_key_batch(validate=not args.skip_validation):
+            sys.exit(1)
+        run(crawler.watch_videos if args.watch else crawler.start_crawling, video_urls)
+        return
+    
     # Run interactive mode
-    crawler.run_interactive()
+    run(crawler.run_interactive)
 
 
 if __name__ == "__main__":